@@ -11,24 +11,21 @@ This guide is responsive and includes hands-on examples that you can run to see
 import sys
 import os
 
+# Buffered rendering, output modes and the section cache are shared by every
+# CommandLine guide (guide_sections.py at the repository root)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir))
+from guide_sections import (is_plain_output, render_section, reset_section_timings,
+                            report_section_timings, failed_sections, parse_guide_args)
+
 def print_section_header(title, char="=", width=80):
     """Print a formatted section header."""
-    print("\n" + char * width)
-    print(f" {title} ".center(width, char))
-    print(char * width)
+    line = char * width
+    print(f"\n{line}\n{f' {title} '.center(width, char)}\n{line}")
 
 def print_subsection_header(title, char="-", width=60):
     """Print a formatted subsection header."""
-    print("\n" + char * width)
-    print(f" {title} ")
-    print(char * width)
-
-def run_example(example_func):
-    """Run an example function and handle any errors."""
-    try:
-        example_func()
-    except Exception as e:
-        print(f"Error running example: {e}")
+    line = char * width
+    print(f"\n{line}\n {title} \n{line}")
 
 def pause_for_user():
     """Pause execution for user to review output."""
@@ -768,9 +765,9 @@ def common_pitfalls():
 # MAIN EXECUTION AND MENU SYSTEM
 # =============================================================================
 
-def show_menu():
-    """Display the main menu."""
-    menu_items = [
+def menu_entries():
+    """Return the (key, title, function) entries of the main menu."""
+    return [
         ("1", "Dictionary Basics", dictionary_basics),
         ("2", "Creation Methods", dictionary_creation_methods),
         ("3", "Basic Operations", basic_operations),
@@ -786,6 +783,10 @@ def show_menu():
         ("T", "Table of Contents", show_table_of_contents),
         ("Q", "Quit", None)
     ]
+
+def show_menu():
+    """Display the main menu."""
+    menu_items = menu_entries()
     
     print("\n" + "=" * 60)
     print(" PYTHON DICTIONARIES GUIDE - MAIN MENU ".center(60, "="))
@@ -797,35 +798,62 @@ def show_menu():
     print("=" * 60)
     return menu_items
 
-def run_all_sections():
+ALL_SECTIONS = [
+    ("Dictionary Basics", dictionary_basics),
+    ("Creation Methods", dictionary_creation_methods),
+    ("Basic Operations", basic_operations),
+    ("Dictionary Methods", dictionary_methods),
+    ("Dictionary Comprehensions", dictionary_comprehensions),
+    ("Iteration Techniques", iteration_techniques),
+    ("Advanced Techniques", advanced_techniques),
+    ("Nested Dictionaries", nested_dictionaries),
+    ("Real-World Examples", real_world_examples),
+    ("Quick Reference", quick_reference),
+    ("Common Pitfalls", common_pitfalls)
+]
+
+def run_all_sections(pause=True):
     """Run all sections in sequence."""
-    sections = [
-        ("Dictionary Basics", dictionary_basics),
-        ("Creation Methods", dictionary_creation_methods),
-        ("Basic Operations", basic_operations),
-        ("Dictionary Methods", dictionary_methods),
-        ("Dictionary Comprehensions", dictionary_comprehensions),
-        ("Iteration Techniques", iteration_techniques),
-        ("Advanced Techniques", advanced_techniques),
-        ("Nested Dictionaries", nested_dictionaries),
-        ("Real-World Examples", real_world_examples),
-        ("Quick Reference", quick_reference),
-        ("Common Pitfalls", common_pitfalls)
-    ]
-    
-    print_section_header("RUNNING ALL SECTIONS")
-    print("This will run through all sections of the dictionary guide.")
-    print("Each section includes examples and demonstrations.")
-    
-    for i, (title, func) in enumerate(sections, 1):
-        print(f"\nRunning Section {i}/{len(sections)}: {title}")
-        run_example(func)
+    reset_section_timings()
+    if is_plain_output():
+        print_section_header("RUNNING ALL SECTIONS")
+        print("This will run through all sections of the dictionary guide.")
+        print("Each section includes examples and demonstrations.")
+    
+    for i, (title, func) in enumerate(ALL_SECTIONS, 1):
+        if is_plain_output():
+            print(f"\nRunning Section {i}/{len(ALL_SECTIONS)}: {title}")
+        render_section(title, func)
         
-        if i < len(sections):
+        if pause and i < len(ALL_SECTIONS):
             pause_for_user()
+    
+    report_section_timings()
 
-def main():
+def run_headless(selection):
+    """Run the chosen menu keys (or 'all') without prompts, then report timings."""
+    reset_section_timings()
+    if any(key.lower() == "all" for key in selection):
+        run_all_sections(pause=False)
+        return
+    
+    sections = {key: (title, func) for key, title, func in menu_entries()
+                if key.isdigit()}
+    for key in selection:
+        if key not in sections:
+            raise SystemExit(f"Unknown section {key!r}; choose from {', '.join(sections)} or 'all'")
+        render_section(*sections[key])
+    report_section_timings()
+
+def main(argv=None):
     """Main function to run the guide."""
+    args = parse_guide_args(argv)
+    if args.run:
+        run_headless(args.run)
+        if failed_sections():
+            raise SystemExit(1)
+        return
+    
     print("Welcome to the Complete Python Dictionaries Guide!")
     print("This interactive guide will teach you everything about Python dictionaries.")
     
@@ -856,7 +884,10 @@ def main():
         
         if func:
             print(f"\nRunning: {title}")
-            run_example(func)
+            if func is run_all_sections:
+                func()
+            else:
+                render_section(title, func)
             
             # Ask if user wants to continue
             continue_choice = input("\nPress Enter to return to menu (or 'q' to quit): ").strip().lower()
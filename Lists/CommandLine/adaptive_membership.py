@@ -0,0 +1,238 @@
+from utility import print_subsection_header, non_cacheable
+import random
+import time
+from collections import Counter
+
+# =============================================================================
+# ADAPTIVE MEMBERSHIP: A LIST THAT UPGRADES ITSELF TO A HASH INDEX
+# =============================================================================
+#
+# "Use sets for frequent membership testing" is good advice that is easy to
+# forget: code starts with a list, lookups creep into a loop, and every `in`
+# becomes an O(n) scan.
+#
+# AdaptiveList is a real list subclass that counts `in` lookups and the number
+# of items they scan. Once the scans add up to `threshold` full passes over the
+# list, it builds a Counter of its items; hashing every item costs several
+# linear scans, so the default threshold is 8 passes. From then on `x in lst`
+# and lst.count(x) are O(1) hash lookups.
+#
+# Every mutating list method either keeps the index up to date (the default,
+# O(1) extra per added or removed item) or, with on_mutation="invalidate",
+# drops it and starts counting again - better for lists that are rebuilt in
+# bulk between bursts of lookups. Lists holding unhashable items simply stay
+# linear. stats() reports what happened.
+
+
+class AdaptiveList(list):
+    """A list whose `in` and count() switch to a hash index after repeated use."""
+
+    def __init__(self, iterable=(), threshold=8.0, min_size=32, on_mutation="update"):
+        if on_mutation not in ("update", "invalidate"):
+            raise ValueError("on_mutation must be 'update' or 'invalidate'")
+        super().__init__(iterable)
+        self.threshold = threshold
+        self.min_size = min_size
+        self.on_mutation = on_mutation
+        self._index = None
+        self._hashable = True
+        self._scanned = 0
+        self._stats = {"lookups": 0, "linear lookups": 0, "indexed lookups": 0,
+                       "upgrades": 0, "invalidations": 0}
+
+    # --- index management -------------------------------------------------------
+
+    def _build_index(self):
+        try:
+            self._index = Counter(self)
+        except TypeError:
+            self._hashable = False
+            return
+        self._stats["upgrades"] += 1
+
+    def _drop_index(self):
+        self._index = None
+        self._scanned = 0
+        self._stats["invalidations"] += 1
+
+    def _changed(self, added=(), removed=()):
+        """Bring the index in line with items added to / removed from the list."""
+        if self._index is None:
+            return
+        if self.on_mutation == "invalidate":
+            self._drop_index()
+            return
+        index = self._index
+        try:
+            for item in added:
+                index[item] += 1
+        except TypeError:
+            self._hashable = False
+            self._drop_index()
+            return
+        for item in removed:
+            remaining = index[item] - 1
+            if remaining:
+                index[item] = remaining
+            else:
+                del index[item]
+
+    # --- lookups ----------------------------------------------------------------
+
+    def __contains__(self, value):
+        stats = self._stats
+        stats["lookups"] += 1
+        if self._index is not None:
+            try:
+                found = value in self._index
+            except TypeError:
+                pass
+            else:
+                stats["indexed lookups"] += 1
+                return found
+        stats["linear lookups"] += 1
+        self._scanned += len(self)
+        if (self._index is None and self._hashable and len(self) >= self.min_size
+                and self._scanned >= self.threshold * len(self)):
+            self._build_index()
+        return super().__contains__(value)
+
+    def count(self, value):
+        if self._index is not None:
+            try:
+                return self._index.get(value, 0)
+            except TypeError:
+                pass
+        return super().count(value)
+
+    def stats(self):
+        """Return lookup and upgrade counters plus the current index state."""
+        report = dict(self._stats)
+        report["indexed"] = self._index is not None
+        report["index size"] = len(self._index) if self._index is not None else 0
+        return report
+
+    # --- mutating list methods ----------------------------------------------------
+
+    def append(self, value):
+        super().append(value)
+        self._changed((value,))
+
+    def extend(self, values):
+        values = list(values)
+        super().extend(values)
+        self._changed(values)
+
+    def __iadd__(self, values):
+        self.extend(values)
+        return self
+
+    def __imul__(self, times):
+        added = list(self) * (times - 1) if times > 0 else []
+        removed = list(self) if times <= 0 else []
+        super().__imul__(times)
+        self._changed(added, removed)
+        return self
+
+    def insert(self, index, value):
+        super().insert(index, value)
+        self._changed((value,))
+
+    def remove(self, value):
+        super().remove(value)
+        self._changed(removed=(value,))
+
+    def pop(self, index=-1):
+        value = super().pop(index)
+        self._changed(removed=(value,))
+        return value
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            old = super().__getitem__(index)
+            super().__setitem__(index, value)
+            self._changed(value, old)
+        else:
+            old = super().__getitem__(index)
+            super().__setitem__(index, value)
+            self._changed((value,), (old,))
+
+    def __delitem__(self, index):
+        old = super().__getitem__(index)
+        super().__delitem__(index)
+        self._changed(removed=old if isinstance(index, slice) else (old,))
+
+    def clear(self):
+        removed = list(self)
+        super().clear()
+        self._changed(removed=removed)
+
+    def __repr__(self):
+        return f"AdaptiveList({super().__repr__()})"
+
+
+def benchmark_membership(size=100_000, lookup_counts=(3, 100, 1_000), seed=0):
+    """Time `lookups` membership tests (half hits, half misses) per strategy.
+
+    "set (built up front)" includes the cost of building the set, since that is
+    the price of switching by hand. Returns {lookups: {method: seconds}}.
+    """
+    rng = random.Random(seed)
+    data = list(range(0, 2 * size, 2))
+    results = {}
+    for lookups in lookup_counts:
+        targets = [rng.randrange(2 * size) for _ in range(lookups)]
+        timings = {}
+
+        start = time.perf_counter()
+        expected = [target in data for target in targets]
+        timings["list"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        as_set = set(data)
+        found = [target in as_set for target in targets]
+        timings["set (built up front)"] = time.perf_counter() - start
+        assert found == expected
+
+        adaptive = AdaptiveList(data)
+        start = time.perf_counter()
+        found = [target in adaptive for target in targets]
+        timings["AdaptiveList"] = time.perf_counter() - start
+        assert found == expected
+
+        results[lookups] = timings
+    return results
+
+
+def adaptive_membership_demo():
+    """Demonstrate AdaptiveList upgrading itself to a hash index."""
+    print_subsection_header("Adaptive Membership Testing")
+
+    ids = AdaptiveList(range(0, 2_000, 2), threshold=2)
+    print(f"AdaptiveList(threshold=2) of {len(ids):,} ids, indexed: {ids.stats()['indexed']}")
+    for target in (10, 11, 998, 1_500):
+        print(f"  {target} in ids -> {target in ids}  (indexed now: {ids.stats()['indexed']})")
+
+    ids.append(11)
+    ids.remove(10)
+    print(f"After append(11), remove(10): 11 in ids -> {11 in ids}, 10 in ids -> {10 in ids}")
+    print(f"Stats: {ids.stats()}")
+
+    bulk = AdaptiveList(range(100), threshold=2, on_mutation="invalidate")
+    for _ in range(3):
+        0 in bulk
+    bulk.extend(range(100, 200))
+    print(f"on_mutation='invalidate' after extend(): {bulk.stats()}")
+
+
+@non_cacheable
+def adaptive_membership_benchmark_demo():
+    """Time membership tests on a list, a set built up front and an AdaptiveList."""
+    print_subsection_header("Benchmark: Adaptive Membership Testing")
+
+    print("⏱️  Membership tests on 100,000 items (seconds):")
+    for lookups, timings in benchmark_membership().items():
+        row = "  ".join(f"{name}: {seconds:.4f}" for name, seconds in timings.items())
+        print(f"  {lookups:>5,} lookups  {row}")
+    print("💡 AdaptiveList pays for the index only once lookups justify it")
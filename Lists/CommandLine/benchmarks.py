@@ -0,0 +1,30 @@
+from list_view import list_view_benchmark_demo
+from sorted_list import sorted_list_benchmark_demo
+from rotation import rotation_benchmark_demo
+from chunking import chunking_benchmark_demo
+from flatten import flatten_benchmark_demo
+from adaptive_membership import adaptive_membership_benchmark_demo
+from async_pipeline import async_pipeline_demo
+from blocked_list import blocked_list_benchmark_demo
+from fused_pipeline import fused_pipeline_benchmark_demo
+
+# =============================================================================
+# BENCHMARKS
+# =============================================================================
+#
+# Timed comparisons for the data structures the sections introduce. They
+# measure wall-clock time, so each one is @non_cacheable and always runs; they
+# are kept out of the teaching sections (which stay cacheable) and out of
+# "All Sections". Run them from the "B" menu entry or with --run B.
+
+BENCHMARK_SECTIONS = [
+    ("Benchmark: Slice Views", list_view_benchmark_demo),
+    ("Benchmark: Sorted Inserts", sorted_list_benchmark_demo),
+    ("Benchmark: Rotation", rotation_benchmark_demo),
+    ("Benchmark: Parallel Chunks", chunking_benchmark_demo),
+    ("Benchmark: Flattening", flatten_benchmark_demo),
+    ("Benchmark: Adaptive Membership", adaptive_membership_benchmark_demo),
+    ("Benchmark: Async Pipeline", async_pipeline_demo),
+    ("Benchmark: Blocked List", blocked_list_benchmark_demo),
+    ("Benchmark: Fused Pipeline", fused_pipeline_benchmark_demo),
+]
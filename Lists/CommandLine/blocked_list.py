@@ -0,0 +1,310 @@
+from utility import print_subsection_header, non_cacheable
+from fenwick import FenwickIndex
+import time
+from collections.abc import MutableSequence
+from itertools import chain, islice
+
+# =============================================================================
+# BLOCKED LIST FOR INSERT-HEAVY WORKLOADS
+# =============================================================================
+#
+# list.insert(i, x) and list.remove(x) shift every item after position i, so a
+# middle insert into a 10-million-item list moves about 5 million pointers.
+#
+# BlockedList stores its items as a list of small lists ("blocks") of at most
+# 2 * load items, plus a Fenwick tree (binary indexed tree, see fenwick.py)
+# over the block sizes. To find position i it walks the tree in O(log blocks), then touches
+# only one block:
+#
+#     index / insert / delete     O(load + log(n / load))
+#     append / pop()              O(1) amortized
+#     iteration                   O(n), via itertools.chain over the blocks
+#
+# A block that grows past 2 * load is split in half; a block that shrinks below
+# load / 4 is merged into a neighbour. Both rebuild the size index, which costs
+# O(n / load) but happens at most once per ~load operations.
+
+
+class BlockedList(MutableSequence):
+    """A list-like sequence with fast insert and delete anywhere."""
+
+    def __init__(self, iterable=(), load=1000):
+        if load < 4:
+            raise ValueError("load must be at least 4")
+        self._load = load
+        self._blocks = []
+        self._len = 0
+        self._index = FenwickIndex()
+        self.extend(iterable)
+
+    # --- size index -----------------------------------------------------------
+
+    def _rebuild_index(self):
+        self._index.rebuild(self._blocks)
+
+    def _normalize(self, index):
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("BlockedList index out of range")
+        return index
+
+    # --- block maintenance ----------------------------------------------------
+
+    def _split(self, block_index):
+        block = self._blocks[block_index]
+        half = len(block) // 2
+        self._blocks[block_index:block_index + 1] = [block[:half], block[half:]]
+        self._rebuild_index()
+
+    def _shrink(self, block_index):
+        """Drop an empty block or merge a small one into its neighbour."""
+        blocks = self._blocks
+        block = blocks[block_index]
+        if not block:
+            del blocks[block_index]
+        elif len(block) < self._load // 4 and len(blocks) > 1:
+            neighbour = block_index - 1 if block_index else block_index + 1
+            low = min(block_index, neighbour)
+            merged = blocks[low] + blocks[low + 1]
+            blocks[low:low + 2] = [merged]
+            if len(merged) > 2 * self._load:
+                self._split(low)
+                return
+        else:
+            return
+        self._rebuild_index()
+
+    # --- MutableSequence API ------------------------------------------------
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step == 1:
+                return BlockedList(self._iter_from(start, max(0, stop - start)), self._load)
+            return BlockedList(map(self.__getitem__, range(start, stop, step)), self._load)
+        block_index, offset = self._index.locate(self._normalize(index))
+        return self._blocks[block_index][offset]
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            # Rare in insert-heavy code: rebuild from a plain list
+            items = list(self)
+            items[index] = value
+            self._reset(items)
+            return
+        block_index, offset = self._index.locate(self._normalize(index))
+        self._blocks[block_index][offset] = value
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            items = list(self)
+            del items[index]
+            self._reset(items)
+            return
+        block_index, offset = self._index.locate(self._normalize(index))
+        del self._blocks[block_index][offset]
+        self._len -= 1
+        self._index.update(block_index, -1)
+        self._shrink(block_index)
+
+    def insert(self, index, value):
+        """Insert value before index (list semantics, out-of-range indexes clamp)."""
+        if index < 0:
+            index = max(0, index + self._len)
+        if index >= self._len:
+            self.append(value)
+            return
+        block_index, offset = self._index.locate(index)
+        block = self._blocks[block_index]
+        block.insert(offset, value)
+        self._len += 1
+        self._index.update(block_index, 1)
+        if len(block) > 2 * self._load:
+            self._split(block_index)
+
+    def append(self, value):
+        if not self._blocks:
+            self._blocks.append([value])
+            self._len = 1
+            self._rebuild_index()
+            return
+        block = self._blocks[-1]
+        block.append(value)
+        self._len += 1
+        self._index.update(len(self._blocks) - 1, 1)
+        if len(block) > 2 * self._load:
+            self._split(len(self._blocks) - 1)
+
+    def extend(self, values):
+        """Append every item of values, filling new blocks of `load` items."""
+        iterator = iter(values)
+        if self._blocks and len(self._blocks[-1]) < self._load:
+            last = self._blocks[-1]
+            before = len(last)
+            last.extend(islice(iterator, self._load - before))
+            self._len += len(last) - before
+        while True:
+            block = list(islice(iterator, self._load))
+            if not block:
+                break
+            self._blocks.append(block)
+            self._len += len(block)
+        self._rebuild_index()
+
+    def pop(self, index=-1):
+        if not self._len:
+            raise IndexError("pop from empty BlockedList")
+        if index == -1:
+            block = self._blocks[-1]
+            value = block.pop()
+            self._len -= 1
+            self._index.update(len(self._blocks) - 1, -1)
+            self._shrink(len(self._blocks) - 1)
+            return value
+        value = self[index]
+        del self[index]
+        return value
+
+    def clear(self):
+        self._reset([])
+
+    def _reset(self, items):
+        self._blocks = []
+        self._len = 0
+        self.extend(items)
+
+    # --- faster versions of mixin methods -------------------------------------
+
+    def _iter_from(self, start, count):
+        if count <= 0 or start >= self._len:
+            return iter(())
+        block_index, offset = self._index.locate(start)
+        blocks = self._blocks
+        head = islice(blocks[block_index], offset, None)
+        return islice(chain(head, chain.from_iterable(islice(blocks, block_index + 1, None))), count)
+
+    def __iter__(self):
+        return chain.from_iterable(self._blocks)
+
+    def __reversed__(self):
+        return chain.from_iterable(map(reversed, reversed(self._blocks)))
+
+    def __contains__(self, value):
+        return any(value in block for block in self._blocks)
+
+    def index(self, value, start=0, stop=None):
+        if start < 0:
+            start = max(0, start + self._len)
+        stop = self._len if stop is None else stop
+        if stop < 0:
+            stop += self._len
+        position = 0
+        for block in self._blocks:
+            end = position + len(block)
+            if end > start and position < stop:
+                try:
+                    return position + block.index(value, max(0, start - position),
+                                                  min(len(block), stop - position))
+                except ValueError:
+                    pass
+            position = end
+        raise ValueError(f"{value!r} is not in BlockedList")
+
+    def count(self, value):
+        return sum(block.count(value) for block in self._blocks)
+
+    def reverse(self):
+        self._blocks.reverse()
+        for block in self._blocks:
+            block.reverse()
+        self._rebuild_index()
+
+    def sort(self, key=None, reverse=False):
+        self._reset(sorted(self, key=key, reverse=reverse))
+
+    def __eq__(self, other):
+        if isinstance(other, (BlockedList, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return f"BlockedList({list(self)!r})"
+
+
+def benchmark_blocked_list(sizes=(10_000, 100_000, 1_000_000), operations=1_000):
+    """Time `operations` of each kind on a list and a BlockedList of each size.
+
+    Returns {size: {operation: (list seconds, BlockedList seconds)}}.
+    """
+    results = {}
+    for size in sizes:
+        plain = list(range(size))
+        blocked = BlockedList(range(size))
+        step = max(1, size // operations)
+        middle = size // 2
+        timings = {}
+
+        def timed(action):
+            start = time.perf_counter()
+            for i in range(operations):
+                action(i)
+            return time.perf_counter() - start
+
+        timings["insert middle"] = (timed(lambda i: plain.insert(middle, i)),
+                                    timed(lambda i: blocked.insert(middle, i)))
+        timings["index"] = (timed(lambda i: plain[(i * step) % size]),
+                            timed(lambda i: blocked[(i * step) % size]))
+        timings["delete middle"] = (timed(lambda i: plain.__delitem__(middle)),
+                                    timed(lambda i: blocked.__delitem__(middle)))
+        timings["append"] = (timed(plain.append), timed(blocked.append))
+        timings["pop()"] = (timed(lambda i: plain.pop()), timed(lambda i: blocked.pop()))
+
+        start = time.perf_counter()
+        for _ in plain:
+            pass
+        list_iter = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in blocked:
+            pass
+        timings["full iteration"] = (list_iter, time.perf_counter() - start)
+
+        assert blocked == plain
+        results[size] = timings
+    return results
+
+
+def blocked_list_demo():
+    """Demonstrate BlockedList on the list builder steps."""
+    print_subsection_header("Blocked List for Insert-Heavy Workloads")
+
+    builder = BlockedList(load=4)
+    builder.append('apple')
+    builder.append('banana')
+    builder.insert(1, 'orange')
+    builder.extend(['grape', 'kiwi'])
+    builder.remove('banana')
+    builder.pop()
+    builder.sort()
+    builder.reverse()
+    print(f"List builder steps on a BlockedList: {list(builder)}")
+
+    letters = BlockedList("abcdefghijklmnop", load=4)
+    letters.insert(8, "*")
+    print(f"Blocks of at most 2 * load items: {letters._blocks}")
+    print(f"letters[8] = {letters[8]!r}, letters[3:7] = {list(letters[3:7])}")
+
+
+@non_cacheable
+def blocked_list_benchmark_demo():
+    """Compare list and BlockedList operation by operation."""
+    print_subsection_header("Benchmark: Blocked List")
+
+    print("⏱️  1,000 operations each (list vs BlockedList, seconds):")
+    for size, timings in benchmark_blocked_list().items():
+        print(f"  n={size:,}")
+        for operation, (list_time, blocked_time) in timings.items():
+            print(f"    {operation:<15} list: {list_time:.4f}  BlockedList: {blocked_time:.4f}")
@@ -0,0 +1,210 @@
+from utility import print_subsection_header, non_cacheable
+import math
+import os
+import time
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+# =============================================================================
+# LAZY, ZERO-COPY CHUNKING AND PARALLEL CHUNK PROCESSING
+# =============================================================================
+#
+# list_manipulation_advanced builds every chunk up front:
+#
+#     chunks = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+#
+# which copies the whole input before the first chunk is used. chunked() instead
+# yields lazy views, picking the cheapest kind for the input:
+#
+#   bytes / bytearray / array  ->  memoryview slices (no copying at all)
+#   list / tuple / range       ->  IndexRangeView (start/stop over the original)
+#   any other iterable         ->  lists filled with islice, one chunk at a time
+#
+# parallel_map_chunks() feeds those chunks to a process pool, choosing the chunk
+# size from the measured per-item cost and keeping only a few chunks in flight,
+# so work on huge inputs starts immediately and keeps every core busy.
+
+
+class IndexRangeView(Sequence):
+    """A read-only window base[start:stop] that does not copy the base sequence."""
+
+    __slots__ = ("base", "start", "stop")
+
+    def __init__(self, base, start, stop):
+        self.base = base
+        self.start = start
+        self.stop = stop
+
+    def __len__(self):
+        return self.stop - self.start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return IndexRangeView(self.base, self.start + start, self.start + max(start, stop))
+            return [self.base[self.start + i] for i in range(start, stop, step)]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("IndexRangeView index out of range")
+        return self.base[self.start + index]
+
+    def __iter__(self):
+        return map(self.base.__getitem__, range(self.start, self.stop))
+
+    def materialize(self):
+        """Return the window as a new list."""
+        return self.base[self.start:self.stop]
+
+    def __repr__(self):
+        return f"IndexRangeView({self.materialize()!r})"
+
+
+def _is_buffer(data):
+    """True for objects exposing the buffer protocol (bytes, array, NumPy arrays...)."""
+    if isinstance(data, (list, tuple, range, str)):
+        return False
+    try:
+        memoryview(data)
+    except TypeError:
+        return False
+    return True
+
+
+def chunked(data, size):
+    """Yield consecutive chunks of `size` items as lazy views (see module notes)."""
+    if size <= 0:
+        raise ValueError("chunk size must be positive")
+    if _is_buffer(data):
+        view = memoryview(data)
+        for start in range(0, len(view), size):
+            yield view[start:start + size]
+    elif isinstance(data, Sequence):
+        n = len(data)
+        for start in range(0, n, size):
+            yield IndexRangeView(data, start, min(start + size, n))
+    else:
+        iterator = iter(data)
+        while True:
+            chunk = list(islice(iterator, size))
+            if not chunk:
+                return
+            yield chunk
+
+
+def _apply_chunk(func, items):
+    return [func(item) for item in items]
+
+
+def _portable(chunk):
+    """Turn a chunk view into something cheap to send to another process."""
+    if isinstance(chunk, memoryview):
+        return chunk.tolist()
+    if isinstance(chunk, IndexRangeView):
+        return chunk.materialize()
+    return chunk
+
+
+def tune_chunk_size(func, sample, target_seconds=0.05, minimum=1, maximum=1_000_000):
+    """Pick a chunk size so one chunk takes about `target_seconds` of work.
+
+    Times func over `sample` (a small list of items) in this process. Larger chunks
+    amortize inter-process overhead; smaller ones balance load across cores.
+    """
+    if not sample:
+        return minimum
+    start = time.perf_counter()
+    for item in sample:
+        func(item)
+    per_item = max((time.perf_counter() - start) / len(sample), 1e-9)
+    return max(minimum, min(maximum, int(target_seconds / per_item)))
+
+
+def parallel_map_chunks(func, data, workers=None, chunk_size=None, sample_size=64,
+                        target_seconds=0.05, in_flight_per_worker=2):
+    """Yield func(item) for every item of `data`, in order, computed in a process pool.
+
+    `func` must be picklable (a module-level function). When `chunk_size` is not
+    given it is tuned from the measured cost of func on the first `sample_size`
+    items and, when len(data) is known, capped so there are at least
+    `workers * in_flight_per_worker` chunks to spread over the pool. At most
+    `workers * in_flight_per_worker` chunks are pending at any time, so memory
+    stays bounded and results start arriving as soon as the first chunk
+    completes.
+    """
+    workers = workers or os.cpu_count() or 1
+    if isinstance(data, Sequence) or _is_buffer(data):
+        source = data
+        sample = list(islice(iter(data), sample_size))
+    else:
+        iterator = iter(data)
+        sample = list(islice(iterator, sample_size))
+        source = _prepend(sample, iterator)
+    if chunk_size is None:
+        chunk_size = tune_chunk_size(func, sample, target_seconds)
+        if source is data:
+            total = len(data) if isinstance(data, Sequence) else len(memoryview(data))
+            chunk_size = max(1, min(chunk_size, math.ceil(total / (workers * in_flight_per_worker))))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunked(source, chunk_size):
+            pending.append(pool.submit(_apply_chunk, func, _portable(chunk)))
+            if len(pending) >= workers * in_flight_per_worker:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _prepend(head, iterator):
+    yield from head
+    yield from iterator
+
+
+def _work(x):
+    """Example CPU-bound per-item work used by the demo benchmark."""
+    return math.sqrt(x) * math.sin(x) + math.log1p(x)
+
+
+def chunking_demo():
+    """Demonstrate lazy chunk views over lists, buffers and iterators."""
+    print_subsection_header("Lazy Chunking")
+
+    data = list(range(1, 21))
+    views = list(chunked(data, 5))
+    print(f"chunked(list, 5) yields views: {views[0]!r} ...")
+    print(f"  Chunk 2 contents: {list(views[1])}, len={len(views[1])}")
+
+    buffer = bytearray(b"abcdefghij")
+    print(f"chunked(bytearray, 4): {[bytes(view) for view in chunked(buffer, 4)]} (memoryviews)")
+    print(f"chunked(generator, 3): {list(chunked((x * x for x in range(7)), 3))}")
+
+
+@non_cacheable
+def chunking_benchmark_demo():
+    """Tune a chunk size, then time serial work against parallel_map_chunks."""
+    print_subsection_header("Benchmark: Parallel Chunk Processing")
+
+    n = 400_000
+    sample = list(range(64))
+    tuned = tune_chunk_size(_work, sample)
+    print(f"🔧 Tuned chunk size for _work: {tuned:,} items")
+
+    start = time.perf_counter()
+    first = next(iter(chunked(range(n), tuned)))
+    print(f"⏱️  First lazy chunk of range({n:,}) ready in {time.perf_counter() - start:.6f}s")
+
+    start = time.perf_counter()
+    serial = [_work(x) for x in range(n)]
+    serial_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parallel = list(parallel_map_chunks(_work, range(n)))
+    parallel_time = time.perf_counter() - start
+
+    assert serial == parallel and len(first) == min(tuned, n)
+    print(f"⏱️  {n:,} items serially: {serial_time:.3f}s, "
+          f"parallel_map_chunks on {os.cpu_count()} core(s): {parallel_time:.3f}s")
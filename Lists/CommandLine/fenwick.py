@@ -0,0 +1,62 @@
+# =============================================================================
+# FENWICK INDEX OVER BLOCK SIZES
+# =============================================================================
+#
+# BlockedList (blocked_list.py) and SortedList (sorted_list.py) both store
+# their items as a list of small lists ("blocks"). To turn an overall position
+# into (block, offset) without summing every block size in front of it, they
+# keep a Fenwick tree (binary indexed tree) over the sizes:
+#
+#     update(block, delta)      O(log blocks)   a block grew or shrank
+#     locate(position)          O(log blocks)   position -> (block, offset)
+#     position(block, offset)   O(log blocks)   (block, offset) -> position
+#     rebuild(blocks)           O(blocks)       after splitting or merging
+
+
+class FenwickIndex:
+    """Prefix sums of block sizes, for position <-> (block, offset) lookups."""
+
+    __slots__ = ("_tree",)
+
+    def __init__(self, blocks=()):
+        self.rebuild(blocks)
+
+    def rebuild(self, blocks):
+        """Rebuild the tree from the current blocks in O(number of blocks)."""
+        tree = [0] * (len(blocks) + 1)
+        for i, block in enumerate(blocks, 1):
+            tree[i] += len(block)
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def update(self, block_index, delta):
+        """Record that block `block_index` changed size by `delta` items."""
+        tree = self._tree
+        i = block_index + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def locate(self, index):
+        """Return (block index, offset in block) for a position in range(len)."""
+        tree = self._tree
+        position = 0
+        bit = 1 << (len(tree) - 1).bit_length()
+        while bit:
+            candidate = position + bit
+            if candidate < len(tree) and tree[candidate] <= index:
+                position = candidate
+                index -= tree[candidate]
+            bit >>= 1
+        return position, index
+
+    def position(self, block_index, offset):
+        """Return the overall position of (block index, offset)."""
+        tree = self._tree
+        i = block_index
+        while i:
+            offset += tree[i]
+            i -= i & -i
+        return offset
@@ -0,0 +1,146 @@
+from utility import print_subsection_header, non_cacheable
+import time
+from itertools import chain
+
+# =============================================================================
+# ITERATIVE DEEP FLATTENING
+# =============================================================================
+#
+# nested_lists shows three ways to flatten a list of lists. One of them,
+#
+#     sum(nested, [])
+#
+# is quadratic: every + builds a new list holding everything so far. And all
+# three stop at two levels. This module provides:
+#
+#   deep_flatten(data)      - a generator that flattens any depth using an
+#                             explicit stack of iterators (no recursion limit)
+#   flatten(data, depth=1)  - uses itertools.chain for the common uniform
+#                             two-level case, deep_flatten otherwise
+
+# Iterable types that should be treated as single values, not flattened
+DEFAULT_LEAF_TYPES = (str, bytes, bytearray, dict)
+
+# Always leaves, whatever leaf_types says: a 1-character str iterates to
+# itself, so flattening strings would never terminate
+ATOMIC_TYPES = (str, bytes, bytearray)
+
+
+def deep_flatten(data, max_depth=None, leaf_types=DEFAULT_LEAF_TYPES, is_leaf=None):
+    """Yield the leaves of an arbitrarily nested iterable, left to right.
+
+    Parameters:
+        data: the nested iterable.
+        max_depth: flatten at most this many levels (None means no limit). Items
+            deeper than that are yielded as they are.
+        leaf_types: iterable types that are yielded whole (strings by default,
+            so "abc" does not become "a", "b", "c"). str, bytes and bytearray
+            are yielded whole even when they are not listed.
+        is_leaf: optional predicate; items for which it returns True are yielded
+            whole regardless of type.
+
+    The traversal keeps its own stack of iterators, so nesting depth is limited
+    only by memory, never by sys.getrecursionlimit().
+    """
+    stack = [iter(data)]
+    while stack:
+        for item in stack[-1]:
+            if (isinstance(item, leaf_types) or isinstance(item, ATOMIC_TYPES)
+                    or (is_leaf is not None and is_leaf(item))
+                    or (max_depth is not None and len(stack) > max_depth)):
+                yield item
+                continue
+            try:
+                child = iter(item)
+            except TypeError:
+                yield item
+                continue
+            stack.append(child)
+            break
+        else:
+            stack.pop()
+
+
+def flatten(data, depth=None, leaf_types=DEFAULT_LEAF_TYPES):
+    """Return a flat list of the leaves of `data`.
+
+    depth=1 takes the fast path for uniform two-level lists: when `data` is a
+    list or tuple whose items are all lists or tuples (and not leaf_types), a
+    single itertools.chain.from_iterable pass implemented in C. Everything else
+    uses deep_flatten, so both always agree.
+    """
+    if depth == 1 and isinstance(data, (list, tuple)):
+        containers = {kind for kind in (list, tuple) if not issubclass(kind, leaf_types)}
+        if set(map(type, data)) <= containers:
+            return list(chain.from_iterable(data))
+    return list(deep_flatten(data, max_depth=depth, leaf_types=leaf_types))
+
+
+def benchmark_flatten(sizes=(1_000, 2_500, 10_000), target=100_000, sublist_size=3):
+    """Time flattening methods on `size` sublists of `sublist_size` items each.
+
+    sum(nested, []) is quadratic, so it is only run up to the largest of `sizes`
+    and extrapolated (n ** 2) to `target` sublists; the linear methods are run
+    at `target` directly. Returns {method: seconds at target}, plus the
+    measured sum() times.
+    """
+    def make(n):
+        return [list(range(i, i + sublist_size)) for i in range(n)]
+
+    measured_sum = {}
+    for n in sizes:
+        nested = make(n)
+        start = time.perf_counter()
+        sum(nested, [])
+        measured_sum[n] = time.perf_counter() - start
+
+    largest = max(sizes)
+    results = {"sum(nested, []) (est.)": measured_sum[largest] * (target / largest) ** 2}
+
+    nested = make(target)
+    expected = None
+    for name, method in [
+        ("list comprehension", lambda: [x for sub in nested for x in sub]),
+        ("itertools.chain", lambda: list(chain.from_iterable(nested))),
+        ("flatten(depth=1)", lambda: flatten(nested, depth=1)),
+        ("deep_flatten", lambda: list(deep_flatten(nested))),
+    ]:
+        start = time.perf_counter()
+        flat = method()
+        results[name] = time.perf_counter() - start
+        assert expected is None or flat == expected
+        expected = flat
+    return results, measured_sum
+
+
+def flatten_demo():
+    """Demonstrate deep flattening of irregular and very deep nesting."""
+    print_subsection_header("Deep Flattening Without Recursion")
+
+    irregular = [1, [2, [3, [4, [5]]]], "text", (6, 7), [[8], 9]]
+    print("Irregular nesting:", irregular)
+    print("deep_flatten:", list(deep_flatten(irregular)))
+    print("deep_flatten(max_depth=2):", list(deep_flatten(irregular, max_depth=2)))
+    print("deep_flatten(leaf tuples):",
+          list(deep_flatten(irregular, leaf_types=DEFAULT_LEAF_TYPES + (tuple,))))
+
+    very_deep = current = []
+    for i in range(10_000):
+        child = [i]
+        current.append(child)
+        current = child
+    print(f"10,000 levels deep (recursion limit is far lower): "
+          f"{len(list(deep_flatten(very_deep)))} leaves")
+
+
+@non_cacheable
+def flatten_benchmark_demo():
+    """Time the flattening methods and the quadratic cost of sum(nested, [])."""
+    print_subsection_header("Benchmark: Flattening")
+
+    results, measured_sum = benchmark_flatten()
+    print("⏱️  sum(nested, []) measured:",
+          ", ".join(f"{n:,} sublists {seconds:.3f}s" for n, seconds in measured_sum.items()))
+    print("⏱️  100,000 sublists of 3 items:")
+    for method, seconds in results.items():
+        print(f"  {method:<24} {seconds:.4f}s")
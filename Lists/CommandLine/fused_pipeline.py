@@ -0,0 +1,270 @@
+from utility import print_subsection_header, non_cacheable
+import random
+import time
+import tracemalloc
+from collections import Counter
+
+# =============================================================================
+# FUSED SINGLE-PASS TRANSFORMATION PIPELINE
+# =============================================================================
+#
+# transformation_pipeline builds one full list per step (step1, step2, step3)
+# and then used to walk the result again for every statistic. Its job
+# distribution, built as
+#
+#     {job: jobs.count(job) for job in set(jobs)}
+#
+# rescanned the whole list once per distinct job, which is O(n * k). It now
+# feeds step3 to aggregate(), which gathers every statistic in a single O(n)
+# pass.
+#
+# Pipeline chains filter and map stages with the built-in filter() and map()
+# iterators, so each record flows through every stage before the next record
+# is read and no intermediate list is ever built. run() consumes that stream
+# once and feeds every record to the aggregations too:
+#
+#     people, stats = (Pipeline()
+#                      .filter(is_present)
+#                      .map(split_fields)
+#                      .filter(has_three_fields)
+#                      .map(to_person)
+#                      .run(messy_data, jobs=Count(job_of), oldest=MaxBy(age_of)))
+
+
+class Pipeline:
+    """A chain of filter/map stages executed lazily in a single pass."""
+
+    def __init__(self):
+        self._stages = []
+
+    def filter(self, predicate):
+        """Keep only records for which predicate(record) is true."""
+        self._stages.append((filter, predicate))
+        return self
+
+    def map(self, func):
+        """Replace each record with func(record)."""
+        self._stages.append((map, func))
+        return self
+
+    def stream(self, source):
+        """Return an iterator of fully transformed records."""
+        records = iter(source)
+        for stage, func in self._stages:
+            records = stage(func, records)
+        return records
+
+    def run(self, source, collect=True, **aggregations):
+        """Run the pipeline once, feeding every output record to each aggregation.
+
+        Returns (records, {name: aggregation result}); records is None when
+        collect is False, so only the aggregates are kept in memory.
+        """
+        records = [] if collect else None
+        adders = [aggregation.add for aggregation in aggregations.values()]
+        if collect:
+            adders.append(records.append)
+        for record in self.stream(source):
+            for add in adders:
+                add(record)
+        return records, {name: aggregation.result() for name, aggregation in aggregations.items()}
+
+
+def aggregate(records, **aggregations):
+    """Feed already transformed records to every aggregation in one pass."""
+    return Pipeline().run(records, collect=False, **aggregations)[1]
+
+
+class Count:
+    """Count records per key(record) value."""
+
+    def __init__(self, key):
+        self.key = key
+        self.counts = {}
+
+    def add(self, record):
+        value = self.key(record)
+        self.counts[value] = self.counts.get(value, 0) + 1
+
+    def result(self):
+        return self.counts
+
+
+class MinBy:
+    """Keep the first record with the smallest key(record)."""
+
+    def __init__(self, key):
+        self.key = key
+        self.best = None
+        self.best_key = None
+
+    def _better(self, candidate, current):
+        return candidate < current
+
+    def add(self, record):
+        value = self.key(record)
+        if self.best_key is None or self._better(value, self.best_key):
+            self.best, self.best_key = record, value
+
+    def result(self):
+        return self.best
+
+
+class MaxBy(MinBy):
+    """Keep the first record with the largest key(record)."""
+
+    def _better(self, candidate, current):
+        return candidate > current
+
+
+class Mean:
+    """Arithmetic mean of key(record); None when no records were seen."""
+
+    def __init__(self, key):
+        self.key = key
+        self.total = 0
+        self.count = 0
+
+    def add(self, record):
+        self.total += self.key(record)
+        self.count += 1
+
+    def result(self):
+        return self.total / self.count if self.count else None
+
+
+# --- stages for the messy "name, age, job" records of transformation_pipeline ---
+
+def is_present(item):
+    return bool(item and str(item).strip())
+
+
+def split_fields(item):
+    return item.strip().split(',')
+
+
+def has_three_fields(fields):
+    return len(fields) == 3
+
+
+def to_person(fields):
+    return {"name": fields[0].strip().title(),
+            "age": int(fields[1].strip()),
+            "job": fields[2].strip().title()}
+
+
+def age_of(person):
+    return person["age"]
+
+
+def job_of(person):
+    return person["job"]
+
+
+def person_pipeline():
+    """The filter -> split -> validate -> structure chain as one fused pipeline."""
+    return (Pipeline()
+            .filter(is_present)
+            .map(split_fields)
+            .filter(has_three_fields)
+            .map(to_person))
+
+
+def person_statistics():
+    """Fresh aggregations for the transformation_pipeline analysis."""
+    return {"average_age": Mean(age_of), "youngest": MinBy(age_of),
+            "oldest": MaxBy(age_of), "jobs": Count(job_of)}
+
+
+def make_messy_records(count, seed=0):
+    """Generate `count` messy records in the style of transformation_pipeline."""
+    rng = random.Random(seed)
+    first = ["john", "JANE", "bob", "Alice", "charlie", "dana"]
+    last = ["doe", "SMITH", "johnson", "Brown", "davis"]
+    levels = ["junior", "SENIOR", "lead", "Principal", ""]
+    roles = ["engineer", "DESIGNER", "manager", "developer", "Analyst", "nurse", "pilot",
+             "teacher", "chef", "ACCOUNTANT", "lawyer", "architect", "Pharmacist",
+             "writer", "editor", "mechanic", "electrician", "plumber", "scientist", "clerk"]
+    jobs = [f"{level} {role}".strip() for level in levels for role in roles]
+    records = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.05:
+            records.append(None)
+        elif roll < 0.1:
+            records.append("   ")
+        elif roll < 0.12:
+            records.append("broken record")
+        else:
+            records.append(f"  {rng.choice(first)} {rng.choice(last)}, "
+                           f"{rng.randint(18, 70)},{rng.choice(jobs)} ")
+    return records
+
+
+def _step_by_step(messy, count_jobs):
+    """The transformation_pipeline approach: one list per step, one pass per stat."""
+    step1 = [item for item in messy if item and str(item).strip()]
+    step2 = [item.strip().split(',') for item in step1]
+    step3 = [to_person(fields) for fields in step2 if len(fields) == 3]
+    jobs = [person["job"] for person in step3]
+    return step3, {"average_age": sum(person["age"] for person in step3) / len(step3),
+                   "youngest": min(step3, key=age_of),
+                   "oldest": max(step3, key=age_of),
+                   "jobs": count_jobs(jobs)}
+
+
+def benchmark_pipeline(size=200_000, seed=0):
+    """Compare the step-by-step list version with the fused pipeline.
+
+    Pass size=10_000_000 for a full-scale run. Returns {method: (seconds, peak
+    traced bytes)}; memory is measured in a second, traced run so that
+    tracemalloc does not distort the timings.
+    """
+    messy = make_messy_records(size, seed)
+    methods = {
+        "separate lists + jobs.count": lambda: _step_by_step(
+            messy, lambda jobs: {job: jobs.count(job) for job in set(jobs)}),
+        "separate lists + Counter": lambda: _step_by_step(
+            messy, lambda jobs: dict(Counter(jobs))),
+        "fused pipeline": lambda: person_pipeline().run(messy, **person_statistics()),
+        "fused pipeline (aggregates only)": lambda: person_pipeline().run(
+            messy, collect=False, **person_statistics()),
+    }
+    results = {}
+    outputs = []
+    for name, method in methods.items():
+        start = time.perf_counter()
+        outputs.append(method())
+        seconds = time.perf_counter() - start
+        tracemalloc.start()
+        method()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        results[name] = (seconds, peak)
+
+    people, stats = outputs[0]
+    for records, other in outputs[1:]:
+        assert other == stats and records in (people, None)
+    return results
+
+
+def fused_pipeline_demo():
+    """Demonstrate the fused pipeline on generated messy records."""
+    print_subsection_header("Fused Single-Pass Pipeline")
+
+    sample = make_messy_records(8, seed=1)
+    print("Sample messy records:")
+    for record in sample:
+        print(f"  {record!r}")
+    people, stats = person_pipeline().run(sample, **person_statistics())
+    print(f"→ {len(people)} people, job distribution {stats['jobs']}")
+
+
+@non_cacheable
+def fused_pipeline_benchmark_demo():
+    """Time and trace the step-by-step lists against the fused pipeline."""
+    print_subsection_header("Benchmark: Fused Single-Pass Pipeline")
+
+    print("⏱️  200,000 messy records, 100 distinct jobs:")
+    for method, (seconds, peak) in benchmark_pipeline().items():
+        print(f"  {method:<34} {seconds:.4f}s  peak {peak / 1024 / 1024:6.1f} MB")
@@ -1,4 +1,6 @@
 from utility import print_section_header, print_subsection_header
+from blocked_list import blocked_list_demo
+from fused_pipeline import aggregate, person_statistics, fused_pipeline_demo
 # =============================================================================
 # 11. INTERACTIVE DEMONSTRATIONS
 # =============================================================================
@@ -33,6 +35,9 @@ def interactive_demonstrations():
     
     list_builder_demo()
     
+    # insert() and remove() shift every later item: O(n) on a list (see blocked_list.py)
+    blocked_list_demo()
+    
     print_subsection_header("Demo 2: List Comprehension Workshop")
     
     def comprehension_workshop():
@@ -98,16 +103,14 @@ def interactive_demonstrations():
         for person in step3:
             print(f"   {person}")
         
-        # Step 4: Analysis
-        print("\n📊 Analysis:")
-        average_age = sum(person["age"] for person in step3) / len(step3)
-        print(f"   Average age: {average_age:.1f}")
-        print(f"   Youngest: {min(step3, key=lambda p: p['age'])['name']}")
-        print(f"   Oldest: {max(step3, key=lambda p: p['age'])['name']}")
-        
-        # Job distribution
-        jobs = [person["job"] for person in step3]
-        job_counts = {job: jobs.count(job) for job in set(jobs)}
-        print(f"   Job distribution: {job_counts}")
+        # Step 4: Analysis - every statistic (including an O(n) job count)
+        # gathered in one pass over step3 (see fused_pipeline.py)
+        stats = aggregate(step3, **person_statistics())
+        print("\n📊 Analysis (single pass, see fused_pipeline.py):")
+        print(f"   Average age: {stats['average_age']:.1f}")
+        print(f"   Youngest: {stats['youngest']['name']}")
+        print(f"   Oldest: {stats['oldest']['name']}")
+        print(f"   Job distribution: {stats['jobs']}")
     
     transformation_pipeline()
+    fused_pipeline_demo()
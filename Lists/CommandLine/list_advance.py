@@ -1,4 +1,6 @@
 from utility import print_section_header, print_subsection_header, run_example, pause_for_user
+from rotation import rotation_demo
+from chunking import chunking_demo
 # =============================================================================
 # ADVANCED TECHNIQUES
 # =============================================================================
@@ -78,6 +80,9 @@ def list_manipulation_advanced():
     # Rotate right by 2 positions  
     rotated_right = original[-2:] + original[:-2]
     print("Rotated right by 2:", rotated_right)
+
+    # Rotating repeatedly? Avoid the two slices and new list (see rotation.py)
+    rotation_demo()
     
     # Chunking a list
     data = list(range(1, 21))  # [1, 2, 3, ..., 20]
@@ -88,6 +93,9 @@ def list_manipulation_advanced():
     print(f"Chunks of {chunk_size}:")
     for i, chunk in enumerate(chunks):
         print(f"  Chunk {i + 1}: {chunk}")
+
+    # Large inputs: lazy chunk views and a process pool (see chunking.py)
+    chunking_demo()
     
     # Remove duplicates while preserving order
     with_duplicates = [1, 2, 3, 2, 4, 3, 5, 1, 6]
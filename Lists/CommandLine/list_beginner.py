@@ -1,4 +1,5 @@
 from utility import print_section_header, print_subsection_header
+from list_view import list_view_demo
 # =============================================================================
 # LIST BASICS
 # =============================================================================
@@ -68,6 +69,10 @@ def list_slicing_demo():
     print("Every 2nd element [::2]:", numbers[::2])
     print("Every 3rd from index 1 [1::3]:", numbers[1::3])
     print("Reverse the list [::-1]:", numbers[::-1])
+    print("⚠️  Every slice above is a new list (a copy of the selected items)")
+
+    # O(1) slicing without copying (see list_view.py)
+    list_view_demo()
 
 # =============================================================================
 # BASIC OPERATIONS
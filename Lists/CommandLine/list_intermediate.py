@@ -1,4 +1,5 @@
 from utility import print_section_header, print_subsection_header, run_example, pause_for_user
+from sorted_list import sorted_list_demo
 
 
 # =============================================================================
@@ -44,6 +45,9 @@ def list_methods():
     letters.reverse()
     print("After reverse():", letters)
     
+    # Re-sorting after every insert is O(n) each time (see sorted_list.py)
+    sorted_list_demo()
+    
     print_subsection_header("Copying Lists")
     
     # copy() - shallow copy
@@ -0,0 +1,138 @@
+from utility import print_subsection_header, non_cacheable
+import time
+from collections.abc import Sequence
+
+# =============================================================================
+# ZERO-COPY SLICE VIEWS
+# =============================================================================
+#
+# Every list slice copies: data[i:i + width] allocates a new list and copies
+# `width` references. In a tight windowing loop that is O(width) per window
+# even when only a few items of each window are read.
+#
+# ListView is a slice that does not copy. It stores the base list and a range
+# of indices, so slicing a view is O(1) and views of views compose their
+# start/stop/step exactly like nested slices would:
+#
+#     view = ListView(data)[10:100:2][::3]   # same items as data[10:100:2][::3]
+#
+# Reads go to the base list. Writes go through only when the view is created
+# with writable=True. materialize() makes an ordinary list when one is needed.
+# A view records indices, so it assumes the base list is not resized while the
+# view is in use.
+
+
+class ListView(Sequence):
+    """An O(1) slice of a list that reads (and optionally writes) through to it."""
+
+    __slots__ = ("base", "indices", "writable")
+
+    def __init__(self, base, indices=None, writable=False):
+        self.base = base
+        self.indices = range(len(base)) if indices is None else indices
+        self.writable = writable
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ListView(self.base, self.indices[index], self.writable)
+        return self.base[self.indices[index]]
+
+    def __setitem__(self, index, value):
+        if not self.writable:
+            raise TypeError("ListView is read-only; create it with writable=True")
+        if isinstance(index, slice):
+            targets = self.indices[index]
+            values = list(value)
+            if len(values) != len(targets):
+                raise ValueError("ListView slice assignment cannot change the length")
+            for target, item in zip(targets, values):
+                self.base[target] = item
+        else:
+            self.base[self.indices[index]] = value
+
+    def __iter__(self):
+        return map(self.base.__getitem__, self.indices)
+
+    def __reversed__(self):
+        return map(self.base.__getitem__, reversed(self.indices))
+
+    def materialize(self):
+        """Copy the viewed items into a new list (one C-level slice)."""
+        r = self.indices
+        if not r:
+            return []
+        # A reversed range that ends at index 0 has stop == -1, which a slice
+        # would read as "the last item"; None means "run off the front" instead.
+        stop = r.stop if r.stop >= 0 else None
+        return self.base[r.start:stop:r.step]
+
+    def __eq__(self, other):
+        if isinstance(other, (ListView, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return f"ListView({self.materialize()!r})"
+
+
+def benchmark_windows(size=200_000, width=1_000, step=10):
+    """Compare sliding windows built with slices against ListView windows.
+
+    Two scans over every `step`-th window of `width` items:
+      - "peek": read only the first and last item of each window
+      - "sum":  read every item of each window
+    Returns {scan: {method: seconds}}.
+    """
+    data = list(range(size))
+    starts = range(0, size - width, step)
+    view = ListView(data)
+    results = {}
+
+    start = time.perf_counter()
+    peek_copy = [(w[0], w[-1]) for w in (data[i:i + width] for i in starts)]
+    copy_time = time.perf_counter() - start
+    start = time.perf_counter()
+    peek_view = [(w[0], w[-1]) for w in (view[i:i + width] for i in starts)]
+    results["peek"] = {"list slice": copy_time, "ListView": time.perf_counter() - start}
+
+    start = time.perf_counter()
+    sum_copy = [sum(data[i:i + width]) for i in starts]
+    copy_time = time.perf_counter() - start
+    start = time.perf_counter()
+    sum_view = [sum(view[i:i + width]) for i in starts]
+    results["sum"] = {"list slice": copy_time, "ListView": time.perf_counter() - start}
+
+    assert peek_copy == peek_view and sum_copy == sum_view
+    return results
+
+
+def list_view_demo():
+    """Demonstrate zero-copy slice views."""
+    print_subsection_header("Zero-Copy Slice Views")
+
+    numbers = list(range(10))
+    view = ListView(numbers)[2:9]
+    print(f"numbers = {numbers}")
+    print(f"ListView(numbers)[2:9]       -> {list(view)}")
+    print(f"...[::2] (composed, no copy) -> {list(view[::2])}")
+    print(f"...[::-1]                    -> {list(view[::-1])}")
+
+    writable = ListView(numbers, writable=True)[::3]
+    writable[1] = 99
+    print(f"Write-through writable[::3][1] = 99 -> numbers = {numbers}")
+    print(f"materialize() -> {view.materialize()} ({type(view.materialize()).__name__})")
+
+
+@non_cacheable
+def list_view_benchmark_demo():
+    """Time sliding windows built with list slices against ListView windows."""
+    print_subsection_header("Benchmark: Zero-Copy Slice Views")
+
+    print("⏱️  Sliding windows of 1,000 over 200,000 items:")
+    for scan, timings in benchmark_windows().items():
+        row = "  ".join(f"{name}: {seconds:.4f}s" for name, seconds in timings.items())
+        print(f"  {scan:<5} {row}")
+    print("💡 Views win when windows are only partly read; copying is fine for full scans")
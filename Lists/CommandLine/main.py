@@ -1,4 +1,6 @@
-from utility import print_section_header, pause_for_user, run_example
+from utility import (print_section_header, pause_for_user, is_plain_output, render_section,
+                     reset_section_timings, report_section_timings, failed_sections,
+                     parse_guide_args)
 from toc import show_table_of_contents
 from list_beginner import list_basics, list_slicing_demo, basic_operations
 from list_intermediate import list_methods, list_comprehensions, nested_list_comprehensions,iteration_techniques, range_and_indices
@@ -10,6 +12,7 @@ from performance_tips import performance_tips
 from real_examples import real_world_examples, todo_list_example
 from interactive_demo import interactive_demonstrations
 from list_quick_reference import quick_reference, common_pitfalls
+from benchmarks import BENCHMARK_SECTIONS
 
 
 
@@ -17,9 +20,9 @@ from list_quick_reference import quick_reference, common_pitfalls
 # MAIN EXECUTION AND MENU SYSTEM
 # =============================================================================
 
-def show_menu():
-    """Display the main menu."""
-    menu_items = [
+def menu_entries():
+    """Return the (key, title, function) entries of the main menu."""
+    return [
         ("1", "List Basics", list_basics),
         ("2", "Basic Operations", basic_operations),
         ("3", "List Methods", list_methods),
@@ -33,9 +36,14 @@ def show_menu():
         ("11", "Interactive Demos", interactive_demonstrations),
         ("12", "Quick Reference", quick_reference),
         ("A", "All Sections", run_all_sections),
+        ("B", "Benchmarks", run_benchmarks),
         ("T", "Table of Contents", show_table_of_contents),
         ("Q", "Quit", None)
     ]
+
+def show_menu():
+    """Display the main menu."""
+    menu_items = menu_entries()
     
     print("\n" + "=" * 60)
     print(" PYTHON LISTS GUIDE - MAIN MENU ".center(60, "="))
@@ -47,44 +55,87 @@ def show_menu():
     print("=" * 60)
     return menu_items
 
-def run_all_sections():
+ALL_SECTIONS = [
+    ("List Basics", list_basics),
+    ("List Slicing", list_slicing_demo),
+    ("Basic Operations", basic_operations),
+    ("List Methods", list_methods),
+    ("List Comprehensions", list_comprehensions),
+    ("Nested List Comprehensions", nested_list_comprehensions),
+    ("Iteration Techniques", iteration_techniques),
+    ("Range and Indices", range_and_indices),
+    ("List Functions", list_functions),
+    ("Advanced Techniques", advanced_techniques),
+    ("Advanced List Manipulation", list_manipulation_advanced),
+    ("Nested Lists", nested_lists),
+    ("Matrix Operations", matrix_operations),
+    ("Performance Tips", performance_tips),
+    ("Real-World Examples", real_world_examples),
+    ("Todo List Example", todo_list_example),
+    ("Interactive Demonstrations", interactive_demonstrations),
+    ("Quick Reference", quick_reference),
+    ("Common Pitfalls", common_pitfalls)
+]
+
+def run_all_sections(pause=True):
     """Run all sections in sequence."""
-    sections = [
-        ("List Basics", list_basics),
-        ("List Slicing", list_slicing_demo),
-        ("Basic Operations", basic_operations),
-        ("List Methods", list_methods),
-        ("List Comprehensions", list_comprehensions),
-        ("Nested List Comprehensions", nested_list_comprehensions),
-        ("Iteration Techniques", iteration_techniques),
-        ("Range and Indices", range_and_indices),
-        ("List Functions", list_functions),
-        ("Advanced Techniques", advanced_techniques),
-        ("Advanced List Manipulation", list_manipulation_advanced),
-        ("Nested Lists", nested_lists),
-        ("Matrix Operations", matrix_operations),
-        ("Performance Tips", performance_tips),
-        ("Real-World Examples", real_world_examples),
-        ("Todo List Example", todo_list_example),
-        ("Interactive Demonstrations", interactive_demonstrations),
-        ("Quick Reference", quick_reference),
-        ("Common Pitfalls", common_pitfalls)
-    ]
+    reset_section_timings()
+    if is_plain_output():
+        print_section_header("RUNNING ALL SECTIONS")
+        print("🚀 This will run through all sections of the guide.")
+        print("📖 Each section includes examples and demonstrations.")
+        if pause:
+            print("⏸️  You can pause between sections to review the content.")
     
-    print_section_header("RUNNING ALL SECTIONS")
-    print("🚀 This will run through all sections of the guide.")
-    print("📖 Each section includes examples and demonstrations.")
-    print("⏸️  You can pause between sections to review the content.")
+    run_sections(ALL_SECTIONS, pause)
+    report_section_timings()
+
+def run_benchmarks(pause=True):
+    """Run the timed benchmark sections in sequence (never cached)."""
+    reset_section_timings()
+    if is_plain_output():
+        print_section_header("RUNNING BENCHMARKS")
+        print("⏱️  Each benchmark times the data structures and pipelines from the sections.")
+        print("🔁 Benchmarks always run; they are never replayed from the section cache.")
     
+    run_sections(BENCHMARK_SECTIONS, pause)
+    report_section_timings()
+
+def run_sections(sections, pause=False):
+    """Render (title, function) sections in order, optionally pausing between them."""
     for i, (title, func) in enumerate(sections, 1):
-        print(f"\n🔹 Running Section {i}/{len(sections)}: {title}")
-        run_example(func)
+        if is_plain_output():
+            print(f"\n🔹 Running Section {i}/{len(sections)}: {title}")
+        render_section(title, func)
         
-        if i < len(sections):  # Don't pause after the last section
+        if pause and i < len(sections):  # Don't pause after the last section
             pause_for_user()
 
-def main():
+def run_headless(selection):
+    """Run the chosen menu keys ('all', 'B' for benchmarks) without prompts, then report timings."""
+    reset_section_timings()
+    sections = {key: [(title, func)] for key, title, func in menu_entries()
+                if key.isdigit()}
+    sections["ALL"] = ALL_SECTIONS
+    sections["B"] = BENCHMARK_SECTIONS
+    chosen = []
+    for key in selection:
+        if key.upper() not in sections:
+            raise SystemExit(f"Unknown section {key!r}; choose from "
+                             f"{', '.join(key for key in sections if key.isdigit())}, 'all' or 'B'")
+        chosen.extend(sections[key.upper()])
+    run_sections(chosen)
+    report_section_timings()
+
+def main(argv=None):
     """Main function to run the guide."""
+    args = parse_guide_args(argv)
+    if args.run:
+        run_headless(args.run)
+        if failed_sections():
+            raise SystemExit(1)
+        return
+    
     print("🐍 Welcome to the Complete Python Lists Guide!")
     print("This interactive guide will teach you everything about Python lists.")
     
@@ -115,7 +166,10 @@ def main():
         
         if func:
             print(f"\n🚀 Running: {title}")
-            run_example(func)
+            if func in (run_all_sections, run_benchmarks):
+                func()
+            else:
+                render_section(title, func)
             
             # Ask if user wants to continue
             continue_choice = input("\n🔄 Press Enter to return to menu (or 'q' to quit): ").strip().lower()
@@ -1,4 +1,5 @@
 from utility import print_section_header, print_subsection_header
+from flatten import flatten_demo
 # =============================================================================
 # 8. NESTED LISTS
 # =============================================================================
@@ -63,6 +64,10 @@ def nested_lists():
     import itertools
     flat3 = list(itertools.chain.from_iterable(nested))
     print("Flattened (itertools):", flat3)
+    print("⚠️  sum(nested, []) is quadratic - avoid it for large inputs")
+
+    # Any depth, no recursion limit (see flatten.py)
+    flatten_demo()
 
 def matrix_operations():
     """Demonstrate matrix operations with nested lists."""
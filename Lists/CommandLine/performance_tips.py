@@ -1,4 +1,5 @@
 from utility import print_section_header, print_subsection_header
+from adaptive_membership import adaptive_membership_demo
 
 # =============================================================================
 # PERFORMANCE TIPS
@@ -67,6 +68,9 @@ def performance_tips():
     print(f"In set (hash lookup): {'Found' if target in search_set else 'Not found'}")
     print("💡 Tip: Use sets for frequent membership testing")
     
+    # Let the container make the switch itself (see adaptive_membership.py)
+    adaptive_membership_demo()
+    
     print_subsection_header("Best Practices Summary")
     
     best_practices = [
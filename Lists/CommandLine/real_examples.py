@@ -135,6 +135,9 @@ def real_world_examples():
     
     print(f"Final processed data: {step4}")
     print(f"Processing summary: {len(raw_data)} → {len(step4)} valid emails")
+    
+    # The same cleaning when records stream in from files and sockets is timed
+    # stage by stage in the Benchmarks menu (see async_pipeline.py)
 
 def todo_list_example():
     """Demonstrate a todo list application."""
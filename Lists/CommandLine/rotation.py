@@ -0,0 +1,198 @@
+from utility import print_subsection_header, non_cacheable
+import time
+from collections import deque
+from itertools import chain, islice
+
+# =============================================================================
+# LIST ROTATION WITHOUT SLICE CONCATENATION
+# =============================================================================
+#
+# list_manipulation_advanced rotates with  original[2:] + original[:2]  which
+# allocates two slices plus a new list on every rotation. For a ring-scheduling
+# loop that rotates a 100k-element list thousands of times a second, there are
+# three cheaper options:
+#
+#   rotate_in_place(lst, k) - no new list; still O(n), but one memmove in C
+#   RotatingBuffer          - deque-backed ring, rotate(k) costs O(k)
+#   RotatedView             - zero-copy view; rotate(k) is O(1) offset arithmetic
+
+
+def rotate_in_place(lst, k):
+    """Rotate a list left by k positions (negative k rotates right), in place.
+
+    Only the shorter side (min(k, n - k) items) is copied out to a temporary slice,
+    but deleting it from, or inserting it at, the front shifts every other item with
+    one memmove, so the rotation is O(n) - done in C rather than a Python loop.
+    """
+    n = len(lst)
+    if n == 0:
+        return lst
+    k %= n
+    if k == 0:
+        return lst
+    if k <= n - k:
+        lst.extend(lst[:k])
+        del lst[:k]
+    else:
+        k = n - k
+        lst[:0] = lst[-k:]
+        del lst[-k:]
+    return lst
+
+
+class RotatingBuffer:
+    """Ring of items backed by collections.deque.
+
+    rotate(k) moves k items between the deque's ends, so small rotations of a
+    large ring are cheap. Use head() / take() to read the front of the ring.
+    """
+
+    def __init__(self, iterable=()):
+        self._items = deque(iterable)
+
+    def rotate(self, k=1):
+        """Rotate left by k positions (negative k rotates right)."""
+        self._items.rotate(-k)
+        return self
+
+    def head(self):
+        return self._items[0]
+
+    def take(self, count):
+        """Return the first `count` items without rotating."""
+        return list(islice(self._items, count))
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def to_list(self):
+        return list(self._items)
+
+    def __repr__(self):
+        return f"RotatingBuffer({list(self._items)})"
+
+
+class RotatedView:
+    """A zero-copy rotated view of a sequence.
+
+    view[i] reads base[(i + offset) % len(base)], so rotating never moves data.
+    Writes go through to the base sequence.
+    """
+
+    def __init__(self, base, offset=0):
+        self.base = base
+        self.offset = offset % len(base) if len(base) else 0
+
+    def rotate(self, k=1):
+        """Rotate left by k positions in O(1) (negative k rotates right)."""
+        if len(self.base):
+            self.offset = (self.offset + k) % len(self.base)
+        return self
+
+    def _index(self, index):
+        n = len(self.base)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("RotatedView index out of range")
+        index += self.offset
+        return index - n if index >= n else index
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return self.base[self._index(index)]
+
+    def __setitem__(self, index, value):
+        self.base[self._index(index)] = value
+
+    def __len__(self):
+        return len(self.base)
+
+    def __iter__(self):
+        return chain(islice(self.base, self.offset, None), islice(self.base, 0, self.offset))
+
+    def materialize(self):
+        """Return the rotated contents as a new list."""
+        return self.base[self.offset:] + self.base[:self.offset]
+
+    def __repr__(self):
+        return f"RotatedView({self.materialize()}, offset={self.offset})"
+
+
+def benchmark_rotation(sizes=(1_000, 10_000, 100_000), rotations=2_000, k=2):
+    """Time `rotations` left rotations by k plus a read of the head item.
+
+    Returns {size: {method: seconds}}.
+    """
+    results = {}
+    for size in sizes:
+        timings = {}
+
+        data = list(range(size))
+        start = time.perf_counter()
+        for _ in range(rotations):
+            data = data[k:] + data[:k]
+            data[0]
+        timings["slice concatenation"] = time.perf_counter() - start
+
+        data = list(range(size))
+        start = time.perf_counter()
+        for _ in range(rotations):
+            rotate_in_place(data, k)
+            data[0]
+        timings["rotate_in_place"] = time.perf_counter() - start
+
+        ring = RotatingBuffer(range(size))
+        start = time.perf_counter()
+        for _ in range(rotations):
+            ring.rotate(k)
+            ring.head()
+        timings["RotatingBuffer"] = time.perf_counter() - start
+
+        view = RotatedView(list(range(size)))
+        start = time.perf_counter()
+        for _ in range(rotations):
+            view.rotate(k)
+            view[0]
+        timings["RotatedView"] = time.perf_counter() - start
+
+        assert data[0] == ring.head() == view[0]
+        results[size] = timings
+    return results
+
+
+def rotation_demo():
+    """Demonstrate the rotation options."""
+    print_subsection_header("Rotation Without Copying")
+
+    original = [1, 2, 3, 4, 5]
+    print("Original list:", original)
+
+    in_place = list(original)
+    rotate_in_place(in_place, 2)
+    print("rotate_in_place(lst, 2):", in_place)
+
+    ring = RotatingBuffer(original).rotate(-2)
+    print("RotatingBuffer.rotate(-2):", ring.to_list())
+
+    view = RotatedView(original, 2)
+    print(f"RotatedView(original, 2): {list(view)}  view[0] = {view[0]}")
+    print("Base list unchanged:", original)
+
+
+@non_cacheable
+def rotation_benchmark_demo():
+    """Time repeated rotations with each option."""
+    print_subsection_header("Benchmark: Rotation Without Copying")
+
+    print("⏱️  2,000 rotations by 2 (seconds):")
+    for size, timings in benchmark_rotation().items():
+        row = "  ".join(f"{name}: {seconds:.4f}" for name, seconds in timings.items())
+        print(f"  n={size:>7,}  {row}")
@@ -0,0 +1,412 @@
+from utility import print_subsection_header, non_cacheable
+from fenwick import FenwickIndex
+import random
+import time
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import MutableMapping, Sequence
+from itertools import chain, islice
+
+# =============================================================================
+# SORTED LIST AND SORTED DICT
+# =============================================================================
+#
+# Keeping a list sorted with
+#
+#     data.append(x)
+#     data.sort()
+#
+# costs O(n) per insert (Timsort only has to merge one run, but it still walks
+# the list), and bisect.insort is O(log n) to search plus O(n) to shift items.
+#
+# SortedList keeps its items in sorted blocks of at most 2 * load items, with
+# the largest key of every block in `_maxes`. Finding a value is a bisect over
+# _maxes and then one bisect inside one block. A Fenwick tree over block sizes
+# (fenwick.py, shared with blocked_list.py) turns positions into (block, offset)
+# pairs and back, so these are all O(log n + load):
+#
+#     add / remove / discard / pop(i) / sl[i] / index(value) / bisect_*
+#
+# irange(min, max) and islice(start, stop) find both ends that way and then
+# stream the blocks between them. SortedDict is a dict plus a SortedList of
+# its keys, so it iterates in key order and supports the same range queries.
+
+
+class SortedList(Sequence):
+    """A sequence that keeps its items sorted (by `key`, if given)."""
+
+    def __init__(self, iterable=(), key=None, load=1000):
+        if load < 4:
+            raise ValueError("load must be at least 4")
+        self._key = key
+        self._load = load
+        self._index = FenwickIndex()
+        self._load_sorted(sorted(iterable, key=key))
+
+    # --- internal layout ------------------------------------------------------
+
+    def _load_sorted(self, items):
+        """Bulk load already sorted items in O(n)."""
+        load = self._load
+        self._lists = [items[i:i + load] for i in range(0, len(items), load)]
+        if self._key is None:
+            self._keys = self._lists
+        else:
+            self._keys = [list(map(self._key, block)) for block in self._lists]
+        self._len = len(items)
+        self._rebuild_index()
+
+    def _rebuild_index(self):
+        """Rebuild _maxes and the Fenwick index over block sizes."""
+        self._maxes = [keys[-1] for keys in self._keys]
+        self._index.rebuild(self._lists)
+
+    def _normalize(self, index):
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("SortedList index out of range")
+        return index
+
+    def _delete(self, block_index, offset):
+        block = self._lists[block_index]
+        del block[offset]
+        if self._keys is not self._lists:
+            del self._keys[block_index][offset]
+        self._len -= 1
+        if not block:
+            del self._lists[block_index]
+            if self._keys is not self._lists:
+                del self._keys[block_index]
+            self._rebuild_index()
+        else:
+            self._maxes[block_index] = self._keys[block_index][-1]
+            self._index.update(block_index, -1)
+
+    # --- adding and removing --------------------------------------------------
+
+    def add(self, value):
+        """Insert value in sorted order (after any equal items)."""
+        key = value if self._key is None else self._key(value)
+        if not self._lists:
+            self._lists.append([value])
+            if self._keys is not self._lists:
+                self._keys.append([key])
+            self._len = 1
+            self._rebuild_index()
+            return
+        block_index = bisect_right(self._maxes, key)
+        if block_index == len(self._maxes):
+            block_index -= 1
+            self._maxes[block_index] = key
+        keys = self._keys[block_index]
+        offset = bisect_right(keys, key)
+        self._lists[block_index].insert(offset, value)
+        if keys is not self._lists[block_index]:
+            keys.insert(offset, key)
+        self._len += 1
+        self._index.update(block_index, 1)
+        if len(keys) > 2 * self._load:
+            half = len(keys) // 2
+            block = self._lists[block_index]
+            self._lists[block_index:block_index + 1] = [block[:half], block[half:]]
+            if self._keys is not self._lists:
+                self._keys[block_index:block_index + 1] = [keys[:half], keys[half:]]
+            self._rebuild_index()
+
+    def update(self, iterable):
+        """Add many values; large batches are merged with one sort."""
+        values = list(iterable)
+        if len(values) * 4 >= self._len:
+            self._load_sorted(sorted(chain(self, values), key=self._key))
+        else:
+            for value in values:
+                self.add(value)
+
+    def _find(self, value):
+        """Return (block index, offset) of an item equal to value, or None."""
+        key = value if self._key is None else self._key(value)
+        block_index = bisect_left(self._maxes, key)
+        while block_index < len(self._maxes):
+            keys = self._keys[block_index]
+            offset = bisect_left(keys, key)
+            block = self._lists[block_index]
+            while offset < len(keys) and keys[offset] == key:
+                if block[offset] == value:
+                    return block_index, offset
+                offset += 1
+            if offset < len(keys):
+                return None
+            block_index += 1
+        return None
+
+    def discard(self, value):
+        """Remove one item equal to value, if present."""
+        found = self._find(value)
+        if found is not None:
+            self._delete(*found)
+
+    def remove(self, value):
+        """Remove one item equal to value; raise ValueError if absent."""
+        found = self._find(value)
+        if found is None:
+            raise ValueError(f"{value!r} not in SortedList")
+        self._delete(*found)
+
+    def pop(self, index=-1):
+        if not self._len:
+            raise IndexError("pop from empty SortedList")
+        block_index, offset = self._index.locate(self._normalize(index))
+        value = self._lists[block_index][offset]
+        self._delete(block_index, offset)
+        return value
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            items = list(self)
+            del items[index]
+            self._load_sorted(items)
+            return
+        self._delete(*self._index.locate(self._normalize(index)))
+
+    def clear(self):
+        self._load_sorted([])
+
+    # --- lookups ----------------------------------------------------------------
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step == 1:
+                return list(self.islice(start, stop))
+            return [self[i] for i in range(start, stop, step)]
+        block_index, offset = self._index.locate(self._normalize(index))
+        return self._lists[block_index][offset]
+
+    def __iter__(self):
+        return chain.from_iterable(self._lists)
+
+    def __reversed__(self):
+        return chain.from_iterable(map(reversed, reversed(self._lists)))
+
+    def __contains__(self, value):
+        return self._find(value) is not None
+
+    def index(self, value):
+        """Return the position of the first item equal to value."""
+        found = self._find(value)
+        if found is None:
+            raise ValueError(f"{value!r} not in SortedList")
+        return self._index.position(*found)
+
+    def count(self, value):
+        key = value if self._key is None else self._key(value)
+        start, stop = self.bisect_key_left(key), self.bisect_key_right(key)
+        return sum(1 for item in self.islice(start, stop) if item == value)
+
+    def bisect_key_left(self, key):
+        """Position where an item with this key would be inserted before equals."""
+        block_index = bisect_left(self._maxes, key)
+        if block_index == len(self._maxes):
+            return self._len
+        return self._index.position(block_index, bisect_left(self._keys[block_index], key))
+
+    def bisect_key_right(self, key):
+        """Position where an item with this key would be inserted after equals."""
+        block_index = bisect_right(self._maxes, key)
+        if block_index == len(self._maxes):
+            return self._len
+        return self._index.position(block_index, bisect_right(self._keys[block_index], key))
+
+    def bisect_left(self, value):
+        return self.bisect_key_left(value if self._key is None else self._key(value))
+
+    def bisect_right(self, value):
+        return self.bisect_key_right(value if self._key is None else self._key(value))
+
+    # --- range queries ----------------------------------------------------------
+
+    def islice(self, start=None, stop=None, reverse=False):
+        """Iterate over positions start..stop-1 without copying the whole range."""
+        start, stop, _ = slice(start, stop).indices(self._len)
+        if start >= stop:
+            return iter(())
+        if reverse:
+            block_index, offset = self._index.locate(stop - 1)
+            head = reversed(self._lists[block_index][:offset + 1])
+            rest = map(reversed, reversed(self._lists[:block_index]))
+            return islice(chain(head, chain.from_iterable(rest)), stop - start)
+        block_index, offset = self._index.locate(start)
+        head = islice(self._lists[block_index], offset, None)
+        rest = islice(self._lists, block_index + 1, None)
+        return islice(chain(head, chain.from_iterable(rest)), stop - start)
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True), reverse=False):
+        """Iterate over items whose key lies between minimum and maximum.
+
+        None means unbounded on that side. `inclusive` says whether each bound
+        itself is included.
+        """
+        if minimum is None:
+            start = 0
+        elif inclusive[0]:
+            start = self.bisect_key_left(minimum)
+        else:
+            start = self.bisect_key_right(minimum)
+        if maximum is None:
+            stop = self._len
+        elif inclusive[1]:
+            stop = self.bisect_key_right(maximum)
+        else:
+            stop = self.bisect_key_left(maximum)
+        return self.islice(start, stop, reverse)
+
+    def __repr__(self):
+        return f"SortedList({list(self)!r})"
+
+
+class SortedDict(MutableMapping):
+    """A dict that iterates in sorted key order and supports range queries."""
+
+    def __init__(self, *args, load=1000, **kwargs):
+        self._dict = dict(*args, **kwargs)
+        self._keys = SortedList(self._dict, load=load)
+
+    def __getitem__(self, key):
+        return self._dict[key]
+
+    def __setitem__(self, key, value):
+        if key not in self._dict:
+            self._keys.add(key)
+        self._dict[key] = value
+
+    def __delitem__(self, key):
+        del self._dict[key]
+        self._keys.remove(key)
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __reversed__(self):
+        return reversed(self._keys)
+
+    def __len__(self):
+        return len(self._dict)
+
+    def __contains__(self, key):
+        return key in self._dict
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True), reverse=False):
+        """Iterate over keys between minimum and maximum (see SortedList.irange)."""
+        return self._keys.irange(minimum, maximum, inclusive, reverse)
+
+    def islice(self, start=None, stop=None, reverse=False):
+        """Iterate over the keys at positions start..stop-1."""
+        return self._keys.islice(start, stop, reverse)
+
+    def peekitem(self, index=-1):
+        """Return the (key, value) pair at a sorted position."""
+        key = self._keys[index]
+        return key, self._dict[key]
+
+    def popitem(self, index=-1):
+        """Remove and return the (key, value) pair at a sorted position."""
+        if not self._dict:
+            raise KeyError("popitem(): SortedDict is empty")
+        key = self._keys.pop(index)
+        return key, self._dict.pop(key)
+
+    def clear(self):
+        self._dict.clear()
+        self._keys.clear()
+
+    def __repr__(self):
+        return f"SortedDict({{{', '.join(f'{k!r}: {v!r}' for k, v in self.items())}}})"
+
+
+def benchmark_sorted_inserts(sizes=(10_000, 100_000, 1_000_000), inserts=200, seed=0):
+    """Time keeping a collection sorted while adding `inserts` random values.
+
+    Each size starts from `size` random values; pass sizes up to 10_000_000 for
+    a full-scale run. Returns {size: {method: seconds per insert}}, plus bulk
+    load and range query timings for SortedList.
+    """
+    rng = random.Random(seed)
+    results = {}
+    for size in sizes:
+        base = [rng.random() for _ in range(size)]
+        extra = [rng.random() for _ in range(inserts)]
+        timings = {}
+
+        start = time.perf_counter()
+        sorted_list = SortedList(base)
+        timings["SortedList bulk load"] = time.perf_counter() - start
+
+        # Re-sorting is O(n) per insert, so large sizes time fewer inserts
+        resort = extra[:max(5, min(inserts, inserts * 10_000 // size))]
+        plain = sorted(base)
+        start = time.perf_counter()
+        for value in resort:
+            plain.append(value)
+            plain.sort()
+        timings["append + sort (per insert)"] = (time.perf_counter() - start) / len(resort)
+
+        insorted = sorted(base)
+        start = time.perf_counter()
+        for value in extra:
+            insort(insorted, value)
+        timings["bisect.insort (per insert)"] = (time.perf_counter() - start) / inserts
+
+        start = time.perf_counter()
+        for value in extra:
+            sorted_list.add(value)
+        timings["SortedList.add (per insert)"] = (time.perf_counter() - start) / inserts
+
+        start = time.perf_counter()
+        in_range = sum(1 for _ in sorted_list.irange(0.25, 0.26))
+        timings["SortedList.irange 1%"] = time.perf_counter() - start
+
+        assert plain == sorted(base + resort) and insorted == list(sorted_list)
+        assert in_range == bisect_right(insorted, 0.26) - bisect_left(insorted, 0.25)
+        results[size] = timings
+    return results
+
+
+def sorted_list_demo():
+    """Demonstrate SortedList and SortedDict."""
+    print_subsection_header("Staying Sorted: SortedList and SortedDict")
+
+    scores = SortedList([42, 7, 19, 88, 23])
+    scores.add(50)
+    scores.add(3)
+    print(f"SortedList after add(50), add(3): {list(scores)}")
+    print(f"  index(50) = {scores.index(50)}, scores[-2:] = {scores[-2:]}")
+    print(f"  irange(10, 50) = {list(scores.irange(10, 50))}")
+    print(f"  islice(1, 4) = {list(scores.islice(1, 4))}")
+
+    words = SortedList(["banana", "Apple", "cherry"], key=str.lower)
+    words.add("apricot")
+    print(f"SortedList(key=str.lower): {list(words)}")
+
+    prices = SortedDict({"pear": 0.8, "apple": 0.5, "fig": 2.1})
+    prices["banana"] = 0.3
+    print(f"SortedDict keys in order: {list(prices)}")
+    print(f"  keys from 'b' to 'g': {list(prices.irange('b', 'g'))}")
+    print(f"  peekitem(0) = {prices.peekitem(0)}")
+
+
+@non_cacheable
+def sorted_list_benchmark_demo():
+    """Time keeping a list sorted: re-sorting, bisect.insort and SortedList."""
+    print_subsection_header("Benchmark: Staying Sorted")
+
+    print("⏱️  Keeping a list sorted while inserting (µs per insert):")
+    for size, timings in benchmark_sorted_inserts().items():
+        print(f"  n={size:,}")
+        for method, seconds in timings.items():
+            if "per insert" in method:
+                print(f"    {method:<30} {seconds * 1e6:>10.1f} µs")
+            else:
+                print(f"    {method:<30} {seconds:>10.4f} s")
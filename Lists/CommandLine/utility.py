@@ -1,22 +1,24 @@
+import os
+import sys
+
+# Buffered rendering, output modes and the section cache are shared by every
+# CommandLine guide (guide_sections.py at the repository root)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir))
+from guide_sections import (OUTPUT_MODES, run_example, set_output_mode, is_plain_output,
+                            non_cacheable, configure_section_cache, section_fingerprint,
+                            render_section, reset_section_timings, report_section_timings,
+                            failed_sections, parse_guide_args)
+
 def print_section_header(title, char="=", width=80):
     """Print a formatted section header."""
-    print("\n" + char * width)
-    print(f" {title} ".center(width, char))
-    print(char * width)
+    line = char * width
+    print(f"\n{line}\n{f' {title} '.center(width, char)}\n{line}")
 
 def print_subsection_header(title, char="-", width=60):
     """Print a formatted subsection header."""
-    print("\n" + char * width)
-    print(f" {title} ")
-    print(char * width)
-
-def run_example(example_func):
-    """Run an example function and handle any errors."""
-    try:
-        example_func()
-    except Exception as e:
-        print(f"❌ Error running example: {e}")
+    line = char * width
+    print(f"\n{line}\n {title} \n{line}")
 
 def pause_for_user():
     """Pause execution for user to review output."""
-    input("\n🔍 Press Enter to continue to the next section...")
\ No newline at end of file
+    input("\n🔍 Press Enter to continue to the next section...")
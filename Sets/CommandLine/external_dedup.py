@@ -0,0 +1,263 @@
+"""
+BOUNDED-MEMORY ORDER-PRESERVING DEDUPLICATION
+=============================================
+
+The classic order-preserving dedup loop
+
+    seen = set()
+    for item in seq:
+        if item not in seen:
+            seen.add(item)
+            yield item
+
+keeps every distinct item in memory. When the distinct items do not fit in RAM this
+module spills to disk instead:
+
+    1. Partition - tag each record with its position and append it to one of P temporary
+       files chosen by hash(key). Equal keys always land in the same partition.
+    2. Reduce    - load one partition at a time (each is ~1/P of the data), keep the first
+       occurrence of every key and write the survivors back sorted by position. A
+       partition holding more distinct keys than the budget is re-partitioned with a
+       different hash salt and reduced piece by piece, so memory stays bounded however
+       large the input is.
+    3. Merge     - k-way merge the sorted survivor files by position with heapq.merge,
+       which restores the original order. At most 64 files are open at once: when
+       re-partitioning left more, they are merged in rounds of 64 into intermediate
+       runs on disk first. Every file is written in batches of
+       max_items_in_memory // 64 records (at most 10,000), so the open readers together
+       hold no more than the memory budget.
+
+Inputs that fit within the budget never touch the disk and use the in-memory loop.
+
+Run this file directly to see a demonstration and a benchmark.
+"""
+
+import heapq
+import os
+import pickle
+import random
+import tempfile
+import time
+
+_BATCH_SIZE = 10_000
+_MAX_FAN_IN = 64       # files open at once while partitioning or merging
+_MAX_SPLIT_DEPTH = 8   # keys whose hashes collide cannot be split any further
+
+
+def _bucket(marker, depth, count):
+    """Partition index for `marker`; depth > 0 re-mixes the hash with a new salt."""
+    if not depth:
+        return hash(marker) % count
+    mixed = ((hash(marker) ^ (depth * 0x9E3779B97F4A7C15)) * 0xBF58476D1CE4E5B9) & (2**64 - 1)
+    return (mixed >> 32) % count
+
+
+def _write_batch(handle, batch):
+    pickle.dump(batch, handle, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _write_records(path, records, batch_size):
+    """Write records to a new file in batches of batch_size."""
+    with open(path, "wb") as handle:
+        batch = []
+        for record in records:
+            batch.append(record)
+            if len(batch) >= batch_size:
+                _write_batch(handle, batch)
+                batch = []
+        if batch:
+            _write_batch(handle, batch)
+
+
+def _position(record):
+    return record[0]
+
+
+def _read_batches(path):
+    """Yield records from a file written with _write_batch, one batch in memory at a time."""
+    with open(path, "rb") as handle:
+        while True:
+            try:
+                batch = pickle.load(handle)
+            except EOFError:
+                return
+            yield from batch
+
+
+def _dedup_in_memory(items, key):
+    seen = set()
+    for item in items:
+        marker = key(item) if key else item
+        if marker not in seen:
+            seen.add(marker)
+            yield item
+
+
+def dedup_ordered(iterable, key=None, max_items_in_memory=1_000_000, partitions=None,
+                  temp_dir=None):
+    """Yield the first occurrence of every distinct item, in original order.
+
+    Parameters:
+        iterable: any iterable of picklable, hashable items (or items whose `key` is
+            hashable).
+        key: optional function computing the identity used for deduplication.
+        max_items_in_memory: memory budget expressed as a number of records. Inputs no
+            larger than this are deduplicated entirely in memory.
+        partitions: number of spill files (default 64). Each partition is reduced on its
+            own; one that still exceeds max_items_in_memory is split again into this many
+            files, so choosing roughly total_records / max_items_in_memory only saves work.
+        temp_dir: directory for spill files (defaults to the system temp directory).
+    """
+    iterator = iter(iterable)
+    head = []
+    for item in iterator:
+        head.append(item)
+        if len(head) > max_items_in_memory:
+            break
+    else:
+        yield from _dedup_in_memory(head, key)
+        return
+
+    yield from _dedup_external(head, iterator, key, max_items_in_memory, partitions,
+                               temp_dir)
+
+
+def _partition(records, paths, key, depth, batch_size):
+    """Hash-partition (position, item) records into the files at `paths`."""
+    count = len(paths)
+    handles = [open(path, "wb") for path in paths]
+    buffers = [[] for _ in range(count)]
+    try:
+        for record in records:
+            marker = key(record[1]) if key else record[1]
+            index = _bucket(marker, depth, count)
+            buffer = buffers[index]
+            buffer.append(record)
+            if len(buffer) >= batch_size:
+                _write_batch(handles[index], buffer)
+                buffers[index] = []
+        for handle, buffer in zip(handles, buffers):
+            if buffer:
+                _write_batch(handle, buffer)
+    finally:
+        for handle in handles:
+            handle.close()
+
+
+def _reduce(path, key, max_items_in_memory, fanout, batch_size, depth=0):
+    """Keep the first occurrence per key in one partition; return sorted survivor files.
+
+    If the partition holds more than max_items_in_memory distinct keys, it is split
+    into `fanout` smaller partitions with a hash salted by `depth` and each is reduced
+    in turn.
+    """
+    first_seen = {}
+    for pos, item in _read_batches(path):
+        marker = key(item) if key else item
+        if marker not in first_seen:
+            if len(first_seen) >= max_items_in_memory and depth < _MAX_SPLIT_DEPTH:
+                break
+            first_seen[marker] = (pos, item)
+    else:
+        os.remove(path)
+        survivors = sorted(first_seen.values(), key=_position)
+        del first_seen
+        sorted_path = path + ".sorted"
+        _write_records(sorted_path, survivors, batch_size)
+        return [sorted_path]
+
+    del first_seen
+    sub_paths = [f"{path}.{i}" for i in range(fanout)]
+    _partition(_read_batches(path), sub_paths, key, depth + 1, batch_size)
+    os.remove(path)
+    sorted_paths = []
+    for sub_path in sub_paths:
+        sorted_paths.extend(_reduce(sub_path, key, max_items_in_memory, fanout, batch_size,
+                                    depth + 1))
+    return sorted_paths
+
+
+def _merge_runs(paths, batch_size):
+    """Merge sorted runs in rounds of at most _MAX_FAN_IN files until few enough remain."""
+    while len(paths) > _MAX_FAN_IN:
+        merged = []
+        for i in range(0, len(paths), _MAX_FAN_IN):
+            group = paths[i:i + _MAX_FAN_IN]
+            if len(group) == 1:
+                merged.extend(group)
+                continue
+            run_path = group[0] + ".merged"
+            _write_records(run_path, heapq.merge(*map(_read_batches, group), key=_position),
+                           batch_size)
+            for path in group:
+                os.remove(path)
+            merged.append(run_path)
+        paths = merged
+    return paths
+
+
+def _dedup_external(head, rest, key, max_items_in_memory, partitions, temp_dir):
+    if partitions is None:
+        partitions = 64
+    partitions = max(2, partitions)
+    # Up to max(partitions, _MAX_FAN_IN) batches are buffered or open at the same time
+    batch_size = max(1, min(_BATCH_SIZE, max_items_in_memory // max(partitions, _MAX_FAN_IN)))
+    with tempfile.TemporaryDirectory(dir=temp_dir, prefix="dedup_") as workdir:
+        # Pass 1: hash-partition (position, item) records to disk
+        paths = [os.path.join(workdir, f"part_{i}.pkl") for i in range(partitions)]
+
+        def tagged():
+            position = 0
+            for source in (head, rest):
+                for item in source:
+                    yield position, item
+                    position += 1
+                if source is head:
+                    head.clear()
+
+        _partition(tagged(), paths, key, 0, batch_size)
+
+        # Pass 2: keep the first occurrence per key within each partition
+        sorted_paths = []
+        for path in paths:
+            sorted_paths.extend(_reduce(path, key, max_items_in_memory, partitions, batch_size))
+
+        # Pass 3: merge partitions back into original order using the position tags,
+        # first in bounded rounds if re-partitioning left more than _MAX_FAN_IN files
+        streams = [_read_batches(path) for path in _merge_runs(sorted_paths, batch_size)]
+        for _, item in heapq.merge(*streams, key=_position):
+            yield item
+
+
+def external_dedup_demo():
+    """Show bounded-memory dedup on the guide's example."""
+    original_list = [1, 3, 2, 3, 1, 4, 2, 5]
+    print(f"Original: {original_list}")
+    print(f"dedup_ordered (in memory): {list(dedup_ordered(original_list))}")
+    print(f"dedup_ordered (forced spill): "
+          f"{list(dedup_ordered(original_list, max_items_in_memory=3, partitions=4))}")
+
+
+def external_dedup_benchmark_demo():
+    """Time dict.fromkeys against dedup_ordered spilling to disk on 500,000 emails."""
+    rng = random.Random(42)
+    records = [f"user{rng.randrange(200_000)}@example.com" for _ in range(500_000)]
+
+    start = time.perf_counter()
+    expected = list(dict.fromkeys(records))
+    memory_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    spilled = list(dedup_ordered(records, max_items_in_memory=50_000, partitions=16))
+    spill_time = time.perf_counter() - start
+
+    assert spilled == expected
+    print(f"500,000 emails -> {len(spilled):,} unique")
+    print(f"  dict.fromkeys (all in memory):   {memory_time:.3f}s")
+    print(f"  dedup_ordered (50,000 in memory): {spill_time:.3f}s")
+
+
+if __name__ == "__main__":
+    external_dedup_demo()
+    print()
+    external_dedup_benchmark_demo()
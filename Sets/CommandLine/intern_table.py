@@ -0,0 +1,167 @@
+"""
+INTERNING CACHE FOR FROZENSET AND TUPLE KEYS
+============================================
+
+The sets guide uses frozensets as dictionary keys and the tuples guide uses (x, y) tuple
+keys. When data is loaded from files or the network, the same key value is rebuilt as a
+separate object every time it appears - a million equal frozensets cost a million times
+the memory of one.
+
+InternTable performs hash-consing: intern(value) returns one canonical instance per
+distinct value, so callers can drop their own copy and share the canonical one.
+
+Eviction differs by type, because CPython only supports weak references to some types:
+
+    frozenset - held weakly (WeakKeyDictionary); an entry disappears as soon as the
+                last outside reference to the canonical instance is dropped
+    tuple     - tuples cannot be weakly referenced, so they are held strongly and
+                swept periodically: entries whose reference count shows that only the
+                table itself holds them are removed (CPython-specific)
+
+Run this file directly to see a demonstration and a memory report.
+"""
+
+import random
+import sys
+import tracemalloc
+import weakref
+
+
+def _table_only_refcount():
+    """Reference count of a key held only as a dict key and value, seen from sweep()."""
+    table = {}
+    key = tuple([object()])
+    table[key] = key
+    del key
+    for key in table:
+        return sys.getrefcount(key) - 1  # minus the loop variable
+
+
+_TABLE_ONLY_REFCOUNT = _table_only_refcount()
+
+
+class InternTable:
+    """Return one canonical instance per distinct frozenset or tuple value."""
+
+    def __init__(self, sweep_threshold=100_000):
+        self._frozensets = weakref.WeakKeyDictionary()
+        self._tuples = {}
+        self._next_sweep = sweep_threshold
+        self._sweep_threshold = sweep_threshold
+        self.hits = 0
+        self.misses = 0
+
+    def intern(self, value):
+        """Return the canonical instance equal to `value`, registering it if new."""
+        if isinstance(value, frozenset):
+            ref = self._frozensets.get(value)
+            canonical = ref() if ref is not None else None
+            if canonical is None:
+                self._frozensets[value] = weakref.ref(value)
+                self.misses += 1
+                return value
+            self.hits += 1
+            return canonical
+
+        if isinstance(value, tuple):
+            canonical = self._tuples.get(value)
+            if canonical is None:
+                self._tuples[value] = value
+                self.misses += 1
+                if len(self._tuples) >= self._next_sweep:
+                    self.sweep()
+                return value
+            self.hits += 1
+            return canonical
+
+        raise TypeError(f"Can only intern frozenset or tuple values, not {type(value).__name__}")
+
+    __call__ = intern
+
+    def sweep(self):
+        """Drop tuple entries referenced by nothing but the table; return how many."""
+        dead = [key for key in self._tuples
+                if sys.getrefcount(key) - 1 <= _TABLE_ONLY_REFCOUNT]
+        for key in dead:
+            del self._tuples[key]
+        del dead
+        self._next_sweep = max(self._sweep_threshold, 2 * len(self._tuples))
+        return len(self._tuples)
+
+    def __len__(self):
+        return len(self._frozensets) + len(self._tuples)
+
+    def stats(self):
+        """Return a dictionary of lookup counters and current table sizes."""
+        return {"hits": self.hits, "misses": self.misses,
+                "frozensets": len(self._frozensets), "tuples": len(self._tuples)}
+
+
+# =============================================================================
+# MEMORY REPORT
+# =============================================================================
+
+def _measure(build):
+    """Return (result, bytes allocated and still live) for build()."""
+    tracemalloc.start()
+    try:
+        result = build()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, current
+
+
+def memory_report(num_records=200_000, distinct=1_000, seed=42):
+    """Measure memory of repeated frozenset and tuple keys with and without interning.
+
+    Each record rebuilds its key from scratch, as a parser would. Returns a dictionary
+    of (plain_bytes, interned_bytes) pairs keyed by workload name.
+    """
+    rng = random.Random(seed)
+    tags = [f"tag{i}" for i in range(50)]
+    tag_sets = [rng.sample(tags, rng.randint(2, 6)) for _ in range(distinct)]
+    picks = [rng.randrange(distinct) for _ in range(num_records)]
+    points = [(rng.randrange(1000), rng.randrange(1000)) for _ in range(distinct)]
+
+    report = {}
+    _, plain = _measure(lambda: [frozenset(tag_sets[i]) for i in picks])
+    table = InternTable()
+    _, interned = _measure(lambda: [table.intern(frozenset(tag_sets[i])) for i in picks])
+    report["frozenset tag keys"] = (plain, interned)
+
+    _, plain = _measure(lambda: [tuple(list(points[i])) for i in picks])
+    table = InternTable()
+    _, interned = _measure(lambda: [table.intern(tuple(list(points[i]))) for i in picks])
+    report["(x, y) tuple keys"] = (plain, interned)
+    return report
+
+
+def intern_table_demo():
+    """Show that equal keys are interned to one canonical instance."""
+    table = InternTable()
+    key_a = table.intern(frozenset(["x", "y"]))
+    key_b = table.intern(frozenset(["y", "x"]))
+    print(f"Two equal frozensets interned -> same object? {key_a is key_b}")
+
+    point_a = table.intern(tuple([3, 4]))
+    point_b = table.intern(tuple([3, 4]))
+    print(f"Two equal tuples interned -> same object? {point_a is point_b}")
+    print(f"Table stats: {table.stats()}")
+
+    del key_a, key_b
+    print(f"After dropping the frozenset references: {table.stats()['frozensets']} frozensets held")
+
+
+def intern_table_benchmark_demo():
+    """Measure the memory saved by interning repeated keys (traced with tracemalloc)."""
+    print("Memory for 200,000 records drawn from 1,000 distinct keys:")
+    for workload, (plain, interned) in memory_report().items():
+        print(f"  {workload:<20} plain: {plain / 1e6:6.2f} MB  interned: {interned / 1e6:6.2f} MB  "
+              f"({plain / interned:.1f}x smaller)")
+
+
+if __name__ == "__main__":
+    intern_table_demo()
+    print()
+    intern_table_benchmark_demo()
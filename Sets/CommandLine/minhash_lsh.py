@@ -0,0 +1,231 @@
+"""
+MINHASH / LSH NEAR-DUPLICATE DETECTION
+======================================
+
+The sets guide compares tag sets, survey responses and store products with exact
+operators. Finding *similar* sets among millions by computing the Jaccard similarity
+
+    len(a & b) / len(a | b)
+
+for every pair is quadratic. This module provides the standard two-step shortcut:
+
+    MinHasher  - turns each set into a short signature of `num_perm` integers. The
+                 fraction of positions where two signatures agree estimates their
+                 Jaccard similarity.
+    LSHIndex   - splits signatures into `bands` of `rows` values and buckets each band.
+                 Sets sharing any bucket become candidate pairs; pairs similar above
+                 the threshold collide with high probability, dissimilar ones rarely.
+
+Signatures can be computed across processes. Item hashing uses blake2b over str(item)
+so signatures agree between processes regardless of PYTHONHASHSEED.
+
+Run this file directly to see a demonstration and accuracy/speed benchmarks.
+"""
+
+import hashlib
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def _stable_hash(item):
+    """64-bit hash of str(item) that is identical in every process."""
+    return int.from_bytes(hashlib.blake2b(str(item).encode(), digest_size=8).digest(), "little")
+
+
+def jaccard(a, b):
+    """Exact Jaccard similarity of two sets."""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class MinHasher:
+    """Compute MinHash signatures using `num_perm` universal hash functions."""
+
+    def __init__(self, num_perm=128, seed=1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.seed = seed
+        self._params = [(rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+                        for _ in range(num_perm)]
+
+    def signature(self, items):
+        """Return the signature of one set as a tuple of `num_perm` ints."""
+        hashes = [_stable_hash(item) for item in items]
+        if not hashes:
+            return (_MAX_HASH,) * self.num_perm
+        prime, mask = _MERSENNE_PRIME, _MAX_HASH
+        return tuple(min(((a * h + b) % prime) & mask for h in hashes)
+                     for a, b in self._params)
+
+    def signatures(self, sets, workers=None, chunksize=256):
+        """Return signatures for many sets, optionally using a process pool."""
+        sets = list(sets)
+        if not workers or workers <= 1:
+            return [self.signature(s) for s in sets]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self.signature, sets, chunksize=chunksize))
+
+    @staticmethod
+    def estimate(sig_a, sig_b):
+        """Estimate Jaccard similarity from two signatures."""
+        return sum(x == y for x, y in zip(sig_a, sig_b)) / len(sig_a)
+
+
+def choose_bands(num_perm, threshold):
+    """Pick (bands, rows) with bands * rows <= num_perm whose S-curve midpoint
+    (1 / bands) ** (1 / rows) lies closest to `threshold`."""
+    best = None
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        midpoint = (1 / bands) ** (1 / rows)
+        error = abs(midpoint - threshold)
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+
+class LSHIndex:
+    """Band-bucketed index returning candidate pairs above a similarity threshold."""
+
+    def __init__(self, threshold=0.5, num_perm=128, bands=None, rows=None):
+        if bands is None or rows is None:
+            bands, rows = choose_bands(num_perm, threshold)
+        if bands * rows > num_perm:
+            raise ValueError("bands * rows must not exceed num_perm")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = rows
+        self._buckets = [{} for _ in range(bands)]
+        self._signatures = {}
+
+    def insert(self, key, signature):
+        """Add a keyed signature to the index."""
+        if key in self._signatures:
+            raise ValueError(f"Duplicate key: {key!r}")
+        self._signatures[key] = signature
+        rows = self.rows
+        for band, buckets in enumerate(self._buckets):
+            band_key = signature[band * rows:(band + 1) * rows]
+            buckets.setdefault(band_key, []).append(key)
+
+    def query(self, signature):
+        """Return keys sharing at least one band bucket with `signature`."""
+        rows = self.rows
+        found = set()
+        for band, buckets in enumerate(self._buckets):
+            found.update(buckets.get(signature[band * rows:(band + 1) * rows], ()))
+        return found
+
+    def candidate_pairs(self, verify=True):
+        """Return the set of (key_a, key_b) candidate pairs.
+
+        With `verify` the pairs are filtered by their estimated similarity, which
+        removes most false positives at the cost of one signature comparison each.
+        """
+        pairs = set()
+        for buckets in self._buckets:
+            for members in buckets.values():
+                if len(members) > 1:
+                    pairs.update(combinations(members, 2))
+        if verify:
+            signatures = self._signatures
+            pairs = {(a, b) for a, b in pairs
+                     if MinHasher.estimate(signatures[a], signatures[b]) >= self.threshold}
+        return pairs
+
+    def __len__(self):
+        return len(self._signatures)
+
+
+def find_similar_pairs(sets, threshold=0.5, num_perm=128, workers=None):
+    """Return candidate pairs of indexes into `sets` with similarity >= threshold."""
+    hasher = MinHasher(num_perm)
+    index = LSHIndex(threshold, num_perm)
+    for i, signature in enumerate(hasher.signatures(sets, workers=workers)):
+        index.insert(i, signature)
+    return index.candidate_pairs()
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+def _synthetic_sets(num_sets, seed=42):
+    """Random tag sets where about a fifth are near-copies of an earlier set."""
+    rng = random.Random(seed)
+    vocabulary = [f"tag{i}" for i in range(5000)]
+    sets = []
+    for _ in range(num_sets):
+        if sets and rng.random() < 0.2:
+            base = set(rng.choice(sets))
+            for tag in rng.sample(sorted(base), max(1, len(base) // 10)):
+                base.discard(tag)
+                base.add(rng.choice(vocabulary))
+            sets.append(base)
+        else:
+            sets.append(set(rng.sample(vocabulary, rng.randint(20, 40))))
+    return sets
+
+
+def benchmark_minhash(num_sets=1000, threshold=0.6, num_perm=128):
+    """Compare exact pairwise Jaccard against MinHash/LSH on synthetic tag sets.
+
+    Returns a dictionary with timings and precision/recall of the LSH result.
+    """
+    sets = _synthetic_sets(num_sets)
+
+    start = time.perf_counter()
+    exact = {(i, j) for i, j in combinations(range(num_sets), 2)
+             if jaccard(sets[i], sets[j]) >= threshold}
+    exact_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    found = find_similar_pairs(sets, threshold, num_perm)
+    lsh_time = time.perf_counter() - start
+
+    true_positives = len(found & exact)
+    return {
+        "pairs": len(exact),
+        "exact_seconds": exact_time,
+        "lsh_seconds": lsh_time,
+        "precision": true_positives / len(found) if found else 1.0,
+        "recall": true_positives / len(exact) if exact else 1.0,
+    }
+
+
+def minhash_lsh_demo():
+    """Show MinHash estimates and LSH banding on the guide's tag sets."""
+    post1_tags = {"python", "programming", "tutorial"}
+    post2_tags = {"python", "data-science", "pandas"}
+    post3_tags = {"python", "programming", "tutorial", "beginner"}
+
+    hasher = MinHasher(num_perm=128)
+    sig1, sig2, sig3 = (hasher.signature(tags) for tags in (post1_tags, post2_tags, post3_tags))
+    print(f"post1 vs post2: exact {jaccard(post1_tags, post2_tags):.2f}, "
+          f"estimated {MinHasher.estimate(sig1, sig2):.2f}")
+    print(f"post1 vs post3: exact {jaccard(post1_tags, post3_tags):.2f}, "
+          f"estimated {MinHasher.estimate(sig1, sig3):.2f}")
+
+    index = LSHIndex(threshold=0.6, num_perm=128)
+    print(f"LSH with threshold 0.6 uses {index.bands} bands x {index.rows} rows")
+
+
+def minhash_lsh_benchmark_demo():
+    """Compare exact pairwise Jaccard with MinHash + LSH for speed and accuracy."""
+    print("Benchmark on 1,000 synthetic tag sets (threshold 0.6):")
+    result = benchmark_minhash()
+    print(f"  Exact pairwise Jaccard: {result['exact_seconds']:.2f}s ({result['pairs']} pairs)")
+    print(f"  MinHash + LSH:          {result['lsh_seconds']:.2f}s "
+          f"(precision {result['precision']:.2f}, recall {result['recall']:.2f})")
+
+
+if __name__ == "__main__":
+    minhash_lsh_demo()
+    print()
+    minhash_lsh_benchmark_demo()
@@ -0,0 +1,183 @@
+"""
+MULTI-WAY INTERSECTION AND UNION
+================================
+
+The sets guide finds common elements with
+
+    set(list1) & set(list2) & set(list3)
+
+which builds a full set from every list, even when one of them holds only a handful of
+items and the answer can never be larger than that.
+
+This module offers:
+
+    intersect_all(*iterables)   - size-ordered intersection that builds a set only from
+                                  the smallest input, probes the others against it and
+                                  stops as soon as the result is empty
+    union_all(*iterables)       - union that starts from the largest input
+    sorted_intersect(*sorted)   - streaming merge intersection for already sorted inputs;
+                                  never builds a set and works on iterators
+    sorted_union(*sorted)       - streaming, de-duplicated merge of sorted inputs
+
+Run this file directly to see a demonstration and benchmarks on skewed sizes.
+"""
+
+import heapq
+import random
+import time
+
+
+def _size(iterable):
+    """Best-effort size used for ordering; unsized iterables sort last."""
+    try:
+        return len(iterable)
+    except TypeError:
+        return float("inf")
+
+
+def intersect_all(*iterables):
+    """Return the set of items present in every iterable.
+
+    The smallest input becomes the working set. Each larger input is then streamed
+    through set.intersection, which only keeps items already in the working set, so
+    large lists are never converted to sets. Returns an empty set as soon as the
+    working set runs dry.
+    """
+    if not iterables:
+        return set()
+    ordered = sorted(iterables, key=_size)
+    result = set(ordered[0])
+    for other in ordered[1:]:
+        if not result:
+            break
+        result = result.intersection(other)
+    return result
+
+
+def union_all(*iterables):
+    """Return the set of items present in any iterable, growing from the largest input."""
+    ordered = sorted(iterables, key=_size, reverse=True)
+    if not ordered:
+        return set()
+    result = set(ordered[0])
+    for other in ordered[1:]:
+        result.update(other)
+    return result
+
+
+def difference_all(first, *others):
+    """Return items of `first` that appear in none of `others`, stopping once empty."""
+    result = set(first)
+    for other in sorted(others, key=_size):
+        if not result:
+            break
+        result.difference_update(other)
+    return result
+
+
+def sorted_intersect(*sorted_iterables):
+    """Yield items present in every sorted iterable, in ascending order.
+
+    Each input must be sorted ascending; duplicates within an input are collapsed.
+    Inputs are consumed lazily, one item at a time, and iteration stops as soon as
+    any input is exhausted.
+    """
+    if not sorted_iterables:
+        return
+    iterators = [iter(it) for it in sorted_iterables]
+    try:
+        heads = [next(it) for it in iterators]
+    except StopIteration:
+        return
+
+    while True:
+        target = max(heads)
+        matched = True
+        for i, it in enumerate(iterators):
+            head = heads[i]
+            while head < target:
+                try:
+                    head = next(it)
+                except StopIteration:
+                    return
+            heads[i] = head
+            if head != target:
+                matched = False
+        if not matched:
+            continue
+        yield target
+        for i, it in enumerate(iterators):
+            head = heads[i]
+            while head == target:
+                try:
+                    head = next(it)
+                except StopIteration:
+                    return
+            heads[i] = head
+
+
+def sorted_union(*sorted_iterables):
+    """Yield the de-duplicated union of sorted iterables, in ascending order."""
+    previous = _MISSING = object()
+    for item in heapq.merge(*sorted_iterables):
+        if previous is _MISSING or item != previous:
+            yield item
+            previous = item
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+def benchmark_intersections(large_size=1_000_000, small_size=10, seed=42):
+    """Time the naive chained `&` against the size-ordered and sorted-merge versions.
+
+    Uses one tiny list and two large lists - the skewed case the naive version handles
+    worst. Returns a dictionary of seconds keyed by method name.
+    """
+    rng = random.Random(seed)
+    large_a = sorted(rng.sample(range(large_size * 4), large_size))
+    large_b = sorted(rng.sample(range(large_size * 4), large_size))
+    small = sorted(rng.sample(large_a, small_size))
+
+    results = {}
+    start = time.perf_counter()
+    expected = set(large_a) & set(large_b) & set(small)
+    results["set(a) & set(b) & set(c)"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ordered = intersect_all(large_a, large_b, small)
+    results["intersect_all"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    merged = list(sorted_intersect(large_a, large_b, small))
+    results["sorted_intersect"] = time.perf_counter() - start
+
+    assert ordered == expected == set(merged)
+    return results
+
+
+def multiway_ops_demo():
+    """Show the multi-way operations on the guide's three lists."""
+    list1 = [1, 2, 3, 4, 5]
+    list2 = [3, 4, 5, 6, 7]
+    list3 = [4, 5, 6, 7, 8]
+
+    print(f"intersect_all: {intersect_all(list1, list2, list3)}")
+    print(f"union_all: {union_all(list1, list2, list3)}")
+    print(f"difference_all (unique to list1): {difference_all(list1, list2, list3)}")
+    print(f"sorted_intersect: {list(sorted_intersect(list1, list2, list3))}")
+    print(f"sorted_union: {list(sorted_union(list1, list2, list3))}")
+
+
+def multiway_ops_benchmark_demo():
+    """Time the intersection strategies on skewed input sizes."""
+    print("Skewed sizes (1,000,000 / 1,000,000 / 10 items):")
+    for method, seconds in benchmark_intersections().items():
+        print(f"  {method:<26} {seconds:.4f}s")
+
+
+if __name__ == "__main__":
+    multiway_ops_demo()
+    print()
+    multiway_ops_benchmark_demo()
@@ -0,0 +1,360 @@
+"""
+ORDERED SET
+===========
+
+The guides use three workarounds when they need unique items in insertion order:
+
+    the seen-set loop        - a set plus a list kept in sync by hand
+    list(dict.fromkeys(seq)) - a dict used only for its ordered keys
+    list(set(seq))           - fast, but loses the order
+
+OrderedSet is a real data structure for the job. It keeps items in a list and maps each
+item to its list position in a dict, giving:
+
+    add / discard / in        O(1)   (discard leaves a tombstone; average O(1))
+    s[i], s.index(item)       O(1)   (O(log n) while tombstones sit mid-list)
+    pop() / pop(last=False)   O(1)   (average)
+
+Tombstones are compacted away only once they outnumber the live items, so a run of
+deletions interleaved with lookups stays linear overall.
+    union / intersection /
+    difference                order-preserving, like the set operators
+
+Run this file directly to see a demonstration and benchmarks.
+"""
+
+import random
+import time
+from collections.abc import MutableSet, Sequence
+
+_DELETED = object()
+
+
+class _LiveCounts:
+    """Fenwick tree over OrderedSet slots: 1 for a live item, 0 for a tombstone.
+
+    Counts the live items before a slot, and finds the slot of the k-th live item, in
+    O(log n), so lookups neither scan past tombstones nor compact.
+    """
+
+    __slots__ = ("_tree",)
+
+    def __init__(self, items):
+        tree = [0] + [0 if item is _DELETED else 1 for item in items]
+        size = len(tree)
+        for i in range(1, size):
+            parent = i + (i & -i)
+            if parent < size:
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def append(self, live=1):
+        # Node i covers slots (i - lowbit(i), i]; its children are i-1, i-2, i-4, ...
+        tree = self._tree
+        i = len(tree)
+        lowbit = i & -i
+        step = 1
+        while step < lowbit:
+            live += tree[i - step]
+            step <<= 1
+        tree.append(live)
+
+    def truncate(self, size):
+        """Forget every slot from `size` on (a node only covers slots before it)."""
+        del self._tree[size + 1:]
+
+    def remove(self, position):
+        tree = self._tree
+        i = position + 1
+        while i < len(tree):
+            tree[i] -= 1
+            i += i & -i
+
+    def rank(self, position):
+        """Number of live items in slots [0, position)."""
+        tree = self._tree
+        total = 0
+        while position:
+            total += tree[position]
+            position -= position & -position
+        return total
+
+    def select(self, k):
+        """Slot holding the k-th (0-based) live item."""
+        tree = self._tree
+        position = 0
+        bit = 1 << ((len(tree) - 1).bit_length() - 1)
+        while bit:
+            step = position + bit
+            if step < len(tree) and tree[step] <= k:
+                position = step
+                k -= tree[step]
+            bit >>= 1
+        return position
+
+
+class OrderedSet(MutableSet, Sequence):
+    """A set that remembers insertion order and supports index access."""
+
+    __slots__ = ("_items", "_positions", "_holes", "_head", "_live")
+
+    def __init__(self, iterable=()):
+        # Bulk path: dict.fromkeys dedups in C, then positions are numbered in one pass
+        self._items = list(dict.fromkeys(iterable))
+        self._positions = dict(zip(self._items, range(len(self._items))))
+        self._holes = 0
+        self._head = 0  # leading tombstones: _items[_head] is the first live item
+        self._live = None  # _LiveCounts, built on the first lookup past mid-list tombstones
+
+    # -- core set protocol -------------------------------------------------
+
+    def __contains__(self, item):
+        return item in self._positions
+
+    def __len__(self):
+        return len(self._positions)
+
+    def __iter__(self):
+        if self._holes:
+            return (item for item in self._items if item is not _DELETED)
+        return iter(self._items)
+
+    def __reversed__(self):
+        return (item for item in reversed(self._items) if item is not _DELETED)
+
+    def add(self, item):
+        """Add an item to the end if it is not already present."""
+        if item not in self._positions:
+            self._positions[item] = len(self._items)
+            self._items.append(item)
+            if self._live is not None:
+                self._live.append()
+
+    def discard(self, item):
+        """Remove an item if present, leaving a tombstone that is compacted later."""
+        position = self._positions.pop(item, None)
+        if position is None:
+            return
+        items = self._items
+        if not self._positions:
+            self.clear()
+        elif position == len(items) - 1:
+            # Trailing tombstones are trimmed too, so _items[-1] is always live
+            items.pop()
+            while items[-1] is _DELETED:
+                items.pop()
+                self._holes -= 1
+            if self._live is not None:
+                self._live.truncate(len(items))
+        else:
+            items[position] = _DELETED
+            self._holes += 1
+            if self._live is not None:
+                self._live.remove(position)
+            if position == self._head:
+                while items[self._head] is _DELETED:
+                    self._head += 1
+            if self._holes > len(self._positions):
+                self._compact()
+
+    def pop(self, last=True):
+        """Remove and return the last (or first) item."""
+        if not self._positions:
+            raise KeyError("pop from an empty OrderedSet")
+        item = self._items[-1] if last else self._items[self._head]
+        self.discard(item)
+        return item
+
+    def clear(self):
+        self._items.clear()
+        self._positions.clear()
+        self._holes = 0
+        self._head = 0
+        self._live = None
+
+    def _compact(self):
+        """Drop tombstones and renumber positions."""
+        self._items = [item for item in self._items if item is not _DELETED]
+        self._positions = {item: i for i, item in enumerate(self._items)}
+        self._holes = 0
+        self._head = 0
+        self._live = None
+
+    # -- sequence protocol -------------------------------------------------
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return OrderedSet(list(self)[index])
+        size = len(self._positions)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("OrderedSet index out of range")
+        if self._holes == self._head:
+            # Only leading tombstones (or none): the live items are contiguous
+            return self._items[self._head + index]
+        return self._items[self._live_counts().select(index)]
+
+    def index(self, item):
+        """Return the position of an item, raising ValueError if it is missing."""
+        position = self._positions.get(item)
+        if position is None:
+            raise ValueError(f"{item!r} is not in OrderedSet")
+        if self._holes == self._head:
+            return position - self._head
+        return self._live_counts().rank(position)
+
+    def _live_counts(self):
+        if self._live is None:
+            self._live = _LiveCounts(self._items)
+        return self._live
+
+    # -- order-preserving set algebra --------------------------------------
+
+    def union(self, *others):
+        """Items of self followed by new items from each other, in order."""
+        result = OrderedSet(self)
+        for other in others:
+            for item in other:
+                result.add(item)
+        return result
+
+    def intersection(self, *others):
+        """Items of self (in self's order) present in every other."""
+        lookups = [other if isinstance(other, (set, frozenset, OrderedSet, dict)) else set(other)
+                   for other in others]
+        return OrderedSet(item for item in self if all(item in other for other in lookups))
+
+    def difference(self, *others):
+        """Items of self (in self's order) present in no other."""
+        lookups = [other if isinstance(other, (set, frozenset, OrderedSet, dict)) else set(other)
+                   for other in others]
+        return OrderedSet(item for item in self if not any(item in other for other in lookups))
+
+    def symmetric_difference(self, other):
+        """Items in exactly one of self and other; self's items first."""
+        other = other if isinstance(other, OrderedSet) else OrderedSet(other)
+        return self.difference(other).union(other.difference(self))
+
+    def update(self, *others):
+        for other in others:
+            for item in other:
+                self.add(item)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+    __xor__ = symmetric_difference
+
+    # Reflected operators keep the left operand's order: {1, 2} | OrderedSet([3])
+    # gives OrderedSet([1, 2, 3]), not the Set mixin's OrderedSet([3, 1, 2]).
+    def __ror__(self, other):
+        return OrderedSet(other).union(self)
+
+    def __rand__(self, other):
+        return OrderedSet(item for item in other if item in self._positions)
+
+    def __rsub__(self, other):
+        return OrderedSet(item for item in other if item not in self._positions)
+
+    def __rxor__(self, other):
+        return OrderedSet(other).symmetric_difference(self)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    # -- misc ----------------------------------------------------------------
+
+    def copy(self):
+        return OrderedSet(self)
+
+    def __eq__(self, other):
+        if isinstance(other, OrderedSet):
+            return len(self) == len(other) and list(self) == list(other)
+        if isinstance(other, (set, frozenset)):
+            return self._positions.keys() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"OrderedSet({list(self)!r})"
+
+    def __getstate__(self):
+        return list(self)
+
+    def __setstate__(self, state):
+        self._items = []
+        self._positions = {}
+        self._holes = 0
+        self._head = 0
+        self._live = None
+        self.update(state)
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+def remove_duplicates_ordered(seq):
+    """The seen-set loop from the sets guide, kept here as the benchmark baseline."""
+    seen = set()
+    result = []
+    for item in seq:
+        if item not in seen:
+            seen.add(item)
+            result.append(item)
+    return result
+
+
+def benchmark_ordered_dedup(size=500_000, distinct=100_000, seed=42):
+    """Time order-preserving dedup with the seen-loop, dict.fromkeys and OrderedSet."""
+    rng = random.Random(seed)
+    data = [rng.randrange(distinct) for _ in range(size)]
+
+    results = {}
+    start = time.perf_counter()
+    expected = remove_duplicates_ordered(data)
+    results["seen-set loop"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    from_keys = list(dict.fromkeys(data))
+    results["dict.fromkeys"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ordered = OrderedSet(data)
+    results["OrderedSet"] = time.perf_counter() - start
+
+    assert expected == from_keys == list(ordered)
+    return results
+
+
+def ordered_set_demo():
+    """Show OrderedSet on the guide's dedup example."""
+    original_list = [1, 3, 2, 3, 1, 4, 2, 5]
+    ordered = OrderedSet(original_list)
+    print(f"OrderedSet({original_list}) -> {ordered}")
+    print(f"ordered[0]: {ordered[0]}, ordered[-1]: {ordered[-1]}, ordered.index(4): {ordered.index(4)}")
+
+    ordered.discard(3)
+    ordered.add(3)
+    print(f"After discard(3) then add(3): {ordered}")
+
+    other = OrderedSet([5, 6, 2, 7])
+    print(f"{ordered} | {other} = {ordered | other}")
+    print(f"{ordered} & {other} = {ordered & other}")
+    print(f"{ordered} - {other} = {ordered - other}")
+
+
+def ordered_set_benchmark_demo():
+    """Time order-preserving dedup with the seen-set loop, dict.fromkeys and OrderedSet."""
+    print("Order-preserving dedup of 500,000 items (100,000 distinct):")
+    for method, seconds in benchmark_ordered_dedup().items():
+        print(f"  {method:<15} {seconds:.4f}s")
+
+
+if __name__ == "__main__":
+    ordered_set_demo()
+    print()
+    ordered_set_benchmark_demo()
@@ -0,0 +1,221 @@
+"""
+BITMASK PERMISSION ENGINE
+=========================
+
+The access control examples in the sets guide store permissions as sets of strings,
+so every check hashes a string and every "missing permissions" diff builds a new set.
+
+This module assigns each permission name a single bit. Roles and users compile down to
+plain integer masks, which turns checks, diffs and role unions into one integer operation:
+
+    "delete_user" in user_permissions       ->  user_mask & DELETE_USER_BIT
+    admin_permissions - user_permissions    ->  admin_mask & ~user_mask
+    admin_roles | editor_roles              ->  admin_mask | editor_mask
+
+Run this file directly to see a demonstration and a benchmark against the set version.
+"""
+
+import random
+import time
+from itertools import compress
+
+
+class PermissionRegistry:
+    """Assign each permission name a bit and translate between names and masks."""
+
+    def __init__(self, names=()):
+        self._bits = {}
+        self._names = []
+        for name in names:
+            self.register(name)
+
+    def register(self, name):
+        """Register a permission name and return its bit (existing names keep theirs)."""
+        bit = self._bits.get(name)
+        if bit is None:
+            bit = 1 << len(self._names)
+            self._bits[name] = bit
+            self._names.append(name)
+        return bit
+
+    def bit(self, name):
+        """Return the bit for a registered permission name."""
+        try:
+            return self._bits[name]
+        except KeyError:
+            raise KeyError(f"Unknown permission: {name!r}") from None
+
+    def compile(self, names):
+        """Compile an iterable of permission names into an integer mask."""
+        mask = 0
+        for name in names:
+            mask |= self.bit(name)
+        return mask
+
+    def names(self, mask):
+        """Expand an integer mask back into a set of permission names."""
+        result = set()
+        index = 0
+        while mask:
+            if mask & 1:
+                result.add(self._names[index])
+            mask >>= 1
+            index += 1
+        return result
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, name):
+        return name in self._bits
+
+    def __iter__(self):
+        return iter(self._names)
+
+
+def has_permission(mask, bit):
+    """Return True if every bit in `bit` is set in `mask`."""
+    return mask & bit == bit
+
+
+def missing_permissions(required, granted):
+    """Return the mask of permissions in `required` that `granted` lacks."""
+    return required & ~granted
+
+
+def combine_roles(*masks):
+    """Union any number of role masks into one mask."""
+    combined = 0
+    for mask in masks:
+        combined |= mask
+    return combined
+
+
+class UserPermissionTable:
+    """Store one compiled mask per user for bulk permission queries.
+
+    Users are identified by their position (0, 1, 2, ...), which keeps the table a
+    flat list of ints rather than a dictionary of sets.
+    """
+
+    def __init__(self, registry, masks=None):
+        self.registry = registry
+        self.masks = list(masks) if masks is not None else []
+
+    def add_user(self, *roles):
+        """Add a user with the union of the given role masks and return its id."""
+        self.masks.append(combine_roles(*roles))
+        return len(self.masks) - 1
+
+    def grant(self, user_id, name):
+        """Grant a single permission to a user."""
+        self.masks[user_id] |= self.registry.bit(name)
+
+    def revoke(self, user_id, name):
+        """Revoke a single permission from a user."""
+        self.masks[user_id] &= ~self.registry.bit(name)
+
+    def can(self, user_id, name):
+        """Check whether a user holds a permission."""
+        bit = self.registry.bit(name)
+        return self.masks[user_id] & bit == bit
+
+    def who_can(self, *names):
+        """Return the ids of all users that hold every one of the given permissions."""
+        required = self.registry.compile(names)
+        return list(compress(range(len(self.masks)),
+                             (mask & required == required for mask in self.masks)))
+
+    def count_who_can(self, *names):
+        """Count users holding every one of the given permissions without listing them."""
+        required = self.registry.compile(names)
+        return sum(1 for mask in self.masks if mask & required == required)
+
+    def __len__(self):
+        return len(self.masks)
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+def benchmark_permissions(num_users=200_000, seed=42):
+    """Compare set-of-strings permissions against compiled masks.
+
+    Returns a dictionary of (set_seconds, mask_seconds) pairs keyed by operation.
+    """
+    rng = random.Random(seed)
+    names = ["read", "write", "delete", "execute", "create_user", "delete_user",
+             "view_logs", "backup_data", "edit_content", "publish_content",
+             "view_analytics", "view_content", "view_public_analytics", "special_feature"]
+    registry = PermissionRegistry(names)
+    admin = {"create_user", "delete_user", "view_logs", "backup_data"}
+    admin_mask = registry.compile(admin)
+
+    user_sets = [set(rng.sample(names, rng.randint(1, len(names)))) for _ in range(num_users)]
+    table = UserPermissionTable(registry, (registry.compile(s) for s in user_sets))
+    delete_bit = registry.bit("delete_user")
+
+    results = {}
+
+    start = time.perf_counter()
+    for perms in user_sets:
+        "delete_user" in perms
+    set_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for mask in table.masks:
+        mask & delete_bit
+    results["single check"] = (set_time, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for perms in user_sets:
+        admin - perms
+    set_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for mask in table.masks:
+        admin_mask & ~mask
+    results["missing diff"] = (set_time, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    set_result = [uid for uid, perms in enumerate(user_sets) if "delete_user" in perms]
+    set_time = time.perf_counter() - start
+    start = time.perf_counter()
+    mask_result = table.who_can("delete_user")
+    results["who can delete_user"] = (set_time, time.perf_counter() - start)
+    assert set_result == mask_result
+
+    return results
+
+
+def bitmask_permissions_demo():
+    """Show the bitmask engine on the guide's permission example."""
+    registry = PermissionRegistry(["read", "write", "delete", "execute"])
+    admin = registry.compile({"read", "write", "delete", "execute"})
+    user = registry.compile({"read", "write"})
+    guest = registry.compile({"read"})
+
+    print(f"Registered permissions: {list(registry)}")
+    print(f"Admin mask: {admin:04b}  User mask: {user:04b}  Guest mask: {guest:04b}")
+    print(f"Can user delete? {has_permission(user, registry.bit('delete'))}")
+    print(f"User missing permissions: {registry.names(missing_permissions(admin, user))}")
+    print(f"User | Guest roles: {registry.names(combine_roles(user, guest))}")
+
+    table = UserPermissionTable(registry)
+    table.add_user(admin)
+    table.add_user(user)
+    table.add_user(guest)
+    print(f"Users who can write: {table.who_can('write')}")
+
+
+def bitmask_permissions_benchmark_demo():
+    """Time the set-based permission checks against the bitmask versions."""
+    print("Benchmark (200,000 users):")
+    for operation, (set_time, mask_time) in benchmark_permissions().items():
+        print(f"  {operation:<22} set: {set_time:.4f}s  mask: {mask_time:.4f}s  "
+              f"({set_time / mask_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    bitmask_permissions_demo()
+    print()
+    bitmask_permissions_benchmark_demo()
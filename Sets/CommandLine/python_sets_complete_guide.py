@@ -11,24 +11,21 @@ This guide is responsive and includes hands-on examples that you can run to see
 import sys
 import os
 
+# Buffered rendering, output modes and the section cache are shared by every
+# CommandLine guide (guide_sections.py at the repository root)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir))
+from guide_sections import (render_section, reset_section_timings, report_section_timings,
+                            failed_sections, parse_guide_args, non_cacheable)
+
 def print_section_header(title, char="=", width=80):
     """Print a formatted section header."""
-    print("\n" + char * width)
-    print(f" {title} ".center(width, char))
-    print(char * width)
+    line = char * width
+    print(f"\n{line}\n{f' {title} '.center(width, char)}\n{line}")
 
 def print_subsection_header(title, char="-", width=60):
     """Print a formatted subsection header."""
-    print("\n" + char * width)
-    print(f" {title} ")
-    print(char * width)
-
-def run_example(example_func):
-    """Run an example function and handle any errors."""
-    try:
-        example_func()
-    except Exception as e:
-        print(f"Error running example: {e}")
+    line = char * width
+    print(f"\n{line}\n {title} \n{line}")
 
 def pause_for_user():
     """Pause execution for user to review output."""
@@ -576,7 +573,17 @@ def advanced_set_techniques():
     # Method 3: Using dict.fromkeys() (Python 3.7+)
     unique_dict_method = list(dict.fromkeys(original_list))
     print(f"Method 3 - dict.fromkeys(): {unique_dict_method}")
-    
+
+    # A dedicated data structure instead of workarounds (see ordered_set.py)
+    print_subsection_header("OrderedSet: Ordered Uniqueness as a Data Structure")
+    from ordered_set import ordered_set_demo
+    ordered_set_demo()
+
+    # Method 4: Bounded memory with disk spill (see external_dedup.py)
+    print_subsection_header("Deduplicating Data Larger Than Memory")
+    from external_dedup import external_dedup_demo
+    external_dedup_demo()
+
     print_subsection_header("Set-based Filtering and Data Analysis")
     
     # Finding common elements across multiple lists
@@ -593,7 +600,12 @@ def advanced_set_techniques():
     unique_to_list1 = set(list1) - set(list2) - set(list3)
     print(f"All elements: {all_elements}")
     print(f"Unique to list1: {unique_to_list1}")
-    
+
+    # Size-ordered and streaming versions (see multiway_ops.py)
+    print_subsection_header("Multi-way Intersection and Union")
+    from multiway_ops import multiway_ops_demo
+    multiway_ops_demo()
+
     print_subsection_header("Practical Applications")
     
     # User permissions example
@@ -613,7 +625,12 @@ def advanced_set_techniques():
     # What permissions does user lack?
     missing_permissions = admin_permissions - user_permissions
     print(f"User missing permissions: {missing_permissions}")
-    
+
+    # Same checks compiled to integer bitmasks (see permission_bitmask.py)
+    print_subsection_header("Bitmask-Compiled Permissions")
+    from permission_bitmask import bitmask_permissions_demo
+    bitmask_permissions_demo()
+
     # Tag system example
     post1_tags = {"python", "programming", "tutorial"}
     post2_tags = {"python", "data-science", "pandas"}
@@ -676,6 +693,11 @@ def frozenset_examples():
     # Accessing values
     key = frozenset(['x', 'y'])
     print(f"Value for {key}: {coordinates.get(key)}")
+
+    # Sharing one instance of each repeated key (see intern_table.py)
+    print_subsection_header("Interning Repeated Frozenset and Tuple Keys")
+    from intern_table import intern_table_demo
+    intern_table_demo()
     
     print_subsection_header("Immutability Demonstration")
     
@@ -768,6 +790,11 @@ def practical_applications():
     # All possible responses
     all_responses = responses_group_a | responses_group_b | responses_group_c
     print(f"All possible responses: {all_responses}")
+
+    # Similar (not just identical) sets at scale (see minhash_lsh.py)
+    print_subsection_header("Near-Duplicate Detection with MinHash/LSH")
+    from minhash_lsh import minhash_lsh_demo
+    minhash_lsh_demo()
     
     print_subsection_header("5. Network and Graph Analysis")
     
@@ -786,6 +813,11 @@ def practical_applications():
     alice_potential = (bob_friends | charlie_friends) - alice_friends - {"alice"}
     print(f"Alice's potential new friends: {alice_potential}")
 
+    # Scaling up: CSR adjacency over integer ids (see friend_graph.py)
+    print_subsection_header("6. Scalable Friend Recommendations")
+    from friend_graph import friend_graph_demo
+    friend_graph_demo()
+
 # =============================================================================
 # 10. PERFORMANCE ANALYSIS
 # =============================================================================
@@ -859,6 +891,53 @@ def performance_analysis():
     """
     print(best_practices)
 
+# =============================================================================
+# BENCHMARKS
+# =============================================================================
+#
+# Timings and memory reports for the data structures introduced in sections
+# 7-9. They are kept out of those sections (which stay cacheable) and out of
+# "all", and run only from menu choice B or with --run B.
+
+@non_cacheable
+def advanced_set_benchmarks():
+    """Time the deduplication, multi-way and bitmask techniques from section 7."""
+    print_section_header("BENCHMARKS: ADVANCED SET TECHNIQUES")
+    from ordered_set import ordered_set_benchmark_demo
+    from external_dedup import external_dedup_benchmark_demo
+    from multiway_ops import multiway_ops_benchmark_demo
+    from permission_bitmask import bitmask_permissions_benchmark_demo
+
+    print_subsection_header("OrderedSet Dedup")
+    ordered_set_benchmark_demo()
+    print_subsection_header("Deduplicating Data Larger Than Memory")
+    external_dedup_benchmark_demo()
+    print_subsection_header("Multi-way Intersection")
+    multiway_ops_benchmark_demo()
+    print_subsection_header("Bitmask-Compiled Permissions")
+    bitmask_permissions_benchmark_demo()
+
+@non_cacheable
+def frozenset_benchmarks():
+    """Measure the memory saved by interning keys (section 8)."""
+    print_section_header("BENCHMARKS: FROZEN SETS")
+    from intern_table import intern_table_benchmark_demo
+
+    print_subsection_header("Interning Repeated Frozenset and Tuple Keys")
+    intern_table_benchmark_demo()
+
+@non_cacheable
+def practical_benchmarks():
+    """Time near-duplicate detection and friend recommendations (section 9)."""
+    print_section_header("BENCHMARKS: PRACTICAL APPLICATIONS")
+    from minhash_lsh import minhash_lsh_benchmark_demo
+    from friend_graph import friend_graph_benchmark_demo
+
+    print_subsection_header("Near-Duplicate Detection with MinHash/LSH")
+    minhash_lsh_benchmark_demo()
+    print_subsection_header("Scalable Friend Recommendations")
+    friend_graph_benchmark_demo()
+
 # =============================================================================
 # MAIN MENU SYSTEM
 # =============================================================================
@@ -880,14 +959,63 @@ def display_menu():
 ║  8. Frozen Sets                                              ║
 ║  9. Practical Applications                                   ║
 ║ 10. Performance Analysis                                     ║
+║  B. Benchmarks (always run, never cached)                    ║
 ║                                                              ║
 ║  0. Exit                                                     ║
 ╚══════════════════════════════════════════════════════════════╝
     """
     print(menu)
 
-def main():
+SECTIONS = {
+    "1": ("Set Basics and Creation", (set_creation_examples, set_properties_examples)),
+    "2": ("Set Operations", (set_operations_examples, set_comparison_examples)),
+    "3": ("Set Methods", (set_methods_examples, set_copy_examples)),
+    "4": ("Set Comprehensions", (set_comprehensions_examples,)),
+    "5": ("Set Iteration Techniques", (set_iteration_examples,)),
+    "6": ("Set vs List vs Tuple Comparison", (comparison_examples,)),
+    "7": ("Advanced Set Techniques", (advanced_set_techniques,)),
+    "8": ("Frozen Sets", (frozenset_examples,)),
+    "9": ("Practical Applications", (practical_applications,)),
+    "10": ("Performance Analysis", (performance_analysis,)),
+}
+
+BENCHMARK_SECTIONS = {
+    "B1": ("Benchmarks: Advanced Set Techniques", (advanced_set_benchmarks,)),
+    "B2": ("Benchmarks: Frozen Sets", (frozenset_benchmarks,)),
+    "B3": ("Benchmarks: Practical Applications", (practical_benchmarks,)),
+}
+
+def run_sections(keys):
+    """Render the sections stored under `keys` in SECTIONS or BENCHMARK_SECTIONS."""
+    for key in keys:
+        title, example_funcs = SECTIONS.get(key) or BENCHMARK_SECTIONS[key]
+        render_section(title, *example_funcs)
+
+def run_headless(selection):
+    """Run the chosen section numbers ('all', 'B' for benchmarks) without prompts, then report timings."""
+    reset_section_timings()
+    keys = []
+    for key in selection:
+        if key.lower() == "all":
+            keys.extend(SECTIONS)
+        elif key.upper() == "B":
+            keys.extend(BENCHMARK_SECTIONS)
+        elif key in SECTIONS:
+            keys.append(key)
+        else:
+            raise SystemExit(f"Unknown section {key!r}; choose from {', '.join(SECTIONS)}, 'all' or 'B'")
+    run_sections(keys)
+    report_section_timings()
+
+def main(argv=None):
     """Main function to run the interactive guide."""
+    args = parse_guide_args(argv)
+    if args.run:
+        run_headless(args.run)
+        if failed_sections():
+            raise SystemExit(1)
+        return
+    
     print_section_header("WELCOME TO PYTHON SETS COMPLETE GUIDE")
     print("This interactive guide will teach you everything about Python sets!")
     print("Each section includes explanations, examples, and hands-on demonstrations.")
@@ -896,37 +1024,20 @@ def main():
         display_menu()
         
         try:
-            choice = input("Enter your choice (0-10): ").strip()
+            choice = input("Enter your choice (0-10, B): ").strip()
             
             if choice == "0":
                 print("\nThank you for using the Python Sets Guide!")
                 print("Happy coding with sets! 🐍✨")
                 break
-            elif choice == "1":
-                run_example(set_creation_examples)
-                run_example(set_properties_examples)
-            elif choice == "2":
-                run_example(set_operations_examples)
-                run_example(set_comparison_examples)
-            elif choice == "3":
-                run_example(set_methods_examples)
-                run_example(set_copy_examples)
-            elif choice == "4":
-                run_example(set_comprehensions_examples)
-            elif choice == "5":
-                run_example(set_iteration_examples)
-            elif choice == "6":
-                run_example(comparison_examples)
-            elif choice == "7":
-                run_example(advanced_set_techniques)
-            elif choice == "8":
-                run_example(frozenset_examples)
-            elif choice == "9":
-                run_example(practical_applications)
-            elif choice == "10":
-                run_example(performance_analysis)
+            elif choice in SECTIONS:
+                run_sections([choice])
+            elif choice.upper() == "B":
+                reset_section_timings()
+                run_sections(BENCHMARK_SECTIONS)
+                report_section_timings()
             else:
-                print("Invalid choice. Please enter a number between 0 and 10.")
+                print("Invalid choice. Please enter a number between 0 and 10, or B.")
                 continue
             
             if choice != "0":
@@ -0,0 +1,181 @@
+"""
+KD-TREE SPATIAL INDEX FOR TUPLE POINTS
+======================================
+
+The tuples guide sorts points by distance from the origin:
+
+    sorted(points, key=lambda p: (p[0]**2 + p[1]**2)**0.5)
+
+which is fine for four points, but answering "which points are nearest to here?" this way
+costs a full O(n log n) sort for every query point.
+
+KDTree indexes (x, y) or (x, y, z) tuples once in O(n log^2 n) and then answers:
+
+    tree.nearest(query, k)        - the k nearest points, in about O(log n + k)
+    tree.within(query, radius)    - every point within a radius
+
+The tree is implicit: points are reordered in a single list so that every subtree is a
+contiguous slice with its splitting point in the middle. There are no node objects, which
+keeps memory at one list slot per point on top of the tuples themselves.
+
+Run this file directly to see a demonstration and a benchmark against sort-everything.
+"""
+
+import heapq
+import math
+import random
+import time
+
+_LEAF_SIZE = 16
+
+
+def _squared_distance(a, b):
+    return sum((x - y) * (x - y) for x, y in zip(a, b))
+
+
+class KDTree:
+    """Static k-d tree over equal-length coordinate tuples."""
+
+    def __init__(self, points, leaf_size=_LEAF_SIZE):
+        self.points = list(points)
+        self.leaf_size = max(1, leaf_size)
+        self.dimensions = len(self.points[0]) if self.points else 0
+        self._build(0, len(self.points), 0)
+
+    def _build(self, lo, hi, depth):
+        """Reorder points[lo:hi] so the median along this depth's axis sits at the middle."""
+        stack = [(lo, hi, depth)]
+        points = self.points
+        while stack:
+            lo, hi, depth = stack.pop()
+            if hi - lo <= self.leaf_size:
+                continue
+            axis = depth % self.dimensions
+            points[lo:hi] = sorted(points[lo:hi], key=lambda p: p[axis])
+            mid = (lo + hi) // 2
+            stack.append((lo, mid, depth + 1))
+            stack.append((mid + 1, hi, depth + 1))
+
+    def __len__(self):
+        return len(self.points)
+
+    def nearest(self, query, k=1):
+        """Return the k nearest points to `query` as a list of (distance, point), closest first."""
+        if k <= 0 or not self.points:
+            return []
+        heap = []  # max-heap of (-squared_distance, tiebreak, point)
+        points, leaf_size, dims = self.points, self.leaf_size, self.dimensions
+        counter = 0
+
+        def visit(lo, hi, depth):
+            nonlocal counter
+            if hi - lo <= leaf_size:
+                for point in points[lo:hi]:
+                    d2 = _squared_distance(point, query)
+                    counter += 1
+                    if len(heap) < k:
+                        heapq.heappush(heap, (-d2, counter, point))
+                    elif d2 < -heap[0][0]:
+                        heapq.heapreplace(heap, (-d2, counter, point))
+                return
+            mid = (lo + hi) // 2
+            split = points[mid]
+            axis = depth % dims
+            diff = query[axis] - split[axis]
+
+            d2 = _squared_distance(split, query)
+            counter += 1
+            if len(heap) < k:
+                heapq.heappush(heap, (-d2, counter, split))
+            elif d2 < -heap[0][0]:
+                heapq.heapreplace(heap, (-d2, counter, split))
+
+            near, far = ((lo, mid), (mid + 1, hi)) if diff < 0 else ((mid + 1, hi), (lo, mid))
+            visit(near[0], near[1], depth + 1)
+            if len(heap) < k or diff * diff < -heap[0][0]:
+                visit(far[0], far[1], depth + 1)
+
+        visit(0, len(points), 0)
+        return [(math.sqrt(-neg_d2), point) for neg_d2, _, point in sorted(heap, reverse=True)]
+
+    def within(self, query, radius):
+        """Return every point within `radius` of `query`, in no particular order."""
+        found = []
+        r2 = radius * radius
+        points, leaf_size, dims = self.points, self.leaf_size, self.dimensions
+        stack = [(0, len(points), 0)]
+        while stack:
+            lo, hi, depth = stack.pop()
+            if hi - lo <= leaf_size:
+                found.extend(p for p in points[lo:hi] if _squared_distance(p, query) <= r2)
+                continue
+            mid = (lo + hi) // 2
+            split = points[mid]
+            axis = depth % dims
+            diff = query[axis] - split[axis]
+            if _squared_distance(split, query) <= r2:
+                found.append(split)
+            if diff <= radius:
+                stack.append((lo, mid, depth + 1))
+            if diff >= -radius:
+                stack.append((mid + 1, hi, depth + 1))
+        return found
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+def benchmark_kd_tree(num_points=200_000, num_queries=100, k=10, seed=42):
+    """Compare k-nearest-neighbour queries against sorting all points per query.
+
+    Returns a dictionary of seconds keyed by step.
+    """
+    rng = random.Random(seed)
+    points = [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(num_points)]
+    queries = [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(num_queries)]
+
+    results = {}
+    start = time.perf_counter()
+    tree = KDTree(points)
+    results["build tree"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    tree_answers = [tree.nearest(q, k) for q in queries]
+    results[f"{num_queries} queries, tree"] = time.perf_counter() - start
+
+    sample = queries[:5]
+    start = time.perf_counter()
+    sort_answers = [sorted(points, key=lambda p: math.dist(p, q))[:k] for q in sample]
+    per_query = (time.perf_counter() - start) / len(sample)
+    results[f"{num_queries} queries, sort-all (est.)"] = per_query * num_queries
+
+    for answer, expected in zip(tree_answers, sort_answers):
+        assert [p for _, p in answer] == expected
+    return results
+
+
+def kd_tree_demo():
+    """Show nearest-neighbour and radius queries on the guide's points."""
+    points = [(3, 2), (1, 4), (5, 1), (2, 3)]
+    tree = KDTree(points)
+    print(f"Points: {points}")
+    print(f"Nearest 2 to origin: {tree.nearest((0, 0), k=2)}")
+    print(f"Nearest to (5, 0): {tree.nearest((5, 0))}")
+    print(f"Within 2.5 of (2, 3): {sorted(tree.within((2, 3), 2.5))}")
+
+    points_3d = [(1, 2, 3), (4, 5, 6), (0, 0, 1), (7, 8, 9)]
+    print(f"3D nearest to origin: {KDTree(points_3d).nearest((0, 0, 0))}")
+
+
+def kd_tree_benchmark_demo():
+    """Time KDTree build and queries against sorting every point."""
+    print("200,000 random 2D points, top-10 nearest:")
+    for step, seconds in benchmark_kd_tree().items():
+        print(f"  {step:<32} {seconds:.3f}s")
+
+
+if __name__ == "__main__":
+    kd_tree_demo()
+    print()
+    kd_tree_benchmark_demo()
@@ -0,0 +1,252 @@
+"""
+PACKED-INTEGER GRID KEYS
+========================
+
+The tuples guide stores a grid as a dictionary with (x, y) tuple keys:
+
+    grid[(0, 0)] = "origin"
+
+Each key is a separate tuple object (56 bytes) holding two int objects, so every cell
+pays 100+ bytes for its key before the value is counted.
+
+Grid2D and Grid3D keep the same tuple-key interface but pack the coordinates into one
+int internally:
+
+    key = (x + bias) << bits | (y + bias)
+
+A packed key below 2**60 is a single 32-byte int object, and hashing an int is cheaper
+than hashing a tuple. Coordinates may be negative; each axis accepts values in
+[-2**(bits - 1), 2**(bits - 1)).
+
+Run this file directly to see a demonstration and a memory and lookup-speed comparison.
+"""
+
+import random
+import time
+import tracemalloc
+from collections.abc import ItemsView, MutableMapping
+from itertools import product
+
+
+class _GridItemsView(ItemsView):
+    """items() view that unpacks keys while iterating the packed dict directly."""
+
+    __slots__ = ()
+
+    def __iter__(self):
+        unpack = self._mapping._unpack
+        return ((unpack(packed), value) for packed, value in self._mapping._cells.items())
+
+
+class Grid2D(MutableMapping):
+    """A mapping from (x, y) to values, stored with packed integer keys."""
+
+    dimensions = 2
+
+    def __init__(self, cells=None, bits=24):
+        self._cells = {}
+        self._bits = bits
+        self._bias = 1 << (bits - 1)
+        self._mask = (1 << bits) - 1
+        if cells:
+            self.update(cells)
+
+    # -- packing -------------------------------------------------------------
+
+    def _pack(self, key):
+        x, y = key
+        bias = self._bias
+        if not (-bias <= x < bias and -bias <= y < bias):
+            raise KeyError(f"Coordinates {key!r} are outside the {self._bits}-bit grid range")
+        return (x + bias) << self._bits | (y + bias)
+
+    def _unpack(self, packed):
+        bias, mask = self._bias, self._mask
+        return ((packed >> self._bits) - bias, (packed & mask) - bias)
+
+    # -- mapping protocol ----------------------------------------------------
+
+    def __getitem__(self, key):
+        try:
+            return self._cells[self._pack(key)]
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        self._cells[self._pack(key)] = value
+
+    def __delitem__(self, key):
+        try:
+            del self._cells[self._pack(key)]
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key):
+        try:
+            return self._pack(key) in self._cells
+        except (KeyError, TypeError, ValueError):
+            return False
+
+    def get(self, key, default=None):
+        try:
+            return self._cells.get(self._pack(key), default)
+        except KeyError:
+            return default
+
+    def __iter__(self):
+        return map(self._unpack, self._cells)
+
+    def __len__(self):
+        return len(self._cells)
+
+    def items(self):
+        return _GridItemsView(self)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+    # -- spatial queries -----------------------------------------------------
+
+    def _offsets(self, diagonal):
+        steps = product((-1, 0, 1), repeat=self.dimensions)
+        if diagonal:
+            return [s for s in steps if any(s)]
+        return [s for s in steps if sum(map(abs, s)) == 1]
+
+    def neighbors(self, key, diagonal=False):
+        """Yield (coordinates, value) for occupied cells adjacent to `key`.
+
+        Without `diagonal` only the cells sharing a face are considered (4 in 2D, 6 in 3D);
+        with it, every cell touching `key` (8 in 2D, 26 in 3D).
+        """
+        cells = self._cells
+        for offset in self._offsets(diagonal):
+            coordinates = tuple(c + d for c, d in zip(key, offset))
+            try:
+                packed = self._pack(coordinates)
+            except KeyError:
+                continue
+            if packed in cells:
+                yield coordinates, cells[packed]
+
+    def region(self, low, high):
+        """Yield (coordinates, value) for occupied cells with low <= coordinates <= high.
+
+        Probes every cell in the box when the box is smaller than the grid, otherwise scans
+        the occupied cells once. Parts of the box outside the grid range are skipped.
+        """
+        bias = self._bias
+        spans = [range(max(lo, -bias), min(hi, bias - 1) + 1) for lo, hi in zip(low, high)]
+        area = 1
+        for span in spans:
+            area *= len(span)
+        cells = self._cells
+        if area <= len(cells):
+            for coordinates in product(*spans):
+                packed = self._pack(coordinates)
+                if packed in cells:
+                    yield coordinates, cells[packed]
+        else:
+            for coordinates, value in self.items():
+                if all(lo <= c <= hi for c, lo, hi in zip(coordinates, low, high)):
+                    yield coordinates, value
+
+
+class Grid3D(Grid2D):
+    """A mapping from (x, y, z) to values, stored with packed integer keys."""
+
+    dimensions = 3
+
+    def __init__(self, cells=None, bits=20):
+        super().__init__(cells, bits)
+
+    def _pack(self, key):
+        x, y, z = key
+        bias, bits = self._bias, self._bits
+        if not (-bias <= x < bias and -bias <= y < bias and -bias <= z < bias):
+            raise KeyError(f"Coordinates {key!r} are outside the {bits}-bit grid range")
+        return ((x + bias) << bits | (y + bias)) << bits | (z + bias)
+
+    def _unpack(self, packed):
+        bias, bits, mask = self._bias, self._bits, self._mask
+        return ((packed >> 2 * bits) - bias, ((packed >> bits) & mask) - bias, (packed & mask) - bias)
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+def benchmark_grid(side=300, lookups=200_000, seed=42):
+    """Compare a tuple-keyed dict with Grid2D for memory and lookup speed.
+
+    Returns a dictionary of (bytes, lookup_seconds) keyed by representation.
+    """
+    rng = random.Random(seed)
+    probes = [(rng.randrange(side) + 1000, rng.randrange(side) + 1000) for _ in range(lookups)]
+
+    def measure(build):
+        tracemalloc.start()
+        try:
+            built = build()
+            size, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return built, size
+
+    results = {}
+    # Coordinates are computed inside each build, as a loader would, so the int objects
+    # held by tuple keys are counted too
+    plain, size = measure(lambda: {(x + 1000, y + 1000): True
+                                   for x in range(side) for y in range(side)})
+    start = time.perf_counter()
+    for probe in probes:
+        plain[probe]
+    results["dict with tuple keys"] = (size, time.perf_counter() - start)
+
+    grid, size = measure(lambda: _build_grid(side))
+    start = time.perf_counter()
+    for probe in probes:
+        grid[probe]
+    results["Grid2D"] = (size, time.perf_counter() - start)
+    return results
+
+
+def _build_grid(side):
+    grid = Grid2D()
+    for x in range(side):
+        for y in range(side):
+            grid[(x + 1000, y + 1000)] = True
+    return grid
+
+
+def packed_grid_demo():
+    """Show Grid2D and Grid3D on the guide's grid example."""
+    grid = Grid2D()
+    grid[(0, 0)] = "origin"
+    grid[(1, 0)] = "right"
+    grid[(0, 1)] = "up"
+    grid[(1, 1)] = "diagonal"
+    grid[(-1, 0)] = "left"
+
+    print("Grid2D with tuple-key interface:")
+    for position, description in grid.items():
+        print(f"  {position}: {description}")
+    print(f"Neighbours of (0, 0): {dict(grid.neighbors((0, 0)))}")
+    print(f"Neighbours incl. diagonal: {dict(grid.neighbors((0, 0), diagonal=True))}")
+    print(f"Region (0, 0)-(1, 1): {dict(grid.region((0, 0), (1, 1)))}")
+
+    space = Grid3D({(0, 0, 0): "origin", (0, 0, 1): "above"})
+    print(f"Grid3D neighbours of (0, 0, 0): {dict(space.neighbors((0, 0, 0)))}")
+
+
+def packed_grid_benchmark_demo():
+    """Compare Grid2D with a tuple-keyed dict for memory and lookup speed."""
+    print("90,000 cells, 200,000 lookups:")
+    for name, (size, seconds) in benchmark_grid().items():
+        print(f"  {name:<21} {size / 1e6:5.2f} MB  {seconds:.4f}s")
+
+
+if __name__ == "__main__":
+    packed_grid_demo()
+    print()
+    packed_grid_benchmark_demo()
@@ -0,0 +1,250 @@
+"""
+STRUCT-OF-ARRAYS POINT CLOUD
+============================
+
+The tuples guide models a 3D point as a small class wrapping an (x, y, z) tuple. That is
+clear for one point, but each point then costs a class instance, a tuple and three float
+objects - well over 200 bytes - and distance_from_origin runs as Python code per object.
+
+PointCloud stores the same data as three `array('d')` columns (struct-of-arrays), so each
+point costs 24 bytes and bulk operations run over whole columns with C-level iteration
+(map, zip, compress, min, max) instead of method calls per point.
+
+    cloud = PointCloud.from_points([(3, 4, 5), (1, 2, 2)])
+    cloud.distances()            # array('d', [7.07..., 3.0])
+    cloud.bounding_box()         # ((1.0, 2.0, 2.0), (3.0, 4.0, 5.0))
+    for point in cloud:          # Point-like records, no copying
+        print(point.x, point.distance_from_origin())
+
+Run this file directly to see a demonstration and a memory and speed comparison.
+"""
+
+import math
+import random
+import time
+import tracemalloc
+from array import array
+from collections.abc import Sequence
+from functools import partial
+from itertools import compress, repeat
+
+
+class PointRecord:
+    """A zero-copy, Point3D-like view of one point inside a PointCloud."""
+
+    __slots__ = ("_cloud", "_index")
+
+    def __init__(self, cloud, index):
+        self._cloud = cloud
+        self._index = index
+
+    @property
+    def x(self):
+        return self._cloud.x[self._index]
+
+    @property
+    def y(self):
+        return self._cloud.y[self._index]
+
+    @property
+    def z(self):
+        return self._cloud.z[self._index]
+
+    @property
+    def coordinates(self):
+        i = self._index
+        return (self._cloud.x[i], self._cloud.y[i], self._cloud.z[i])
+
+    def distance_from_origin(self):
+        return math.hypot(*self.coordinates)
+
+    def __iter__(self):
+        return iter(self.coordinates)
+
+    def __eq__(self, other):
+        if not isinstance(other, (PointRecord, Sequence)) or len(other) != 3:
+            return NotImplemented
+        return self.coordinates == tuple(other)
+
+    def __len__(self):
+        return 3
+
+    def __repr__(self):
+        return f"Point3D{self.coordinates}"
+
+
+class PointCloud:
+    """Points stored as parallel x, y and z columns of doubles."""
+
+    def __init__(self, x=None, y=None, z=None):
+        self.x = x if x is not None else array("d")
+        self.y = y if y is not None else array("d")
+        self.z = z if z is not None else array("d")
+        if not len(self.x) == len(self.y) == len(self.z):
+            raise ValueError("x, y and z columns must have the same length")
+
+    @classmethod
+    def from_points(cls, points):
+        """Build a cloud from an iterable of (x, y, z) tuples."""
+        cloud = cls()
+        append_x, append_y, append_z = cloud.x.append, cloud.y.append, cloud.z.append
+        for x, y, z in points:
+            append_x(x)
+            append_y(y)
+            append_z(z)
+        return cloud
+
+    @classmethod
+    def from_columns(cls, xs, ys, zs):
+        """Build a cloud from three iterables of coordinates."""
+        return cls(array("d", xs), array("d", ys), array("d", zs))
+
+    def append(self, x, y, z):
+        self.x.append(x)
+        self.y.append(y)
+        self.z.append(z)
+
+    def __len__(self):
+        return len(self.x)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return PointCloud(self.x[index], self.y[index], self.z[index])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("PointCloud index out of range")
+        return PointRecord(self, index)
+
+    def __iter__(self):
+        return map(partial(PointRecord, self), range(len(self)))
+
+    def tuples(self):
+        """Yield each point as a plain (x, y, z) tuple."""
+        return zip(self.x, self.y, self.z)
+
+    def nbytes(self):
+        """Bytes used by the coordinate buffers."""
+        return 3 * len(self) * self.x.itemsize
+
+    # -- bulk operations -----------------------------------------------------
+
+    def distances(self, origin=(0.0, 0.0, 0.0)):
+        """Return the distance of every point from `origin` as an array('d')."""
+        ox, oy, oz = origin
+        if ox == oy == oz == 0:
+            return array("d", map(math.hypot, self.x, self.y, self.z))
+        return array("d", map(math.dist, self.tuples(), repeat((ox, oy, oz))))
+
+    def bounding_box(self):
+        """Return ((min_x, min_y, min_z), (max_x, max_y, max_z))."""
+        if not len(self):
+            raise ValueError("bounding_box() of an empty PointCloud")
+        return ((min(self.x), min(self.y), min(self.z)),
+                (max(self.x), max(self.y), max(self.z)))
+
+    def translate(self, dx=0.0, dy=0.0, dz=0.0):
+        """Shift every point in place by (dx, dy, dz).
+
+        Each column is overwritten through slice assignment, so the existing arrays (and
+        any references to them) see the new values.
+        """
+        for column, delta in ((self.x, dx), (self.y, dy), (self.z, dz)):
+            if delta:
+                column[:] = array("d", map(float(delta).__add__, column))
+        return self
+
+    def filter(self, mask):
+        """Return a new cloud keeping points where `mask` (an iterable of bools) is true."""
+        mask = list(mask)
+        return PointCloud(array("d", compress(self.x, mask)),
+                          array("d", compress(self.y, mask)),
+                          array("d", compress(self.z, mask)))
+
+    def within(self, radius, origin=(0.0, 0.0, 0.0)):
+        """Return a new cloud with the points no farther than `radius` from `origin`."""
+        return self.filter(d <= radius for d in self.distances(origin))
+
+    def __repr__(self):
+        return f"PointCloud({len(self)} points)"
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+class Point3D:
+    """The tuples guide's Point3D class, kept here as the benchmark baseline."""
+
+    def __init__(self, x, y, z):
+        self.coordinates = (x, y, z)
+
+    def distance_from_origin(self):
+        x, y, z = self.coordinates
+        return (x**2 + y**2 + z**2)**0.5
+
+
+def benchmark_point_cloud(num_points=200_000, seed=42):
+    """Compare memory and distance computation for Point3D objects, tuples and PointCloud.
+
+    Returns a dictionary of (bytes, distance_seconds) keyed by representation.
+    """
+    def points():
+        # Regenerated for each representation so none of them shares float objects
+        # with another one and each is charged for all of its own memory.
+        rng = random.Random(seed)
+        for _ in range(num_points):
+            yield (rng.uniform(-100, 100), rng.uniform(-100, 100), rng.uniform(-100, 100))
+
+    def measure(build):
+        tracemalloc.start()
+        try:
+            built = build()
+            size, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return built, size
+
+    results = {}
+    objects, size = measure(lambda: [Point3D(x, y, z) for x, y, z in points()])
+    start = time.perf_counter()
+    [p.distance_from_origin() for p in objects]
+    results["list of Point3D"] = (size, time.perf_counter() - start)
+    del objects
+
+    tuples, size = measure(lambda: list(points()))
+    start = time.perf_counter()
+    [(x**2 + y**2 + z**2)**0.5 for x, y, z in tuples]
+    results["list of tuples"] = (size, time.perf_counter() - start)
+    del tuples
+
+    cloud, size = measure(lambda: PointCloud.from_points(points()))
+    start = time.perf_counter()
+    cloud.distances()
+    results["PointCloud"] = (size, time.perf_counter() - start)
+    return results
+
+
+def point_cloud_demo():
+    """Show PointCloud operations on a few points."""
+    cloud = PointCloud.from_points([(3, 4, 5), (1, 2, 2), (-6, 0, 8)])
+    print(f"Cloud: {cloud}, points: {list(cloud)}")
+    print(f"Distances from origin: {[round(d, 2) for d in cloud.distances()]}")
+    print(f"Bounding box: {cloud.bounding_box()}")
+    print(f"Within radius 8: {list(cloud.within(8))}")
+    cloud.translate(dx=1)
+    print(f"After translate(dx=1): {list(cloud.tuples())}")
+    print(f"cloud[0].distance_from_origin(): {cloud[0].distance_from_origin():.2f}")
+
+
+def point_cloud_benchmark_demo():
+    """Compare PointCloud against Point3D objects for memory and speed."""
+    print("200,000 points - memory and distance-from-origin time:")
+    for name, (size, seconds) in benchmark_point_cloud().items():
+        print(f"  {name:<16} {size / 1e6:6.1f} MB  {seconds:.4f}s")
+
+
+if __name__ == "__main__":
+    point_cloud_demo()
+    print()
+    point_cloud_benchmark_demo()
@@ -11,24 +11,21 @@ This guide is responsive and includes hands-on examples that you can run to see
 import sys
 import os
 
+# Buffered rendering, output modes and the section cache are shared by every
+# CommandLine guide (guide_sections.py at the repository root)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir))
+from guide_sections import (render_section, reset_section_timings, report_section_timings,
+                            failed_sections, parse_guide_args, non_cacheable)
+
 def print_section_header(title, char="=", width=80):
     """Print a formatted section header."""
-    print("\n" + char * width)
-    print(f" {title} ".center(width, char))
-    print(char * width)
+    line = char * width
+    print(f"\n{line}\n{f' {title} '.center(width, char)}\n{line}")
 
 def print_subsection_header(title, char="-", width=60):
     """Print a formatted subsection header."""
-    print("\n" + char * width)
-    print(f" {title} ")
-    print(char * width)
-
-def run_example(example_func):
-    """Run an example function and handle any errors."""
-    try:
-        example_func()
-    except Exception as e:
-        print(f"Error running example: {e}")
+    line = char * width
+    print(f"\n{line}\n {title} \n{line}")
 
 def pause_for_user():
     """Pause execution for user to review output."""
@@ -61,7 +58,7 @@ TABLE OF CONTENTS:
     
     print(toc)
     print("\n" + "=" * 80)
-    print("Choose a section number (1-12) or 'all' to run everything:")
+    print("Choose a section number (1-12), 'all' to run everything or 'b' for the benchmarks:")
 
 # =============================================================================
 # 1. TUPLE BASICS - CREATION, ACCESS, AND PROPERTIES
@@ -356,6 +353,11 @@ def named_tuples():
     print(f"p1[0]: {p1[0]}")  # Access by index
     print(f"len(person1): {len(person1)}")
 
+    # Choosing a record layout for millions of records (see record_factory.py)
+    print("\n>>> Compact Record Types Compared:")
+    from record_factory import record_factory_demo
+    record_factory_demo()
+
 # =============================================================================
 # 7. TUPLE COMPREHENSIONS (Generator Expressions)
 # =============================================================================
@@ -510,7 +512,17 @@ def advanced_techniques():
     # Sort by distance from origin
     sorted_by_distance = sorted(points, key=lambda p: (p[0]**2 + p[1]**2)**0.5)
     print(f"Sorted by distance: {sorted_by_distance}")
-    
+
+    # Only need the first few? Select instead of sorting (see selection.py)
+    print("\n>>> Top-k Without a Full Sort:")
+    from selection import selection_demo
+    selection_demo()
+
+    # Repeated nearest-point queries: index once instead of sorting (see kd_tree.py)
+    print("\n>>> Spatial Index for Nearest-Neighbour Queries:")
+    from kd_tree import kd_tree_demo
+    kd_tree_demo()
+
     print("\n>>> Using Tuples as Dictionary Keys:")
     grid = {}
     grid[(0, 0)] = "origin"
@@ -521,7 +533,12 @@ def advanced_techniques():
     print("Grid dictionary with tuple keys:")
     for position, description in grid.items():
         print(f"  {position}: {description}")
-    
+
+    # Large grids: pack (x, y) into one int per key (see packed_grid.py)
+    print("\n>>> Packed-Integer Grid Keys:")
+    from packed_grid import packed_grid_demo
+    packed_grid_demo()
+
     print("\n>>> Tuple Return Values:")
     def get_name_age():
         return "Alice", 30
@@ -572,7 +589,12 @@ def real_world_applications():
     point = Point3D(3, 4, 5)
     print(f"3D Point: {point}")
     print(f"Distance from origin: {point.distance_from_origin():.2f}")
-    
+
+    # Millions of points: store columns instead of objects (see point_cloud.py)
+    print("\n>>> Point Clouds (Struct-of-Arrays):")
+    from point_cloud import point_cloud_demo
+    point_cloud_demo()
+
     print("\n>>> RGB Color Representation:")
     colors = {
         "red": (255, 0, 0),
@@ -586,6 +608,11 @@ def real_world_applications():
     for color_name, rgb in colors.items():
         r, g, b = rgb
         print(f"  {color_name}: RGB({r}, {g}, {b})")
+
+    # Mapping whole images onto a palette (see palette.py)
+    print("\n>>> Nearest-Colour Lookup:")
+    from palette import palette_demo
+    palette_demo()
     
     print("\n>>> Function Return Multiple Values:")
     def analyze_numbers(numbers):
@@ -600,6 +627,11 @@ def real_world_applications():
     print(f"Numbers: {data}")
     print(f"Analysis: min={minimum}, max={maximum}, sum={total}, count={count}, avg={average:.2f}")
 
+    # One pass over any iterable, mergeable across processes (see summary_stats.py)
+    print("\n>>> Single-Pass Summary Statistics:")
+    from summary_stats import summary_stats_demo
+    summary_stats_demo()
+
 # =============================================================================
 # 12. COMMON PITFALLS AND BEST PRACTICES
 # =============================================================================
@@ -652,35 +684,104 @@ def common_pitfalls():
     for i, practice in enumerate(practices, 1):
         print(f"{i}. {practice}")
 
+# =============================================================================
+# BENCHMARKS
+# =============================================================================
+#
+# Memory and speed comparisons for the data structures introduced in sections
+# 6, 10 and 11. They are kept out of those sections (which stay cacheable) and
+# out of 'all', and run only with 'b' or --run B.
+
+@non_cacheable
+def named_tuple_benchmarks():
+    """Compare the record kinds from section 6 for memory and attribute access."""
+    print_section_header("BENCHMARKS: NAMED TUPLES")
+    from record_factory import record_factory_benchmark_demo
+
+    print(">>> Compact Record Types Compared:")
+    record_factory_benchmark_demo()
+
+@non_cacheable
+def advanced_technique_benchmarks():
+    """Time the selection, spatial index and packed grid from section 10."""
+    print_section_header("BENCHMARKS: ADVANCED TECHNIQUES")
+    from selection import selection_benchmark_demo
+    from kd_tree import kd_tree_benchmark_demo
+    from packed_grid import packed_grid_benchmark_demo
+
+    print(">>> Top-k Without a Full Sort:")
+    selection_benchmark_demo()
+    print("\n>>> Spatial Index for Nearest-Neighbour Queries:")
+    kd_tree_benchmark_demo()
+    print("\n>>> Packed-Integer Grid Keys:")
+    packed_grid_benchmark_demo()
+
+@non_cacheable
+def real_world_benchmarks():
+    """Time the point cloud, palette and summary statistics from section 11."""
+    print_section_header("BENCHMARKS: REAL-WORLD APPLICATIONS")
+    from point_cloud import point_cloud_benchmark_demo
+    from palette import palette_benchmark_demo
+    from summary_stats import summary_stats_benchmark_demo
+
+    print(">>> Point Clouds (Struct-of-Arrays):")
+    point_cloud_benchmark_demo()
+    print("\n>>> Nearest-Colour Lookup:")
+    palette_benchmark_demo()
+    print("\n>>> Single-Pass Summary Statistics:")
+    summary_stats_benchmark_demo()
+
 # =============================================================================
 # MAIN PROGRAM
 # =============================================================================
 
-def main():
+SECTIONS = {
+    "1": ("Tuple Basics", (tuple_creation_examples, tuple_properties, tuple_indexing_slicing)),
+    "2": ("Tuple Operations", (tuple_operations,)),
+    "3": ("Tuple Methods", (tuple_methods,)),
+    "4": ("Tuple Unpacking", (tuple_unpacking, tuple_unpacking_advanced)),
+    "5": ("Tuple Iteration", (tuple_iteration,)),
+    "6": ("Named Tuples", (named_tuples,)),
+    "7": ("Tuple Comprehensions", (tuple_comprehensions,)),
+    "8": ("Nested Tuples", (nested_tuples,)),
+    "9": ("Tuple vs List", (tuple_vs_list,)),
+    "10": ("Advanced Techniques", (advanced_techniques,)),
+    "11": ("Real-world Applications", (real_world_applications,)),
+    "12": ("Common Pitfalls", (common_pitfalls,)),
+}
+
+BENCHMARK_SECTIONS = {
+    "b1": ("Benchmarks: Named Tuples", (named_tuple_benchmarks,)),
+    "b2": ("Benchmarks: Advanced Techniques", (advanced_technique_benchmarks,)),
+    "b3": ("Benchmarks: Real-world Applications", (real_world_benchmarks,)),
+}
+
+def run_headless(selection):
+    """Run the chosen section numbers ('all', 'b' for benchmarks) without prompts, then report timings."""
+    reset_section_timings()
+    keys = []
+    for key in selection:
+        if key.lower() == "all":
+            keys.extend(SECTIONS)
+        elif key.lower() == "b":
+            keys.extend(BENCHMARK_SECTIONS)
+        elif key in SECTIONS:
+            keys.append(key)
+        else:
+            raise SystemExit(f"Unknown section {key!r}; choose from {', '.join(SECTIONS)}, 'all' or 'b'")
+    for key in keys:
+        title, example_funcs = SECTIONS.get(key) or BENCHMARK_SECTIONS[key]
+        render_section(title, *example_funcs)
+    report_section_timings()
+
+def main(argv=None):
     """Main program to run the tuple guide."""
-    
-    # Dictionary mapping section numbers to functions
-    sections = {
-        1: tuple_creation_examples,
-        2: tuple_operations,
-        3: tuple_methods,
-        4: tuple_unpacking,
-        5: tuple_iteration,
-        6: named_tuples,
-        7: tuple_comprehensions,
-        8: nested_tuples,
-        9: tuple_vs_list,
-        10: advanced_techniques,
-        11: real_world_applications,
-        12: common_pitfalls
-    }
-    
-    # Additional demonstrations
-    additional_demos = {
-        'properties': tuple_properties,
-        'indexing': tuple_indexing_slicing,
-        'unpacking_advanced': tuple_unpacking_advanced
-    }
+    args = parse_guide_args(argv)
+    if args.run:
+        run_headless(args.run)
+        if failed_sections():
+            raise SystemExit(1)
+        return
     
     show_table_of_contents()
     
@@ -693,31 +794,31 @@ def main():
                 break
             elif choice == 'all':
                 print("Running all sections...")
-                for section_num in sorted(sections.keys()):
-                    run_example(sections[section_num])
-                    if section_num < max(sections.keys()):
+                reset_section_timings()
+                for i, (title, example_funcs) in enumerate(SECTIONS.values(), 1):
+                    render_section(title, *example_funcs)
+                    if i < len(SECTIONS):
                         pause_for_user()
+                report_section_timings()
                 break
+            elif choice in ('b', 'bench'):
+                reset_section_timings()
+                for title, example_funcs in BENCHMARK_SECTIONS.values():
+                    render_section(title, *example_funcs)
+                report_section_timings()
+                print("\nEnter a section number, 'all' for everything, or 'quit' to exit:")
+            elif choice in SECTIONS:
+                title, example_funcs = SECTIONS[choice]
+                render_section(title, *example_funcs)
+                
+                print(f"\nSection {choice} completed!")
+                print("Enter another section number, 'all' for everything, or 'quit' to exit:")
             elif choice.isdigit():
-                section_num = int(choice)
-                if section_num in sections:
-                    run_example(sections[section_num])
-                    
-                    # Run additional demos for certain sections
-                    if section_num == 1:
-                        run_example(tuple_properties)
-                        run_example(tuple_indexing_slicing)
-                    elif section_num == 4:
-                        run_example(tuple_unpacking_advanced)
-                    
-                    print(f"\nSection {section_num} completed!")
-                    print("Enter another section number, 'all' for everything, or 'quit' to exit:")
-                else:
-                    print(f"Invalid section number. Please choose 1-{max(sections.keys())}")
+                print(f"Invalid section number. Please choose 1-{len(SECTIONS)}")
             elif choice == 'toc':
                 show_table_of_contents()
             else:
-                print("Invalid choice. Enter a section number (1-12), 'all', 'toc', or 'quit'")
+                print("Invalid choice. Enter a section number (1-12), 'all', 'b', 'toc', or 'quit'")
                 
         except KeyboardInterrupt:
             print("\n\nThanks for learning about Python tuples!")
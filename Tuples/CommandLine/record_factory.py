@@ -0,0 +1,327 @@
+"""
+COMPACT RECORD FACTORY
+======================
+
+The tuples guide shows namedtuple, and the dictionaries notebooks show SimpleNamespace
+and a dict subclass for attribute access. They look alike in small examples but differ a
+lot in memory once there are millions of records.
+
+make_record(name, schema, kind) generates a record type from one schema:
+
+    "tuple"    - collections.namedtuple (immutable, tuple-sized)
+    "slots"    - a mutable class with __slots__ (no per-instance __dict__)
+    "columnar" - a RecordTable storing one column per field; numeric fields go into
+                 array('q') / array('d') so a record costs only its raw values
+    "auto"     - picks one of the above from the expected record count and mutability
+
+Every kind exposes the namedtuple API: _fields, _make, _asdict and _replace.
+
+Run this file directly to see a demonstration and the bytes-per-record and access-latency matrix.
+"""
+
+import keyword
+import random
+import timeit
+import tracemalloc
+from array import array
+from collections import namedtuple
+from types import SimpleNamespace
+
+_TYPECODES = {int: "q", float: "d"}
+
+COLUMNAR_THRESHOLD = 1_000_000
+
+
+def _parse_schema(schema):
+    """Return (field_names, field_types) from a list of names, "a b c" or {name: type}."""
+    if isinstance(schema, str):
+        schema = schema.replace(",", " ").split()
+    if isinstance(schema, dict):
+        return tuple(schema), tuple(schema.values())
+    names = tuple(schema)
+    return names, (object,) * len(names)
+
+
+def _check_names(name, fields):
+    """Reject names that are unsafe to put in generated source, as namedtuple does."""
+    for value in (name,) + fields:
+        if not isinstance(value, str):
+            raise TypeError("Type names and field names must be strings")
+        if not value.isidentifier():
+            raise ValueError(f"Type names and field names must be valid identifiers: {value!r}")
+        if keyword.iskeyword(value):
+            raise ValueError(f"Type names and field names cannot be a keyword: {value!r}")
+    seen = set()
+    for field in fields:
+        if field.startswith("_"):
+            raise ValueError(f"Field names cannot start with an underscore: {field!r}")
+        if field in seen:
+            raise ValueError(f"Encountered duplicate field name: {field!r}")
+        seen.add(field)
+
+
+def _make_slots_class(name, fields):
+    """Build a __slots__ class with a generated __init__ (like dataclasses, via exec)."""
+    _check_names(name, fields)
+    args = ", ".join(fields)
+    body = "\n".join(f"    self.{f} = {f}" for f in fields) or "    pass"
+    namespace = {}
+    exec(f"def __init__(self, {args}):\n{body}", namespace)
+
+    def __repr__(self):
+        values = ", ".join(f"{f}={getattr(self, f)!r}" for f in fields)
+        return f"{name}({values})"
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in fields)
+
+    def __iter__(self):
+        return (getattr(self, f) for f in fields)
+
+    def _asdict(self):
+        return {f: getattr(self, f) for f in fields}
+
+    def _replace(self, **changes):
+        values = self._asdict()
+        values.update(changes)
+        return type(self)(**values)
+
+    @classmethod
+    def _make(cls, iterable):
+        return cls(*iterable)
+
+    return type(name, (), {
+        "__slots__": fields,
+        "__init__": namespace["__init__"],
+        "__repr__": __repr__,
+        "__eq__": __eq__,
+        "__hash__": None,
+        "__iter__": __iter__,
+        "_fields": fields,
+        "_asdict": _asdict,
+        "_replace": _replace,
+        "_make": _make,
+    })
+
+
+class RecordView:
+    """Attribute access to one row of a RecordTable, without copying the row."""
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table, index):
+        object.__setattr__(self, "_table", table)
+        object.__setattr__(self, "_index", index)
+
+    def __getattr__(self, field):
+        try:
+            column = self._table._columns[field]
+        except KeyError:
+            raise AttributeError(f"'{self._table.name}' record has no field '{field}'") from None
+        return column[self._index]
+
+    def __setattr__(self, field, value):
+        if field not in self._table._columns:
+            raise AttributeError(f"'{self._table.name}' record has no field '{field}'")
+        self._table._columns[field][self._index] = value
+
+    @property
+    def _fields(self):
+        return self._table._fields
+
+    def __iter__(self):
+        index = self._index
+        return (column[index] for column in self._table._columns.values())
+
+    def _asdict(self):
+        return dict(zip(self._table._fields, self))
+
+    def _replace(self, **changes):
+        """Return a detached namedtuple copy of this row with some fields changed.
+
+        Like namedtuple._replace, nothing is modified: the table does not grow.
+        """
+        return self._table._row_tuple()._make(self)._replace(**changes)
+
+    def __eq__(self, other):
+        return tuple(self) == tuple(other)
+
+    def __repr__(self):
+        values = ", ".join(f"{f}={v!r}" for f, v in zip(self._table._fields, self))
+        return f"{self._table.name}({values})"
+
+
+class RecordTable:
+    """Column-per-field record storage with namedtuple-style row views."""
+
+    def __init__(self, name, fields, types=None):
+        self.name = name
+        self._fields = tuple(fields)
+        types = types or (object,) * len(self._fields)
+        self._columns = {
+            field: array(_TYPECODES[kind]) if kind in _TYPECODES else []
+            for field, kind in zip(self._fields, types)
+        }
+        self._tuple_type = None
+
+    def _row_tuple(self):
+        """The namedtuple type used for detached copies of rows (built on first use)."""
+        if self._tuple_type is None:
+            self._tuple_type = namedtuple(self.name, self._fields)
+        return self._tuple_type
+
+    def append(self, *values, **named):
+        """Append one record given positionally or by name; return its view."""
+        if named:
+            values = tuple(named[f] for f in self._fields)
+        if len(values) != len(self._fields):
+            raise TypeError(f"{self.name} expects {len(self._fields)} values, got {len(values)}")
+        for column, value in zip(self._columns.values(), values):
+            column.append(value)
+        return RecordView(self, len(self) - 1)
+
+    __call__ = append
+
+    def _make(self, iterable):
+        return self.append(*iterable)
+
+    def extend(self, rows):
+        for row in rows:
+            self.append(*row)
+
+    def column(self, field):
+        """Return the underlying column for fast bulk operations (sum, min, ...)."""
+        return self._columns[field]
+
+    def __len__(self):
+        return len(self._columns[self._fields[0]]) if self._fields else 0
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("RecordTable index out of range")
+        return RecordView(self, index)
+
+    def __iter__(self):
+        return (RecordView(self, i) for i in range(len(self)))
+
+    def __repr__(self):
+        return f"RecordTable({self.name!r}, {len(self)} records)"
+
+
+def make_record(name, schema, kind="auto", expected_count=None, mutable=False):
+    """Create a record type from a schema.
+
+    Parameters:
+        name: the record type name.
+        schema: field names as a list or "a b c" string, or a {name: type} dict. Types
+            only matter for the columnar kind, where int and float become typed arrays.
+        kind: "tuple", "slots", "columnar" or "auto".
+        expected_count: with kind="auto", counts at or above COLUMNAR_THRESHOLD choose
+            the columnar layout.
+        mutable: with kind="auto", choose "slots" over "tuple" for small counts.
+
+    Returns a class for "tuple" and "slots", and a RecordTable for "columnar". All three
+    are called the same way to create records: Record(field1, field2, ...).
+    """
+    fields, types = _parse_schema(schema)
+    if kind == "auto":
+        if expected_count is not None and expected_count >= COLUMNAR_THRESHOLD:
+            kind = "columnar"
+        else:
+            kind = "slots" if mutable else "tuple"
+    if kind == "tuple":
+        return namedtuple(name, fields)
+    if kind == "slots":
+        return _make_slots_class(name, fields)
+    if kind == "columnar":
+        return RecordTable(name, fields, types)
+    raise ValueError(f"Unknown record kind: {kind!r}")
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+class AttrDict(dict):
+    """The dictionaries notebook's dict subclass with dot access, as a baseline."""
+
+    def __getattr__(self, key):
+        try:
+            return self[key]
+        except KeyError:
+            raise AttributeError(key) from None
+
+
+def benchmark_records(num_records=100_000, seed=42):
+    """Measure bytes per record and attribute-access latency for each record option.
+
+    Returns a dictionary of (bytes_per_record, nanoseconds_per_access) keyed by option.
+    """
+    rng = random.Random(seed)
+    rows = [(f"user{i}", rng.randint(18, 90), rng.uniform(0, 1000)) for i in range(num_records)]
+    schema = {"name": str, "age": int, "score": float}
+
+    # Field values are created once in `rows` and shared by every option, so the
+    # figures measure each layout's own per-record overhead
+    builders = {
+        "dict": lambda: [{"name": n, "age": a, "score": s} for n, a, s in rows],
+        "AttrDict": lambda: [AttrDict(name=n, age=a, score=s) for n, a, s in rows],
+        "SimpleNamespace": lambda: [SimpleNamespace(name=n, age=a, score=s) for n, a, s in rows],
+        "namedtuple": lambda: [Tuple(n, a, s) for n, a, s in rows],
+        "slots class": lambda: [Slots(n, a, s) for n, a, s in rows],
+        "columnar": lambda: _fill(make_record("Person", schema, "columnar"), rows),
+    }
+    Tuple = make_record("Person", schema, "tuple")
+    Slots = make_record("Person", schema, "slots")
+
+    results = {}
+    for option, build in builders.items():
+        tracemalloc.start()
+        try:
+            records = build()
+            size, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        record = records[num_records // 2]
+        if option == "dict":
+            access = lambda: record["age"]
+        else:
+            access = lambda: record.age
+        loops = 200_000
+        seconds = min(timeit.repeat(access, number=loops, repeat=3))
+        results[option] = (size / num_records, seconds / loops * 1e9)
+        del records, record
+    return results
+
+
+def _fill(table, rows):
+    table.extend(rows)
+    return table
+
+
+def record_factory_demo():
+    """Show the generated record kinds."""
+    schema = {"name": str, "age": int, "city": str}
+    for kind in ("tuple", "slots", "columnar"):
+        Person = make_record("Person", schema, kind)
+        person = Person("Alice", 30, "New York")
+        print(f"{kind:<9} {person!r}")
+        print(f"          _fields={person._fields} _asdict()={person._asdict()}")
+        print(f"          _replace(age=31) -> {person._replace(age=31)!r}")
+
+
+def record_factory_benchmark_demo():
+    """Print the bytes-per-record and attribute-access matrix for each record kind."""
+    print("100,000 records (name, age, score) - bytes per record / attribute access:")
+    for option, (size, nanoseconds) in benchmark_records().items():
+        print(f"  {option:<16} {size:7.1f} bytes  {nanoseconds:6.1f} ns")
+
+
+if __name__ == "__main__":
+    record_factory_demo()
+    print()
+    record_factory_benchmark_demo()
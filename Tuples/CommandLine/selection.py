@@ -0,0 +1,169 @@
+"""
+TOP-K AND PARTIAL ORDERING
+==========================
+
+The guides sort whole lists even when only the first few results are used:
+
+    sorted_by_distance = sorted(points, key=lambda p: (p[0]**2 + p[1]**2)**0.5)
+    closest_three = sorted_by_distance[:3]
+
+That is O(n log n) work for an O(n) question, and the key calls a square root n times.
+This module answers the smaller question directly:
+
+    top_k(items, k, key)        - the k smallest (or largest) items, O(n log k) via a heap
+    kth_smallest(items, k, key) - the k-th smallest item, average O(n) via quickselect
+    median(values)              - the median without sorting, via quickselect
+    distance_key(origin)        - squared Euclidean distance; sqrt is monotonic, so
+                                  ordering by squared distance gives the same answer
+                                  without computing a single square root
+
+Run this file directly to see a demonstration and a benchmark of top-10 against a full sort.
+"""
+
+import heapq
+import random
+import time
+from operator import itemgetter
+
+
+def distance_key(origin=(0, 0)):
+    """Return a key ordering points by distance from `origin`.
+
+    Any strictly increasing transform (sqrt, log, scaling by a positive constant) leaves
+    the order unchanged, so the key returns the squared distance and skips the sqrt.
+    """
+    if all(c == 0 for c in origin):
+        if len(origin) == 2:
+            return lambda p: p[0] * p[0] + p[1] * p[1]
+        return lambda p: sum(c * c for c in p)
+    return lambda p: sum((c - o) * (c - o) for c, o in zip(p, origin))
+
+
+def top_k(items, k, key=None, largest=False):
+    """Return the k smallest (or largest) items in order, without a full sort.
+
+    The key is computed once per item. Falls back to min/max for k == 1 and to
+    sorted() when k covers the whole input.
+    """
+    if k <= 0:
+        return []
+    if k == 1:
+        try:
+            return [(max if largest else min)(items, key=key)]
+        except ValueError:
+            return []
+    if hasattr(items, "__len__") and k >= len(items):
+        return sorted(items, key=key, reverse=largest)
+    return (heapq.nlargest if largest else heapq.nsmallest)(k, items, key=key)
+
+
+def _select(values, k):
+    """Return the k-th smallest (0-based) element of `values` by iterative quickselect.
+
+    Uses a random pivot and a three-way partition, so duplicates do not degrade it.
+    `values` is not modified.
+    """
+    rng = random.Random(k)
+    while True:
+        if len(values) <= 32:
+            return sorted(values)[k]
+        pivot = values[rng.randrange(len(values))]
+        lower = [v for v in values if v < pivot]
+        if k < len(lower):
+            values = lower
+            continue
+        upper = [v for v in values if v > pivot]
+        equal_count = len(values) - len(lower) - len(upper)
+        if k < len(lower) + equal_count:
+            return pivot
+        k -= len(lower) + equal_count
+        values = upper
+
+
+def kth_smallest(items, k, key=None):
+    """Return the k-th smallest item (0-based) in average O(n) time.
+
+    With a key, each key is computed once and paired with the item's position, so items
+    themselves never need to be comparable.
+    """
+    items = items if isinstance(items, list) else list(items)
+    if not 0 <= k < len(items):
+        raise IndexError("kth_smallest index out of range")
+    if key is None:
+        return _select(items, k)
+    decorated = [(key(item), i) for i, item in enumerate(items)]
+    _, index = _select(decorated, k)
+    return items[index]
+
+
+def median(values):
+    """Return the median of numeric values (mean of the two middle values when even)."""
+    values = values if isinstance(values, list) else list(values)
+    n = len(values)
+    if n == 0:
+        raise ValueError("median() of empty data")
+    upper = _select(values, n // 2)
+    if n % 2:
+        return upper
+    # The lower middle is the largest value below the upper middle, or a duplicate of it
+    below = [v for v in values if v < upper]
+    if len(below) == n // 2:
+        return (max(below) + upper) / 2
+    return upper
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+def benchmark_top_k(size=1_000_000, k=10, seed=42):
+    """Compare a full sort with sqrt key against top_k with a squared-distance key.
+
+    Returns a dictionary of seconds keyed by method.
+    """
+    rng = random.Random(seed)
+    points = [(rng.uniform(-1000, 1000), rng.uniform(-1000, 1000)) for _ in range(size)]
+
+    results = {}
+    start = time.perf_counter()
+    full = sorted(points, key=lambda p: (p[0]**2 + p[1]**2)**0.5)[:k]
+    results["sorted(sqrt key)[:k]"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    heap = top_k(points, k, key=distance_key())
+    results["top_k(squared key)"] = time.perf_counter() - start
+
+    distances = [p[0] * p[0] + p[1] * p[1] for p in points]
+    start = time.perf_counter()
+    median(distances)
+    results["median (quickselect)"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sorted(distances)[size // 2]
+    results["median (full sort)"] = time.perf_counter() - start
+
+    assert full == heap
+    return results
+
+
+def selection_demo():
+    """Show top-k, k-th element and median on the guide's points."""
+    points = [(3, 2), (1, 4), (5, 1), (2, 3)]
+    print(f"Points: {points}")
+    print(f"2 closest to origin: {top_k(points, 2, key=distance_key())}")
+    print(f"Farthest from origin: {top_k(points, 1, key=distance_key(), largest=True)}")
+    print(f"Point with 3rd smallest y: {kth_smallest(points, 2, key=itemgetter(1))}")
+    print(f"Median x: {median(p[0] for p in points)}")
+
+
+def selection_benchmark_demo():
+    """Time the top-10 selection methods against a full sort."""
+    print("1,000,000 points, k = 10:")
+    for method, seconds in benchmark_top_k().items():
+        print(f"  {method:<22} {seconds:.3f}s")
+
+
+if __name__ == "__main__":
+    selection_demo()
+    print()
+    selection_benchmark_demo()
@@ -0,0 +1,214 @@
+"""
+SINGLE-PASS SUMMARY STATISTICS
+==============================
+
+analyze_numbers in the tuples guide returns a tuple of statistics:
+
+    return min(numbers), max(numbers), sum(numbers), len(numbers)
+
+That walks the data four times and fails on generators, which can only be walked once.
+
+Summary computes min, max, sum, count, mean and variance in one pass over any iterable.
+The iterable is consumed in blocks; each block is reduced with a C-level sum() and one
+pass for variance, min and max, and the per-block results are merged. Because results merge exactly (Chan et al.'s parallel
+variance formula), the same partials let summarize_parallel() split a large sequence
+across a process pool and combine what the workers return.
+
+Run this file directly to see a demonstration and timings.
+"""
+
+import math
+import os
+import random
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+_BLOCK_SIZE = 65_536
+
+
+class Summary:
+    """Mergeable summary of a stream of numbers."""
+
+    __slots__ = ("count", "total", "minimum", "maximum", "mean", "_m2")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.minimum = None
+        self.maximum = None
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    @classmethod
+    def of_block(cls, block):
+        """Summarize a list of numbers: sum() in C, then one pass for variance, min and max."""
+        summary = cls()
+        if not block:
+            return summary
+        n = len(block)
+        total = sum(block)
+        mean = total / n
+        minimum = maximum = block[0]
+        m2 = 0.0
+        for x in block:
+            deviation = x - mean
+            m2 += deviation * deviation
+            if x < minimum:
+                minimum = x
+            elif x > maximum:
+                maximum = x
+        summary.count = n
+        summary.total = total
+        summary.minimum = minimum
+        summary.maximum = maximum
+        summary.mean = mean
+        summary._m2 = m2
+        return summary
+
+    @classmethod
+    def of(cls, iterable, block_size=_BLOCK_SIZE):
+        """Summarize any iterable, reading it exactly once."""
+        summary = cls()
+        iterator = iter(iterable)
+        while True:
+            block = list(islice(iterator, block_size))
+            if not block:
+                return summary
+            summary.merge(cls.of_block(block))
+
+    def merge(self, other):
+        """Fold another Summary into this one and return self."""
+        if not other.count:
+            return self
+        if not self.count:
+            for name in self.__slots__:
+                setattr(self, name, getattr(other, name))
+            return self
+        n = self.count + other.count
+        delta = other.mean - self.mean
+        self._m2 += other._m2 + delta * delta * self.count * other.count / n
+        self.mean += delta * other.count / n
+        self.count = n
+        self.total += other.total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        return self
+
+    def __add__(self, other):
+        return Summary().merge(self).merge(other)
+
+    @property
+    def variance(self):
+        """Population variance (divide by n)."""
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def sample_variance(self):
+        """Sample variance (divide by n - 1)."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stdev(self):
+        return math.sqrt(self.variance)
+
+    def as_tuple(self):
+        """Return (min, max, sum, count), the shape analyze_numbers returns."""
+        if not self.count:
+            return 0, 0, 0, 0
+        return self.minimum, self.maximum, self.total, self.count
+
+    def __repr__(self):
+        return (f"Summary(count={self.count}, min={self.minimum}, max={self.maximum}, "
+                f"sum={self.total}, mean={self.mean:.4f}, variance={self.variance:.4f})")
+
+
+def summarize(iterable):
+    """Summarize any iterable in a single pass."""
+    return Summary.of(iterable)
+
+
+def summarize_parallel(data, workers=None, chunk_size=None):
+    """Summarize a large sequence by reducing chunks in a process pool and merging.
+
+    `data` must support len() and slicing (list, array, range). Each worker receives one
+    slice and returns a small Summary, so only the chunks and the partials are pickled.
+    Slices are taken only as they are submitted, with at most two per worker pending.
+    """
+    workers = workers or os.cpu_count() or 1
+    n = len(data)
+    chunk_size = chunk_size or max(_BLOCK_SIZE, -(-n // (workers * 4)))
+    if workers <= 1 or n <= chunk_size:
+        return Summary.of(data)
+    result = Summary()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for start in range(0, n, chunk_size):
+            pending.append(pool.submit(Summary.of, data[start:start + chunk_size]))
+            if len(pending) >= 2 * workers:
+                result.merge(pending.popleft().result())
+        while pending:
+            result.merge(pending.popleft().result())
+    return result
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+def analyze_numbers(numbers):
+    """The tuples guide's four-pass version, kept here as the benchmark baseline."""
+    if not numbers:
+        return 0, 0, 0, 0
+    return min(numbers), max(numbers), sum(numbers), len(numbers)
+
+
+def benchmark_summary(size=2_000_000, seed=42):
+    """Time the four-pass baseline, single-pass Summary and the process-pool version."""
+    rng = random.Random(seed)
+    data = [rng.random() * 1000 for _ in range(size)]
+
+    results = {}
+    start = time.perf_counter()
+    baseline = analyze_numbers(data)
+    results["analyze_numbers (4 passes, no variance)"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    single = summarize(data)
+    results["summarize (1 pass, with variance)"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    parallel = summarize_parallel(data)
+    results[f"summarize_parallel ({os.cpu_count()} cores)"] = time.perf_counter() - start
+
+    assert single.as_tuple()[:2] == parallel.as_tuple()[:2] == baseline[:2]
+    assert math.isclose(single.variance, parallel.variance, rel_tol=1e-9)
+    return results
+
+
+def summary_stats_demo():
+    """Show single-pass summaries, generator input and merging partial results."""
+    data = [10, 5, 8, 3, 15, 12]
+    summary = summarize(data)
+    minimum, maximum, total, count = summary.as_tuple()
+    print(f"Numbers: {data}")
+    print(f"Analysis: min={minimum}, max={maximum}, sum={total}, count={count}, "
+          f"avg={summary.mean:.2f}, variance={summary.variance:.2f}")
+
+    print(f"From a generator: {summarize(x * x for x in range(1, 6))}")
+    merged = summarize(data[:3]) + summarize(data[3:])
+    print(f"Merged halves match: {merged.as_tuple() == summary.as_tuple()}")
+
+
+def summary_stats_benchmark_demo():
+    """Time the four-pass baseline, single-pass summarize and the process-pool version."""
+    print("2,000,000 floats:")
+    for method, seconds in benchmark_summary().items():
+        print(f"  {method:<42} {seconds:.3f}s")
+
+
+if __name__ == "__main__":
+    summary_stats_demo()
+    print()
+    summary_stats_benchmark_demo()
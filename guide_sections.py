@@ -0,0 +1,285 @@
+"""
+SHARED SECTION RUNNER FOR THE COMMAND-LINE GUIDES
+=================================================
+
+Buffered section rendering, output modes, the on-disk section cache and the common
+command-line options used by every CommandLine guide (Lists, Sets, Tuples and
+Dictionaries). Each guide adds this folder to sys.path and imports what it needs.
+"""
+
+import argparse
+import hashlib
+import importlib
+import inspect
+import io
+import json
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+
+# =============================================================================
+# BUFFERED SECTION RENDERING
+# =============================================================================
+#
+# A section's print() calls go to an in-memory buffer that is written once when
+# the section finishes, so a headless run piping to a file makes one write per
+# section instead of hundreds. Output modes:
+#
+#   plain  - the usual text (default)
+#   json   - one JSON object per section: {"section", "seconds", "cache", "status", "output"}
+#   quiet  - no section output, only the timing report
+#
+# Section timings therefore measure the examples themselves, not terminal I/O.
+# Each one also records whether every example ran ("ok") or one raised ("error"),
+# since in json and quiet modes the error message is not on screen; a headless
+# --run exits with status 1 if any section failed.
+# The mode comes from --output or the GUIDE_OUTPUT environment variable.
+#
+# With --cache (or GUIDE_CACHE_DIR set), the rendered text of each section is
+# also stored on disk, keyed by a SHA-256 of the Python version and the source
+# of the section plus every guide function and class it reaches, together with
+# the values of the constants and list/dict/set globals they read. A later run
+# with an unchanged fingerprint replays the text instead of recomputing it.
+# Sections that measure time (time(), perf_counter, timeit, tracemalloc, ...) or are
+# marked with @non_cacheable always run. The least recently used entries are
+# evicted once the cache grows past --cache-max-mb.
+
+OUTPUT_MODES = ("plain", "json", "quiet")
+output_mode = "plain"
+section_timings = []
+section_cache = {"dir": os.environ.get("GUIDE_CACHE_DIR"), "max_bytes": 5 * 1024 * 1024}
+TIMING_NAMES = {"time", "perf_counter", "perf_counter_ns", "process_time", "monotonic",
+                "timeit", "tracemalloc"}
+
+def run_example(example_func):
+    """Run an example function and handle any errors; return True on success."""
+    try:
+        example_func()
+    except Exception as e:
+        print(f"❌ Error running example: {e}")
+        return False
+    return True
+
+def set_output_mode(mode):
+    """Select how rendered sections are written: plain, json or quiet."""
+    global output_mode
+    if mode not in OUTPUT_MODES:
+        raise ValueError(f"output mode must be one of {OUTPUT_MODES}")
+    output_mode = mode
+
+def is_plain_output():
+    """True when navigation text between sections should be printed."""
+    return output_mode == "plain"
+
+def non_cacheable(func):
+    """Mark a section function so its rendered output is never cached."""
+    func.cacheable = False
+    return func
+
+def configure_section_cache(directory, max_bytes=None):
+    """Enable the on-disk section cache in `directory` (None disables it)."""
+    section_cache["dir"] = directory
+    if max_bytes is not None:
+        section_cache["max_bytes"] = max_bytes
+    if directory and os.path.isdir(directory):
+        _evict_cached_sections(directory, section_cache["max_bytes"])
+
+def section_fingerprint(example_funcs):
+    """Hash the Python version and the source of everything the section runs.
+
+    Follows global names from the example functions to other functions, classes
+    and modules defined in the same folder as the first example function (the
+    guide's folder). For a guide module imported inside a function, only the
+    names taken from it are followed, not the whole module. Constants and
+    list/dict/set globals the code reads are hashed by value. Returns None when
+    the section must not be cached: it measures time, is marked non_cacheable,
+    or has no source.
+    """
+    guide_dir = _module_dir(example_funcs[0]) if example_funcs else None
+    digest = hashlib.sha256(sys.version.encode())
+    pending, seen = list(example_funcs), set()
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if getattr(obj, "cacheable", True) is False:
+            return None
+        try:
+            digest.update(inspect.getsource(obj).encode())
+        except (OSError, TypeError):
+            return None
+        if inspect.isclass(obj):
+            members = [getattr(member, "__func__", member) for member in vars(obj).values()]
+            codes = [member.__code__ for member in members if inspect.isfunction(member)]
+        else:
+            codes = [obj.__code__]
+        namespace = getattr(inspect.getmodule(obj), "__dict__", {})
+        imported = []  # guide modules imported inside the function
+        while codes:
+            code = codes.pop()
+            codes.extend(const for const in code.co_consts if inspect.iscode(const))
+            imported.extend(importlib.import_module(name) for name in code.co_names
+                            if name not in namespace and guide_dir
+                            and os.path.exists(os.path.join(guide_dir, name + ".py")))
+            for name in code.co_names:
+                if name in TIMING_NAMES:
+                    return None
+                value = namespace.get(name)
+                if value is None:
+                    value = next((getattr(module, name) for module in imported
+                                  if hasattr(module, name)), None)
+                if inspect.ismodule(value):
+                    if _module_dir(value) == guide_dir:
+                        pending.extend(member for member in vars(value).values()
+                                       if (inspect.isfunction(member) or inspect.isclass(member))
+                                       and getattr(member, "__module__", None) == value.__name__)
+                elif inspect.isfunction(value) or inspect.isclass(value):
+                    if _module_dir(value) == guide_dir:
+                        pending.append(value)
+                elif isinstance(value, (int, float, str, bytes, tuple, list, dict, set, frozenset)):
+                    digest.update(f"{name}={_stable_repr(value)}".encode())
+    return digest.hexdigest()
+
+def _stable_repr(value):
+    """repr() of a global constant, with set members sorted so it is the same every run."""
+    if isinstance(value, (set, frozenset)):
+        return f"{type(value).__name__}({sorted(map(repr, value))})"
+    return repr(value)
+
+def _module_dir(obj):
+    """Folder of the file defining a module, function or class (None if unknown)."""
+    module = obj if inspect.ismodule(obj) else inspect.getmodule(obj)
+    module_file = getattr(module, "__file__", None)
+    return os.path.dirname(os.path.abspath(module_file)) if module_file else None
+
+def _read_cached_section(key):
+    path = os.path.join(section_cache["dir"], key + ".json")
+    try:
+        with open(path, encoding="utf-8") as handle:
+            output = json.load(handle)["output"]
+        os.utime(path)  # mark as recently used
+    except (OSError, ValueError, KeyError):
+        return None
+    return output
+
+def _write_cached_section(key, title, output):
+    directory = section_cache["dir"]
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, key + ".json"), "w", encoding="utf-8") as handle:
+            json.dump({"section": title, "python": sys.version, "output": output}, handle)
+        _evict_cached_sections(directory, section_cache["max_bytes"])
+    except OSError:
+        pass  # an unwritable cache only costs speed
+
+def _evict_cached_sections(directory, max_bytes):
+    """Delete the least recently used entries until the cache fits in max_bytes."""
+    entries = []
+    for entry in os.scandir(directory):
+        if entry.name.endswith(".json"):
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+
+def render_section(title, *example_funcs):
+    """Run the example functions into one buffer, write it once, record the time.
+
+    With the section cache enabled, output whose fingerprint is already on disk
+    is replayed instead of recomputed.
+    """
+    start = time.perf_counter()
+    cache = "off"
+    status = "ok"
+    key = output = None
+    if section_cache["dir"]:
+        key = section_fingerprint(example_funcs)
+        cache = "miss" if key else "uncacheable"
+        output = _read_cached_section(key) if key else None
+        if output is not None:
+            cache = "hit"
+    if output is None:
+        buffer = io.StringIO()
+        with redirect_stdout(buffer):
+            succeeded = [run_example(example_func) for example_func in example_funcs]
+        output = buffer.getvalue()
+        if not all(succeeded):
+            status = "error"
+        elif key:
+            _write_cached_section(key, title, output)
+    seconds = time.perf_counter() - start
+    section_timings.append((title, seconds, cache, status))
+    if output_mode == "plain":
+        sys.stdout.write(output)
+    elif output_mode == "json":
+        record = {"section": title, "seconds": round(seconds, 6), "cache": cache,
+                  "status": status, "output": output}
+        sys.stdout.write(json.dumps(record, ensure_ascii=False) + "\n")
+    sys.stdout.flush()
+    return seconds
+
+def reset_section_timings():
+    """Forget recorded timings so the next report covers only the coming run."""
+    section_timings.clear()
+
+def failed_sections():
+    """Titles of the recorded sections in which an example raised an error."""
+    return [title for title, _, _, status in section_timings if status != "ok"]
+
+def report_section_timings():
+    """Write the timings recorded by render_section (a JSON object in json mode)."""
+    if output_mode == "json":
+        timings = [{"section": title, "seconds": round(seconds, 6), "cache": cache,
+                    "status": status}
+                   for title, seconds, cache, status in section_timings]
+        print(json.dumps({"timings": timings}, ensure_ascii=False))
+        return
+    line = "=" * 80
+    print(f"\n{line}\n{' SECTION TIMINGS '.center(80, '=')}\n{line}")
+    for title, seconds, cache, status in section_timings:
+        notes = [note for note in (cache, status) if note not in ("off", "ok")]
+        note = f"  ({', '.join(notes)})" if notes else ""
+        print(f"  {title:<40} {seconds:8.4f}s{note}")
+    print(f"  {'Total':<40} {sum(entry[1] for entry in section_timings):8.4f}s")
+    failed = failed_sections()
+    if failed:
+        print(f"  {len(failed)} section(s) failed: {', '.join(failed)}")
+
+def parse_guide_args(argv=None, guide_dir=None):
+    """Read --output, --run and the section cache options from the command line.
+
+    guide_dir is where the default .section_cache folder goes (the folder of
+    the running script when omitted).
+    """
+    if guide_dir is None:
+        guide_dir = os.path.dirname(os.path.abspath(sys.argv[0] or "."))
+    parser = argparse.ArgumentParser(description="Run the guide interactively or headless.")
+    parser.add_argument("--output", choices=OUTPUT_MODES,
+                        default=os.environ.get("GUIDE_OUTPUT", output_mode),
+                        help="how section output is written (default: plain)")
+    parser.add_argument("--run", nargs="+", metavar="SECTION",
+                        help="run these sections ('all' for every one) without prompts, then exit")
+    parser.add_argument("--cache", action="store_true",
+                        help="replay unchanged sections from an on-disk cache")
+    parser.add_argument("--cache-dir", default=section_cache["dir"],
+                        help="cache folder (implies --cache; default: .section_cache next to the guide)")
+    parser.add_argument("--cache-max-mb", type=float, default=section_cache["max_bytes"] / 2**20,
+                        help="evict least recently used entries beyond this size (default: 5)")
+    args = parser.parse_args(argv)
+    if args.output not in OUTPUT_MODES:  # argparse does not check defaults
+        parser.error(f"GUIDE_OUTPUT must be one of {', '.join(OUTPUT_MODES)}, "
+                     f"not {args.output!r}")
+    set_output_mode(args.output)
+    if args.cache or args.cache_dir:
+        configure_section_cache(args.cache_dir or os.path.join(guide_dir, ".section_cache"),
+                                int(args.cache_max_mb * 2**20))
+    return args